@@ -3,7 +3,7 @@ LangChain-based LLM client with token tracking and cost estimation.
 Supports OpenAI and Tongyi Qianwen providers.
 """
 from typing import List, Dict, Optional, Any
-from langchain_openai import ChatOpenAI
+from langchain_openai import ChatOpenAI, OpenAIEmbeddings
 from langchain_core.messages import BaseMessage, HumanMessage, SystemMessage, AIMessage
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.output_parsers import StrOutputParser, JsonOutputParser
@@ -40,6 +40,7 @@ class LangChainLLMClient:
         # Configure LLM based on provider
         self.llm = self._create_llm()
         self.model = self.llm.model_name
+        self._embeddings: Optional[OpenAIEmbeddings] = None
 
         self.logger.info(f"Initialized LangChain client with provider: {self.provider}, model: {self.model}")
 
@@ -68,6 +69,59 @@ class LangChainLLMClient:
             timeout=30.0,
         )
 
+    def _create_embeddings(self) -> OpenAIEmbeddings:
+        """Create embeddings client on the same provider endpoint as the LLM."""
+        if self.provider == "openai":
+            api_key = Config.OPENAI_API_KEY or Config.LLM_API_KEY
+            base_url = Config.OPENAI_BASE_URL
+            model = Config.OPENAI_EMBEDDING_MODEL
+        else:  # tongyi (default)
+            api_key = Config.TONGYI_API_KEY or Config.LLM_API_KEY
+            base_url = Config.TONGYI_BASE_URL
+            model = Config.TONGYI_EMBEDDING_MODEL
+
+        return OpenAIEmbeddings(
+            model=model,
+            api_key=api_key,
+            base_url=base_url,
+            # DashScope's compatible mode expects raw strings, not token ids
+            check_embedding_ctx_length=self.provider == "openai",
+        )
+
+    async def embed(self, text: str, operation: str = "embedding") -> List[float]:
+        """
+        Embed text with the provider's embedding model.
+
+        Args:
+            text: Text to embed
+            operation: Operation name for logging
+
+        Returns:
+            Embedding vector
+        """
+        if self._embeddings is None:
+            self._embeddings = self._create_embeddings()
+
+        input_tokens = TokenCounter.count_tokens(text, self.model)
+        start_time = time.time()
+
+        try:
+            vector = await self._embeddings.aembed_query(text)
+
+            self.logger.log_api_call(
+                operation=operation,
+                model=self._embeddings.model,
+                input_tokens=input_tokens,
+                output_tokens=0,
+                duration=time.time() - start_time
+            )
+
+            return vector
+
+        except Exception as e:
+            self.logger.error(f"Embedding error: {e}")
+            raise
+
     async def invoke(
         self,
         prompt: str,
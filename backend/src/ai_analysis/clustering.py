@@ -59,7 +59,7 @@ class OpinionClusterer:
         if not posts:
             return []
 
-        self.client.logger.start_operation("opinion_clustering")
+        timer = self.client.logger.start_operation("opinion_clustering")
 
         # Filter and preprocess posts
         filtered_posts = self._filter_posts(posts)
@@ -77,7 +77,7 @@ class OpinionClusterer:
         else:
             results = await self._cluster_direct(filtered_posts, top_n)
 
-        self.client.logger.end_operation("opinion_clustering")
+        self.client.logger.end_operation("opinion_clustering", timer)
         return results
 
     def _filter_posts(self, posts: List[Dict]) -> List[Dict]:
@@ -157,9 +157,6 @@ class OpinionClusterer:
             batch_size=3
         )
 
-        # Split posts into batches
-        batches = processor.split_posts(posts)
-
         # Map phase: analyze each batch
         async def map_batch(batch_posts: List[Dict]) -> List[Dict]:
             return await self._cluster_direct(batch_posts, min(2, top_n))
@@ -183,7 +180,8 @@ class OpinionClusterer:
             posts,
             map_batch,
             reduce_clusters,
-            "clustering_map_reduce"
+            "clustering_map_reduce",
+            pack=True  # Clusters are merged by label, so batch order doesn't matter
         )
 
         return results[:top_n]
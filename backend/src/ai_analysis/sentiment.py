@@ -78,7 +78,7 @@ class SentimentAnalyzer:
 
         # Use single analysis chain
         try:
-            self.client.logger.start_operation("sentiment_analysis_single")
+            timer = self.client.logger.start_operation("sentiment_analysis_single")
 
             result = await self.client.run_chain(
                 self._single_chain,
@@ -89,7 +89,7 @@ class SentimentAnalyzer:
             # Validate and normalize result
             result = self._validate_result(result)
 
-            self.client.logger.end_operation("sentiment_analysis_single")
+            self.client.logger.end_operation("sentiment_analysis_single", timer)
             return result
 
         except Exception as e:
@@ -172,7 +172,7 @@ class SentimentAnalyzer:
         if not texts:
             return []
 
-        self.client.logger.start_operation("sentiment_analysis_batch")
+        timer = self.client.logger.start_operation("sentiment_analysis_batch")
 
         # Preprocess texts
         cleaned_texts = [
@@ -189,7 +189,7 @@ class SentimentAnalyzer:
         else:
             results = await self._analyze_batch_direct(cleaned_texts)
 
-        self.client.logger.end_operation("sentiment_analysis_batch")
+        self.client.logger.end_operation("sentiment_analysis_batch", timer)
         return results
 
     async def _analyze_batch_direct(self, texts: List[str]) -> List[Dict]:
@@ -251,7 +251,7 @@ class SentimentAnalyzer:
             return flattened
 
         # Execute Map-Reduce properly: first map phase, then reduce phase
-        self.logger.start_operation("sentiment_batch_map")
+        timer = self.logger.start_operation("sentiment_batch_map")
 
         # Map phase: process batches concurrently
         map_results = await processor.map_phase(
@@ -263,7 +263,7 @@ class SentimentAnalyzer:
         # Reduce phase: flatten results
         final_results = await reduce_batch(map_results)
 
-        self.logger.end_operation("sentiment_batch_map")
+        self.logger.end_operation("sentiment_batch_map", timer)
 
         return final_results
 
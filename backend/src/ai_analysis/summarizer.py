@@ -2,11 +2,12 @@
 Summarization module using LangChain with Map-Reduce support.
 Generates human-readable summaries of social media discussions.
 """
-from typing import List, Dict, Optional
+from typing import Any, List, Dict, Optional
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.output_parsers import StrOutputParser
 import json
 
+from src.config import Config
 from .client import LangChainLLMClient
 from .prompts import (
     create_summarization_prompt_template,
@@ -14,7 +15,22 @@ from .prompts import (
     create_reduce_prompt,
     get_summarization_system_prompt
 )
-from .utils import get_analysis_logger, TokenCounter, TextPreprocessor, MapReduceProcessor
+from .utils import (
+    get_analysis_logger,
+    get_semantic_cache,
+    TokenCounter,
+    TextPreprocessor,
+    MapReduceProcessor
+)
+
+_FAILED_SUMMARY = "Summary generation failed."
+
+
+def _post_content(post: Any) -> str:
+    """Read 'content' from a post dict or a post-like object."""
+    if isinstance(post, dict):
+        return post.get("content", "")
+    return getattr(post, "content", "") or ""
 
 
 class Summarizer:
@@ -56,7 +72,7 @@ class Summarizer:
 
     async def summarize_discussion(
         self,
-        posts: List[Dict[str, str]],
+        posts: List[Any],
         sentiment_score: float,
         use_map_reduce: bool = False
     ) -> str:
@@ -64,18 +80,17 @@ class Summarizer:
         Summarize a collection of social media posts.
 
         Args:
-            posts: List of dicts with 'content' field
+            posts: List of dicts (or objects) with 'content' field
             sentiment_score: Overall sentiment (0-100)
             use_map_reduce: Force use of Map-Reduce
 
         Returns:
             Summary text (2-3 paragraphs)
         """
+        # Degenerate input returns a constant without touching the LLM
         if not posts:
             return "No posts to summarize."
 
-        self.client.logger.start_operation("discussion_summarization")
-
         # Filter and preprocess posts
         filtered_posts = self._filter_posts(posts)
 
@@ -83,32 +98,58 @@ class Summarizer:
             self.logger.warning("No valid posts after filtering")
             return "No substantial discussion found."
 
+        timer = self.client.logger.start_operation("discussion_summarization")
+
         # Estimate tokens and decide strategy
         total_chars = sum(len(p.get("content", "")) for p in filtered_posts)
         estimated_tokens = TokenCounter.estimate_tokens_from_chars(total_chars)
-
-        if estimated_tokens > 3000 or use_map_reduce:
-            summary = await self._summarize_with_map_reduce(filtered_posts, sentiment_score)
+        map_reduce = estimated_tokens > 3000 or use_map_reduce
+
+        async def compute() -> str:
+            if map_reduce:
+                return await self._summarize_with_map_reduce(filtered_posts, sentiment_score)
+            return await self._summarize_direct(filtered_posts, sentiment_score)
+
+        if Config.SUMMARIZER_SEM_CACHE:
+            key_text = TokenCounter.truncate_to_tokens(
+                "\n".join(p["content"] for p in filtered_posts),
+                8000,
+                self.client.model
+            )
+            bucket = (self._describe_sentiment(sentiment_score), map_reduce)
+            summary = await get_semantic_cache().get_or_compute(
+                key_text,
+                bucket,
+                compute,
+                self.client.embed,
+                cacheable=lambda s: bool(s) and s != _FAILED_SUMMARY
+            )
         else:
-            summary = await self._summarize_direct(filtered_posts, sentiment_score)
+            summary = await compute()
 
-        self.client.logger.end_operation("discussion_summarization")
+        self.client.logger.end_operation("discussion_summarization", timer)
         return summary
 
-    def _filter_posts(self, posts: List[Dict]) -> List[Dict]:
-        """Filter and preprocess posts."""
+    def _filter_posts(self, posts: List[Any]) -> List[Dict]:
+        """Filter and preprocess posts (dicts or post-like objects)."""
         filtered = []
 
         for post in posts:
-            content = post.get("content", "")
+            content = _post_content(post)
 
             # Filter by length
             if len(content) < 50:
                 continue
 
-            # Clean content
-            post["content"] = TextPreprocessor.clean_for_analysis(content, max_length=600)
-            filtered.append(post)
+            # Clean content into a fresh dict so callers' posts stay untouched
+            cleaned = TextPreprocessor.clean_for_analysis(content, max_length=600)
+            if isinstance(post, dict):
+                filtered.append({**post, "content": cleaned})
+            else:
+                filtered.append({
+                    "content": cleaned,
+                    "platform": getattr(post, "platform", "social media"),
+                })
 
         # Sample if too many
         max_posts = 30
@@ -155,7 +196,7 @@ class Summarizer:
 
         except Exception as e:
             self.logger.error(f"Error in direct summarization: {e}")
-            return "Summary generation failed."
+            return _FAILED_SUMMARY
 
     async def _summarize_with_map_reduce(
         self,
@@ -249,7 +290,7 @@ class Summarizer:
 
     async def extract_key_points(
         self,
-        posts: List[Dict],
+        posts: List[Any],
         max_points: int = 5
     ) -> List[str]:
         """
@@ -268,7 +309,7 @@ class Summarizer:
         prompt = f"""Analyze these social media posts and extract the top {max_points} key discussion points.
 
 Posts:
-{chr(10).join(f'{i+1}. {p["content"][:200]}' for i, p in enumerate(sampled_posts))}
+{chr(10).join(f'{i+1}. {_post_content(p)[:200]}' for i, p in enumerate(sampled_posts))}
 
 Provide a JSON array of key discussion points:
 ["point 1", "point 2", ...]
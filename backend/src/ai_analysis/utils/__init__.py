@@ -4,6 +4,7 @@ Utility modules for AI analysis.
 from .logger import AnalysisLogger, get_analysis_logger
 from .token_counter import TokenCounter, TextPreprocessor
 from .map_reduce import MapReduceProcessor, KeySentenceExtractor
+from .semantic_cache import SemanticCache, get_semantic_cache
 
 __all__ = [
     "AnalysisLogger",
@@ -12,4 +13,6 @@ __all__ = [
     "TextPreprocessor",
     "MapReduceProcessor",
     "KeySentenceExtractor",
+    "SemanticCache",
+    "get_semantic_cache",
 ]
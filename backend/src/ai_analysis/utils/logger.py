@@ -4,8 +4,10 @@ Uses unified logging configuration from src.utils.logger_config.
 """
 import logging
 import time
-from typing import Optional, Dict, Any
+import numpy as np
+from typing import Optional, Dict, Any, List
 from datetime import datetime
+from .token_counter import _COST_TABLE, _DEFAULT_PRICING
 
 
 class AnalysisLogger:
@@ -22,16 +24,30 @@ class AnalysisLogger:
         from src.utils.logger_config import get_ai_logger
         self.logger = get_ai_logger()
 
-        # Token tracking
-        self.total_input_tokens = 0
-        self.total_output_tokens = 0
+        # Token tracking: input tokens, output tokens, API calls in one array
+        self._counters = np.zeros(3, dtype=np.int64)
         self.total_cost_estimate = 0.0
-        self.api_calls = 0
 
-        # Operation timing
-        self.operation_start_time: Optional[float] = None
+        # Operation timing: perf_counter_ns() starts of the running operations,
+        # a stack per name so same-name nested/concurrent runs are all kept
+        self._operation_starts: Dict[str, List[int]] = {}
         self.operation_durations: Dict[str, float] = {}
 
+    @property
+    def total_input_tokens(self) -> int:
+        """Input tokens across all logged API calls."""
+        return int(self._counters[0])
+
+    @property
+    def total_output_tokens(self) -> int:
+        """Output tokens across all logged API calls."""
+        return int(self._counters[1])
+
+    @property
+    def api_calls(self) -> int:
+        """Number of logged API calls."""
+        return int(self._counters[2])
+
     def log_api_call(
         self,
         operation: str,
@@ -52,9 +68,7 @@ class AnalysisLogger:
             duration: Request duration in seconds
             metadata: Additional metadata
         """
-        self.api_calls += 1
-        self.total_input_tokens += input_tokens
-        self.total_output_tokens += output_tokens
+        self._counters += (input_tokens, output_tokens, 1)
 
         # Estimate cost (OpenAI pricing as of 2025)
         cost_per_1k_input, cost_per_1k_output = self._get_pricing(model)
@@ -86,53 +100,49 @@ class AnalysisLogger:
         Returns:
             (input_cost_per_1k, output_cost_per_1k)
         """
-        # OpenAI pricing (as of 2025)
-        openai_pricing = {
-            "gpt-4o": (2.50, 10.00),
-            "gpt-4o-mini": (0.15, 0.60),
-            "gpt-4-turbo": (10.00, 30.00),
-            "gpt-3.5-turbo": (0.50, 1.50),
-        }
-
-        # Tongyi pricing (estimated)
-        tongyi_pricing = {
-            "qwen-plus": (0.004, 0.006),  # ~¥0.04/1K input, ¥0.06/1K output
-            "qwen-turbo": (0.001, 0.002),
-            "qwen-max": (0.02, 0.06),
-        }
-
-        if model in openai_pricing:
-            return openai_pricing[model]
-        elif model in tongyi_pricing:
-            return tongyi_pricing[model]
-        else:
-            # Default to conservative estimate
-            return (0.50, 1.50)
+        return _COST_TABLE.get(model, _DEFAULT_PRICING)
 
-    def start_operation(self, operation_name: str):
+    def start_operation(self, operation_name: str) -> int:
         """
         Start timing an operation.
 
         Args:
             operation_name: Name of the operation
+
+        Returns:
+            Token identifying this run; pass it to end_operation
         """
-        self.operation_start_time = time.time()
+        start = time.perf_counter_ns()
+        self._operation_starts.setdefault(operation_name, []).append(start)
         self.logger.info(f"Starting operation: {operation_name}")
+        return start
 
-    def end_operation(self, operation_name: str):
+    def end_operation(self, operation_name: str, token: Optional[int] = None):
         """
         End timing an operation.
 
         Args:
             operation_name: Name of the operation
+            token: Value returned by start_operation; without it the most
+                recently started run of operation_name is ended
         """
-        if self.operation_start_time:
-            duration = time.time() - self.operation_start_time
-            self.operation_durations[operation_name] = duration
-            self.logger.info(
-                f"Completed operation: {operation_name} | Duration: {duration:.2f}s"
-            )
-            self.operation_start_time = None
+        starts = self._operation_starts.get(operation_name)
+        if not starts or (token is not None and token not in starts):
+            return
+
+        if token is None:
+            start = starts.pop()
+        else:
+            starts.remove(token)
+            start = token
+        if not starts:
+            del self._operation_starts[operation_name]
+
+        duration = (time.perf_counter_ns() - start) / 1e9
+        self.operation_durations[operation_name] = duration
+        self.logger.info(
+            f"Completed operation: {operation_name} | Duration: {duration:.2f}s"
+        )
 
     def log_batch_progress(
         self,
@@ -179,10 +189,9 @@ class AnalysisLogger:
 
     def reset_token_tracking(self):
         """Reset token tracking counters."""
-        self.total_input_tokens = 0
-        self.total_output_tokens = 0
+        self._counters[:] = 0
         self.total_cost_estimate = 0.0
-        self.api_calls = 0
+        self._operation_starts = {}
         self.operation_durations = {}
 
     def warning(self, message: str):
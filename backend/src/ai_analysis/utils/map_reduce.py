@@ -1,13 +1,57 @@
 """
 Map-Reduce utilities for processing long texts with LLMs.
 """
-from typing import List, Dict, Callable, Any, TypeVar, Optional
+import functools
+import heapq
+from collections import Counter
+from typing import List, Dict, Callable, Any, TypeVar, Optional, Tuple
 from langchain_core.documents import Document
 from langchain_text_splitters import RecursiveCharacterTextSplitter
-from .token_counter import TokenCounter
+from .token_counter import TokenCounter, _split_sentences
 from .logger import get_analysis_logger
 import asyncio
 
+try:
+    import ahocorasick
+except ImportError:  # optional C automaton; plain substring scans are the fallback
+    ahocorasick = None
+
+
+@functools.lru_cache(maxsize=64)
+def _keyword_automaton(keywords: Tuple[str, ...]):
+    """
+    Build an Aho-Corasick automaton over lowercased keywords.
+
+    Each word maps to how many times it appears in keywords, so a sentence
+    scores the same as with one substring check per keyword.
+    """
+    automaton = ahocorasick.Automaton()
+    for word, weight in Counter(kw.lower() for kw in keywords).items():
+        automaton.add_word(word, (word, weight))
+    automaton.make_automaton()
+    return automaton
+
+
+def _keyword_scorer(keywords: List[str]) -> Callable[[str], int]:
+    """Return a function counting the keywords contained in a sentence."""
+    if ahocorasick is not None and keywords:
+        automaton = _keyword_automaton(tuple(sorted(keywords)))
+
+        def score(sentence: str) -> int:
+            # One pass over the sentence for all keywords
+            matched = dict(value for _, value in automaton.iter(sentence.lower()))
+            return sum(matched.values())
+
+        return score
+
+    lowered = [kw.lower() for kw in keywords]
+
+    def score(sentence: str) -> int:
+        sentence = sentence.lower()
+        return sum(1 for kw in lowered if kw in sentence)
+
+    return score
+
 
 T = TypeVar('T')
 
@@ -19,7 +63,8 @@ class MapReduceProcessor:
         self,
         max_tokens_per_chunk: int = 2000,
         overlap: int = 200,
-        batch_size: int = 5
+        batch_size: int = 5,
+        max_retries: int = 0
     ):
         """
         Initialize Map-Reduce processor.
@@ -28,10 +73,12 @@ class MapReduceProcessor:
             max_tokens_per_chunk: Maximum tokens per chunk
             overlap: Token overlap between chunks
             batch_size: Number of chunks to process in parallel
+            max_retries: Extra attempts for a chunk whose map_func raises
         """
         self.max_tokens_per_chunk = max_tokens_per_chunk
         self.overlap = overlap
         self.batch_size = batch_size
+        self.max_retries = max_retries
         self.logger = get_analysis_logger()
 
         # Text splitter for chunking
@@ -56,36 +103,96 @@ class MapReduceProcessor:
         self.logger.info(f"Split text into {len(chunks)} chunks")
         return chunks
 
-    def split_posts(self, posts: List[Dict[str, str]]) -> List[List[Dict]]:
+    def split_posts(
+        self,
+        posts: List[Dict[str, str]],
+        pack: bool = False
+    ) -> List[List[Dict]]:
         """
-        Split posts into batches.
+        Split posts into batches of at most max_tokens_per_chunk tokens.
 
         Args:
             posts: List of post dictionaries
+            pack: Bin-pack posts into as few batches as possible. Batches then
+                no longer follow post order, so only use it when the map
+                results aren't matched back to posts by position.
 
         Returns:
-            List of post batches
+            List of post batches (a post over the budget gets its own batch)
         """
-        # Estimate tokens per post
-        total_chars = sum(len(p.get("content", "")) for p in posts)
-        estimated_tokens = TokenCounter.estimate_tokens_from_chars(total_chars)
-
-        # Calculate optimal batch size
-        chunks_needed = max(1, estimated_tokens // self.max_tokens_per_chunk)
-        batch_size = max(1, len(posts) // chunks_needed)
-
-        batches = []
-        for i in range(0, len(posts), batch_size):
-            batch = posts[i:i + batch_size]
-            batches.append(batch)
+        sizes = TokenCounter.count_tokens_each([p.get("content", "") for p in posts])
+
+        if pack:
+            bins = self._pack_worst_fit(sizes)
+        else:
+            # Fill batches in order, starting a new one when the budget is hit
+            bins = []
+            used = self.max_tokens_per_chunk
+            for i, size in enumerate(sizes):
+                if used + size > self.max_tokens_per_chunk:
+                    bins.append([])
+                    used = 0
+                bins[-1].append(i)
+                used += size
+
+        batches = [[posts[i] for i in b] for b in bins]
 
         self.logger.info(
             f"Split {len(posts)} posts into {len(batches)} batches "
-            f"(~{batch_size} posts per batch)"
+            f"(~{len(posts) // max(1, len(batches))} posts per batch)"
         )
 
         return batches
 
+    def _pack_worst_fit(self, sizes: List[int]) -> List[List[int]]:
+        """
+        Bin-pack item sizes into max_tokens_per_chunk budgets (worst-fit decreasing).
+
+        Args:
+            sizes: Token count per item
+
+        Returns:
+            Item indices per bin, each bin in ascending index order
+        """
+        order = sorted(range(len(sizes)), key=lambda i: sizes[i], reverse=True)
+
+        # Heap of (-remaining capacity, bin index); the roomiest bin is on top,
+        # so if the item doesn't fit there it fits nowhere
+        bins: List[List[int]] = []
+        heap: List[Tuple[int, int]] = []
+        for i in order:
+            if heap and -heap[0][0] >= sizes[i]:
+                remaining, b = heapq.heappop(heap)
+                bins[b].append(i)
+                heapq.heappush(heap, (remaining + sizes[i], b))
+            else:
+                bins.append([i])
+                heapq.heappush(heap, (sizes[i] - self.max_tokens_per_chunk, len(bins) - 1))
+
+        return [sorted(b) for b in bins]
+
+    async def _map_one(self, index: int, chunk, map_func: Callable[[Any], Any]) -> Any:
+        """
+        Run map_func on one chunk, retrying up to max_retries times.
+
+        Args:
+            index: Chunk position (for logging)
+            chunk: Chunk to process
+            map_func: Async function to process the chunk
+
+        Returns:
+            map_func result (the last error is raised when retries run out)
+        """
+        for attempt in range(self.max_retries + 1):
+            try:
+                return await map_func(chunk)
+            except Exception as e:
+                if attempt == self.max_retries:
+                    raise
+                self.logger.warning(
+                    f"Retrying chunk {index} ({attempt + 1}/{self.max_retries}): {e}"
+                )
+
     async def map_phase(
         self,
         chunks: List[str],
@@ -103,36 +210,45 @@ class MapReduceProcessor:
         Returns:
             List of map results
         """
-        self.logger.start_operation(description)
-        results = []
-
-        # Process in batches
-        for i in range(0, len(chunks), self.batch_size):
-            batch = chunks[i:i + self.batch_size]
-            batch_num = i // self.batch_size + 1
-            total_batches = (len(chunks) + self.batch_size - 1) // self.batch_size
-
-            self.logger.log_batch_progress(
-                description, batch_num, total_batches, len(batch)
-            )
-
-            # Process batch concurrently
-            batch_results = await asyncio.gather(
-                *[map_func(chunk) for chunk in batch],
-                return_exceptions=True
-            )
-
-            # Filter out exceptions
-            for j, result in enumerate(batch_results):
-                if isinstance(result, Exception):
-                    self.logger.error(f"Error processing chunk {i + j}: {result}")
-                    results.append(None)  # Placeholder for failed chunks
-                else:
-                    results.append(result)
-
-        self.logger.end_operation(description)
-        # Filter out None values
-        return [r for r in results if r is not None]
+        timer = self.logger.start_operation(description)
+
+        # Keep batch_size chunks in flight; a slow chunk no longer holds up
+        # the next batch from starting
+        semaphore = asyncio.Semaphore(self.batch_size)
+        total_batches = (len(chunks) + self.batch_size - 1) // self.batch_size
+        completed = 0
+
+        async def run(index: int, chunk):
+            nonlocal completed
+            async with semaphore:
+                try:
+                    return await self._map_one(index, chunk, map_func)
+                finally:
+                    completed += 1
+                    if completed % self.batch_size == 0 or completed == len(chunks):
+                        batch_num = (completed + self.batch_size - 1) // self.batch_size
+                        # The last batch may be partial
+                        self.logger.log_batch_progress(
+                            description,
+                            batch_num,
+                            total_batches,
+                            completed - (batch_num - 1) * self.batch_size
+                        )
+
+        # gather keeps results in chunk order
+        results = await asyncio.gather(
+            *[run(i, chunk) for i, chunk in enumerate(chunks)],
+            return_exceptions=True
+        )
+
+        # Filter out exceptions
+        for i, result in enumerate(results):
+            if isinstance(result, Exception):
+                self.logger.error(f"Error processing chunk {i}: {result}")
+
+        self.logger.end_operation(description, timer)
+        # Drop failed chunks and None values
+        return [r for r in results if r is not None and not isinstance(r, Exception)]
 
     async def reduce_phase(
         self,
@@ -151,9 +267,9 @@ class MapReduceProcessor:
         Returns:
             Final reduced result
         """
-        self.logger.start_operation(description)
+        timer = self.logger.start_operation(description)
         result = await reduce_func(map_results)
-        self.logger.end_operation(description)
+        self.logger.end_operation(description, timer)
         return result
 
     async def process(
@@ -197,12 +313,69 @@ class MapReduceProcessor:
         self.logger.info(f"Completed {operation_name} Map-Reduce processing")
         return final_result
 
+    async def process_streaming(
+        self,
+        text: str,
+        map_func: Callable[[str], Any],
+        combine: Callable[[T, Any], T],
+        init: T,
+        operation_name: str = "Map-Reduce"
+    ) -> T:
+        """
+        Execute Map-Reduce, folding each map result in as soon as it finishes.
+
+        Unlike process(), map results are never collected into a list, so
+        peak memory stays flat for long texts. combine must not depend on
+        chunk order (e.g. operator.add for counts).
+
+        Args:
+            text: Input text
+            map_func: Async function to process each chunk
+            combine: Function folding one map result into the accumulator
+            init: Initial accumulator value
+            operation_name: Name of the operation
+
+        Returns:
+            Final accumulator value
+        """
+        self.logger.info(f"Starting {operation_name} streaming Map-Reduce processing")
+        description = f"{operation_name} - Map"
+        timer = self.logger.start_operation(description)
+
+        chunks = self.split_text(text)
+        semaphore = asyncio.Semaphore(self.batch_size)
+
+        async def run(index: int, chunk: str):
+            async with semaphore:
+                return await self._map_one(index, chunk, map_func)
+
+        tasks = [asyncio.create_task(run(i, chunk)) for i, chunk in enumerate(chunks)]
+        acc = init
+        try:
+            for future in asyncio.as_completed(tasks):
+                try:
+                    result = await future
+                except Exception as e:
+                    self.logger.error(f"Error processing chunk: {e}")
+                    continue
+                if result is not None:
+                    acc = combine(acc, result)
+        finally:
+            # Don't leave chunks running if combine raised
+            for task in tasks:
+                task.cancel()
+
+        self.logger.end_operation(description, timer)
+        self.logger.info(f"Completed {operation_name} streaming Map-Reduce processing")
+        return acc
+
     async def process_posts(
         self,
         posts: List[Dict],
         map_func: Callable[[List[Dict]], Any],
         reduce_func: Callable[[List[Any]], Any],
-        operation_name: str = "Map-Reduce"
+        operation_name: str = "Map-Reduce",
+        pack: bool = False
     ) -> Any:
         """
         Execute Map-Reduce on posts.
@@ -212,6 +385,7 @@ class MapReduceProcessor:
             map_func: Async function to process each batch
             reduce_func: Async function to combine results
             operation_name: Name of the operation
+            pack: Bin-pack posts into as few batches as possible (see split_posts)
 
         Returns:
             Final result
@@ -219,7 +393,7 @@ class MapReduceProcessor:
         self.logger.info(f"Starting {operation_name} on {len(posts)} posts")
 
         # Split posts into batches
-        batches = self.split_posts(posts)
+        batches = self.split_posts(posts, pack=pack)
 
         # Map phase
         map_results = await self.map_phase(
@@ -257,11 +431,8 @@ class KeySentenceExtractor:
         Returns:
             Text with key sentences
         """
-        import re
-
         # Split into sentences
-        sentences = re.split(r'[.!?]+', text)
-        sentences = [s.strip() for s in sentences if s.strip()]
+        sentences = _split_sentences(text)
 
         if len(sentences) <= num_sentences:
             return text
@@ -305,19 +476,14 @@ class KeySentenceExtractor:
         Returns:
             Text with key sentences
         """
-        import re
-
         # Split into sentences
-        sentences = re.split(r'[.!?]+', text)
-        sentences = [s.strip() for s in sentences if s.strip()]
+        sentences = _split_sentences(text)
 
         # Score sentences by keyword presence
+        score_sentence = _keyword_scorer(keywords)
         scored_sentences = []
         for i, sentence in enumerate(sentences):
-            score = sum(
-                1 for kw in keywords
-                if kw.lower() in sentence.lower()
-            )
+            score = score_sentence(sentence)
             if score > 0:
                 scored_sentences.append((i, sentence, score))
 
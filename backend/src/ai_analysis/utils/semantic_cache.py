@@ -0,0 +1,133 @@
+"""
+Semantic response cache for LLM calls.
+Returns a prior result when a new input embeds close enough to a cached one.
+"""
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Optional, Tuple
+import numpy as np
+
+from .logger import get_analysis_logger
+
+
+EmbedFunc = Callable[[str], Awaitable[List[float]]]
+
+
+class SemanticCache:
+    """In-memory cache keyed by embedding similarity instead of exact text."""
+
+    def __init__(self, threshold: float = 0.92, max_entries: int = 256):
+        """
+        Initialize semantic cache.
+
+        Args:
+            threshold: Minimum cosine similarity to count as a hit
+            max_entries: Maximum cached entries per bucket (oldest evicted first)
+        """
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self.logger = get_analysis_logger()
+
+        # bucket -> (unit vectors matrix, cached values)
+        self._entries: Dict[Hashable, Tuple[np.ndarray, List[Any]]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def lookup(self, vector: np.ndarray, bucket: Hashable) -> Optional[Any]:
+        """
+        Find the most similar cached value in a bucket.
+
+        Args:
+            vector: Unit-normalized query embedding
+            bucket: Partition key (only entries in the same bucket match)
+
+        Returns:
+            Cached value, or None if nothing is similar enough
+        """
+        entry = self._entries.get(bucket)
+        if entry is None:
+            return None
+
+        matrix, values = entry
+        similarities = matrix @ vector
+        best = int(np.argmax(similarities))
+        if similarities[best] >= self.threshold:
+            return values[best]
+        return None
+
+    def store(self, vector: np.ndarray, bucket: Hashable, value: Any):
+        """
+        Add a value to a bucket.
+
+        Args:
+            vector: Unit-normalized embedding
+            bucket: Partition key
+            value: Value to cache
+        """
+        matrix, values = self._entries.get(bucket, (np.empty((0, vector.shape[0])), []))
+        matrix = np.vstack([matrix, vector])[-self.max_entries:]
+        values = (values + [value])[-self.max_entries:]
+        self._entries[bucket] = (matrix, values)
+
+    async def get_or_compute(
+        self,
+        key_text: str,
+        bucket: Hashable,
+        compute_fn: Callable[[], Awaitable[Any]],
+        embed_fn: EmbedFunc,
+        cacheable: Callable[[Any], bool] = bool
+    ) -> Any:
+        """
+        Return a cached result for semantically equivalent input, or compute it.
+
+        Args:
+            key_text: Text whose embedding identifies the request
+            bucket: Partition key (e.g. sentiment bucket)
+            compute_fn: Async function producing the result on a miss
+            embed_fn: Async function returning the embedding of a text
+            cacheable: Predicate deciding whether a computed result is stored
+
+        Returns:
+            Cached or freshly computed result
+        """
+        try:
+            vector = np.asarray(await embed_fn(key_text), dtype=np.float32)
+            vector /= np.linalg.norm(vector) or 1.0
+        except Exception as e:
+            # Embedding failures must never block the real computation
+            self.logger.warning(f"Semantic cache embedding failed, bypassing cache: {e}")
+            return await compute_fn()
+
+        cached = self.lookup(vector, bucket)
+        if cached is not None:
+            self.hits += 1
+            self.logger.info(f"Semantic cache hit (bucket: {bucket})")
+            return cached
+
+        self.misses += 1
+        result = await compute_fn()
+        if cacheable(result):
+            self.store(vector, bucket, result)
+        return result
+
+    def clear(self):
+        """Drop all cached entries and reset hit counters."""
+        self._entries = {}
+        self.hits = 0
+        self.misses = 0
+
+
+# Global cache instance
+_semantic_cache = None
+
+
+def get_semantic_cache() -> SemanticCache:
+    """
+    Get or create the global semantic cache.
+
+    Returns:
+        SemanticCache instance
+    """
+    global _semantic_cache
+    if _semantic_cache is None:
+        from src.config import Config
+        _semantic_cache = SemanticCache(threshold=Config.SEM_CACHE_THRESHOLD)
+    return _semantic_cache
@@ -1,8 +1,101 @@
 """
 Token counting utilities for cost estimation and optimization.
 """
+import functools
+import os
+import re
+import threading
+from collections import OrderedDict
+from types import MappingProxyType
+import numpy as np
 import tiktoken
-from typing import List, Dict
+from typing import List, Dict, Optional, Tuple
+
+from src.config import Config
+
+# USD per 1K (input, output) tokens; read-only and shared with AnalysisLogger
+_COST_TABLE = MappingProxyType({
+    # OpenAI pricing (as of 2025)
+    "gpt-4o": (2.50, 10.00),
+    "gpt-4o-mini": (0.15, 0.60),
+    "gpt-4-turbo": (10.00, 30.00),
+    "gpt-3.5-turbo": (0.50, 1.50),
+    # Tongyi pricing (estimated)
+    "qwen-plus": (0.004, 0.006),  # ~¥0.04/1K input, ¥0.06/1K output
+    "qwen-turbo": (0.001, 0.002),
+    "qwen-max": (0.02, 0.06),
+})
+
+# Conservative estimate for models missing from the table
+_DEFAULT_PRICING = (0.50, 1.50)
+
+# Below this many texts, count_tokens_batch encodes serially
+_MIN_PARALLEL_BATCH = 4
+
+
+def _window_bounds(length: int, size: int, overlap: int) -> List[Tuple[int, int]]:
+    """
+    Compute (start, end) bounds of overlapping windows over a sequence.
+
+    Args:
+        length: Sequence length
+        size: Window size
+        overlap: Items shared by consecutive windows
+
+    Returns:
+        List of (start, end) pairs covering the sequence
+    """
+    # An overlap >= size would never advance; always move forward at least one item
+    step = max(1, size - overlap)
+    starts = np.arange(0, length, step)
+    ends = np.minimum(starts + size, length)
+    return list(zip(starts.tolist(), ends.tolist()))
+
+
+# Runs of the same sentence-ending punctuation ("!!!" -> "!")
+_REPEATED_PUNCT_RE = re.compile(r'([.!?])\1+')
+
+# Sentence boundaries used by the key-sentence extractors
+_SENTENCE_SPLIT_RE = re.compile(r'[.!?]+')
+
+
+def _split_sentences(text: str) -> List[str]:
+    """Split text into stripped, non-empty sentences."""
+    return [s for s in map(str.strip, _SENTENCE_SPLIT_RE.split(text)) if s]
+
+
+@functools.lru_cache(maxsize=8)
+def _load_encoder(model: str) -> Optional[tiktoken.Encoding]:
+    """
+    Load the tiktoken encoding for a model once per process.
+
+    Args:
+        model: Model name
+
+    Returns:
+        Encoding, or None when tiktoken doesn't know the model
+    """
+    try:
+        return tiktoken.encoding_for_model(model)
+    except KeyError:
+        return None
+
+
+def _get_encoder(model: str) -> Optional[tiktoken.Encoding]:
+    """
+    Get the tiktoken encoding for a model.
+
+    Args:
+        model: Model name
+
+    Returns:
+        Encoding, or None when the model is unknown or the table can't be loaded
+    """
+    try:
+        return _load_encoder(model)
+    except Exception:
+        # e.g. the BPE table couldn't be downloaded; not cached, so retried next call
+        return None
 
 
 class TokenCounter:
@@ -15,6 +108,17 @@ class TokenCounter:
         "mixed": 0.4,
     }
 
+    # LRU of token counts keyed on (hash, length, model) so long texts aren't kept as keys
+    _count_cache: "OrderedDict[Tuple[int, int, str], int]" = OrderedDict()
+    _count_cache_size: int = Config.PREPROCESS_CACHE_SIZE
+    _count_cache_lock = threading.Lock()
+
+    @classmethod
+    def clear_cache(cls):
+        """Drop all cached token counts."""
+        with cls._count_cache_lock:
+            cls._count_cache.clear()
+
     @staticmethod
     def count_tokens(text: str, model: str = "gpt-4") -> int:
         """
@@ -27,13 +131,42 @@ class TokenCounter:
         Returns:
             Number of tokens
         """
-        try:
-            encoding = tiktoken.encoding_for_model(model)
-            return len(encoding.encode(text))
-        except Exception:
+        if not text:
+            return 0
+
+        encoding = _get_encoder(model)
+        if encoding is None:
             # Fallback to rough estimate
             return int(len(text) * TokenCounter.TOKEN_RATIO["en"])
 
+        key = (hash(text), len(text), model)
+        count = TokenCounter._cached_count(key)
+        if count is None:
+            # disallowed_special=(): a scraped post containing "<|endoftext|>"
+            # is counted as plain text instead of raising ValueError
+            count = len(encoding.encode(text, disallowed_special=()))
+            TokenCounter._store_count(key, count)
+        return count
+
+    @classmethod
+    def _cached_count(cls, key: Tuple[int, int, str]) -> Optional[int]:
+        """Look up a cached token count, marking it recently used."""
+        with cls._count_cache_lock:
+            count = cls._count_cache.get(key)
+            if count is not None:
+                cls._count_cache.move_to_end(key)
+            return count
+
+    @classmethod
+    def _store_count(cls, key: Tuple[int, int, str], count: int):
+        """Cache a token count, evicting the least recently used entry."""
+        if cls._count_cache_size <= 0:
+            return
+        with cls._count_cache_lock:
+            cls._count_cache[key] = count
+            if len(cls._count_cache) > cls._count_cache_size:
+                cls._count_cache.popitem(last=False)
+
     @staticmethod
     def count_tokens_batch(texts: List[str], model: str = "gpt-4") -> int:
         """
@@ -46,7 +179,49 @@ class TokenCounter:
         Returns:
             Total token count
         """
-        return sum(TokenCounter.count_tokens(text, model) for text in texts)
+        return sum(TokenCounter.count_tokens_each(texts, model))
+
+    @staticmethod
+    def count_tokens_each(texts: List[str], model: str = "gpt-4") -> List[int]:
+        """
+        Count tokens of each text, encoding uncached texts in parallel.
+
+        Args:
+            texts: List of texts
+            model: Model name
+
+        Returns:
+            Token count per text, in input order
+        """
+        encoding = _get_encoder(model)
+        if encoding is None or len(texts) < _MIN_PARALLEL_BATCH:
+            # Thread pool spin-up isn't worth it for a handful of texts
+            return [TokenCounter.count_tokens(text, model) for text in texts]
+
+        counts = [0] * len(texts)
+        misses = []
+        for i, text in enumerate(texts):
+            if not text:
+                continue
+            key = (hash(text), len(text), model)
+            count = TokenCounter._cached_count(key)
+            if count is None:
+                misses.append((i, key, text))
+            else:
+                counts[i] = count
+
+        if misses:
+            # encode_batch releases the GIL and encodes on native threads
+            token_lists = encoding.encode_batch(
+                [text for _, _, text in misses],
+                num_threads=min(8, os.cpu_count() or 1),
+                disallowed_special=()
+            )
+            for (i, key, _), tokens in zip(misses, token_lists):
+                TokenCounter._store_count(key, len(tokens))
+                counts[i] = len(tokens)
+
+        return counts
 
     @staticmethod
     def estimate_tokens_from_chars(char_count: int, language: str = "en") -> int:
@@ -76,21 +251,26 @@ class TokenCounter:
         Returns:
             Truncated text
         """
-        try:
-            encoding = tiktoken.encoding_for_model(model)
-            tokens = encoding.encode(text)
-
-            if len(tokens) <= max_tokens:
-                return text
+        # Every token covers at least one UTF-8 byte, so a text with no more
+        # bytes than max_tokens already fits and needn't be encoded
+        if len(text) <= max_tokens and len(text.encode("utf-8")) <= max_tokens:
+            return text
 
-            # Truncate and decode
-            truncated_tokens = tokens[:max_tokens]
-            return encoding.decode(truncated_tokens)
-        except Exception:
+        encoding = _get_encoder(model)
+        if encoding is None:
             # Fallback to character-based truncation
             max_chars = int(max_tokens / TokenCounter.TOKEN_RATIO["en"])
             return text[:max_chars]
 
+        tokens = encoding.encode(text, disallowed_special=())
+
+        if len(tokens) <= max_tokens:
+            return text
+
+        # Truncate and decode
+        truncated_tokens = tokens[:max_tokens]
+        return encoding.decode(truncated_tokens)
+
     @staticmethod
     def split_text_by_tokens(
         text: str,
@@ -110,40 +290,24 @@ class TokenCounter:
         Returns:
             List of text chunks
         """
-        try:
-            encoding = tiktoken.encoding_for_model(model)
-            tokens = encoding.encode(text)
-
-            chunks = []
-            start = 0
-
-            while start < len(tokens):
-                end = start + max_tokens_per_chunk
-                chunk_tokens = tokens[start:end]
-
-                # Decode chunk
-                chunk_text = encoding.decode(chunk_tokens)
-                chunks.append(chunk_text)
-
-                # Move start position with overlap
-                start = end - overlap
-
-            return chunks
-        except Exception:
+        encoding = _get_encoder(model)
+        if encoding is None:
             # Fallback to character-based splitting
             chars_per_chunk = int(max_tokens_per_chunk / TokenCounter.TOKEN_RATIO["en"])
             overlap_chars = int(overlap / TokenCounter.TOKEN_RATIO["en"])
 
-            chunks = []
-            start = 0
+            return [
+                text[start:end]
+                for start, end in _window_bounds(len(text), chars_per_chunk, overlap_chars)
+            ]
 
-            while start < len(text):
-                end = start + chars_per_chunk
-                chunk = text[start:end]
-                chunks.append(chunk)
-                start = end - overlap_chars
+        tokens = np.asarray(encoding.encode(text, disallowed_special=()), dtype=np.int32)
 
-            return chunks
+        # Decode each overlapping window of token ids
+        return [
+            encoding.decode(tokens[start:end].tolist())
+            for start, end in _window_bounds(len(tokens), max_tokens_per_chunk, overlap)
+        ]
 
     @staticmethod
     def calculate_cost(
@@ -162,28 +326,7 @@ class TokenCounter:
         Returns:
             Cost in USD
         """
-        # OpenAI pricing (as of 2025)
-        pricing = {
-            "gpt-4o": (2.50, 10.00),
-            "gpt-4o-mini": (0.15, 0.60),
-            "gpt-4-turbo": (10.00, 30.00),
-            "gpt-3.5-turbo": (0.50, 1.50),
-        }
-
-        # Tongyi pricing (estimated)
-        tongyi_pricing = {
-            "qwen-plus": (0.004, 0.006),
-            "qwen-turbo": (0.001, 0.002),
-            "qwen-max": (0.02, 0.06),
-        }
-
-        if model in pricing:
-            input_cost, output_cost = pricing[model]
-        elif model in tongyi_pricing:
-            input_cost, output_cost = tongyi_pricing[model]
-        else:
-            # Default conservative estimate
-            input_cost, output_cost = (0.50, 1.50)
+        input_cost, output_cost = _COST_TABLE.get(model, _DEFAULT_PRICING)
 
         total_cost = (input_tokens / 1000) * input_cost + \
                     (output_tokens / 1000) * output_cost
@@ -205,11 +348,8 @@ class TextPreprocessor:
         Returns:
             Text with key sentences
         """
-        import re
-
         # Split into sentences
-        sentences = re.split(r'[.!?]+', text)
-        sentences = [s.strip() for s in sentences if s.strip()]
+        sentences = _split_sentences(text)
 
         if len(sentences) <= max_sentences:
             return text
@@ -238,15 +378,11 @@ class TextPreprocessor:
         Returns:
             Cleaned text
         """
-        import re
-
-        # Remove excessive whitespace
-        text = re.sub(r'\s+', ' ', text)
-
         # Remove repeated punctuation
-        text = re.sub(r'([.!?])\1+', r'\1', text)
+        text = _REPEATED_PUNCT_RE.sub(r'\1', text)
 
-        return text.strip()
+        # Collapse whitespace runs and trim the ends in one C-level pass
+        return ' '.join(text.split())
 
     @staticmethod
     def clean_for_analysis(text: str, max_length: int = 1000) -> str:
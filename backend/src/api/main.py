@@ -125,11 +125,13 @@ async def startup():
 
 @app.on_event("shutdown")
 async def shutdown():
-    """Shutdown scheduler on app shutdown."""
+    """Shutdown scheduler and close collector sessions on app shutdown."""
     global scheduler
     if scheduler:
         scheduler.shutdown()
+        await scheduler.orchestrator.aclose()
         logger.info("Scheduler shutdown")
+    await orchestrator.aclose()
 
 
 @app.get("/")
@@ -634,4 +636,5 @@ async def acknowledge_alert(alert_id: int):
 if __name__ == "__main__":
     import uvicorn
 
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    # "auto" picks uvloop when installed
+    uvicorn.run(app, host="0.0.0.0", port=8000, loop="auto")
@@ -6,11 +6,44 @@ from abc import ABC, abstractmethod
 from typing import List
 from dataclasses import dataclass
 import re
+import numpy as np
 
 
-@dataclass
+SPAM_INDICATORS = (
+    "buy now",
+    "click here",
+    "free trial",
+    "limited time",
+    "subscribe",
+    "follow me",
+    "check my profile",
+    "DM me",
+    "link in bio",
+)
+
+# One case-insensitive scan instead of lowercasing and N substring searches
+_SPAM_RE = re.compile("|".join(re.escape(s) for s in SPAM_INDICATORS), re.IGNORECASE)
+
+# Markdown links are tried first at each position, so a link's URL is
+# never consumed by the bare-URL branch and its text survives
+_URL_RE = re.compile(r"http\S+")
+_CLEAN_RE = re.compile(r"\[([^\]]+)\]\([^\)]+\)|http\S+")
+
+
+def _clean_match(match: re.Match) -> str:
+    """Keep a markdown link's text (minus any URL in it); drop bare URLs."""
+    text = match.group(1)
+    return _URL_RE.sub("", text) if text else ""
+
+
+@dataclass(slots=True, frozen=True)
 class PostData:
-    """Standardized post data structure across all platforms."""
+    """
+    Standardized post data structure across all platforms.
+
+    Immutable and slotted: one is built per scraped post, so there is no
+    per-instance __dict__. Use dataclasses.replace() to derive a copy.
+    """
 
     platform: str
     post_id: str
@@ -24,6 +57,96 @@ class PostData:
     created_at: str | None = None
 
 
+@dataclass
+class PostBatch:
+    """
+    Column-oriented (SoA) batch of posts from one platform.
+
+    Engagement metrics are contiguous int32 arrays, so aggregates like
+    batch.likes.sum() are vectorized instead of looping over objects.
+    """
+
+    platform: str
+    post_id: List[str]
+    author: List[str | None]
+    content: List[str]
+    url: List[str | None]
+    created_at: List[str | None]
+    upvotes: np.ndarray
+    likes: np.ndarray
+    shares: np.ndarray
+    comments_count: np.ndarray
+
+    @classmethod
+    def from_posts(cls, posts: List[PostData], platform: str) -> "PostBatch":
+        """
+        Build a batch from PostData objects.
+
+        Args:
+            posts: Posts to convert
+            platform: Platform name for the batch
+
+        Returns:
+            PostBatch instance
+        """
+        def metric(name: str) -> np.ndarray:
+            return np.fromiter((getattr(p, name) for p in posts), dtype=np.int32, count=len(posts))
+
+        return cls(
+            platform=platform,
+            post_id=[p.post_id for p in posts],
+            author=[p.author for p in posts],
+            content=[p.content for p in posts],
+            url=[p.url for p in posts],
+            created_at=[p.created_at for p in posts],
+            upvotes=metric("upvotes"),
+            likes=metric("likes"),
+            shares=metric("shares"),
+            comments_count=metric("comments_count"),
+        )
+
+    def __len__(self) -> int:
+        return len(self.post_id)
+
+    def metric_stats(self, name: str) -> tuple[int, float, int]:
+        """
+        Summarize one metric column.
+
+        Args:
+            name: Column name (upvotes, likes, shares, comments_count)
+
+        Returns:
+            (sum, mean, max); zeros for an empty batch
+        """
+        column = getattr(self, name)
+        if column.size == 0:
+            return 0, 0.0, 0
+        return int(column.sum(dtype=np.int64)), float(column.mean()), int(column.max())
+
+    def to_list(self) -> List[PostData]:
+        """
+        Convert back to PostData objects (compatibility with list-based callers).
+
+        Returns:
+            List of PostData objects
+        """
+        return [
+            PostData(
+                platform=self.platform,
+                post_id=self.post_id[i],
+                author=self.author[i],
+                content=self.content[i],
+                url=self.url[i],
+                upvotes=int(self.upvotes[i]),
+                likes=int(self.likes[i]),
+                shares=int(self.shares[i]),
+                comments_count=int(self.comments_count[i]),
+                created_at=self.created_at[i],
+            )
+            for i in range(len(self))
+        ]
+
+
 class BaseCollector(ABC):
     """Abstract base class for all platform collectors."""
 
@@ -63,17 +186,11 @@ class BaseCollector(ABC):
         Returns:
             Cleaned content string
         """
-        # Remove markdown links FIRST (before removing URLs)
-        # This prevents breaking the link structure
-        content = re.sub(r"\[([^\]]+)\]\([^\)]+\)", r"\1", content)
-
-        # Remove URLs
-        content = re.sub(r"http\S+", "", content)
+        # Unwrap markdown links and remove URLs in one pass
+        content = _CLEAN_RE.sub(_clean_match, content)
 
         # Remove extra whitespace and newlines
-        content = " ".join(content.split())
-
-        return content.strip()
+        return " ".join(content.split())
 
     def is_spam(self, content: str) -> bool:
         """
@@ -85,17 +202,4 @@ class BaseCollector(ABC):
         Returns:
             True if content appears to be spam
         """
-        spam_indicators = [
-            "buy now",
-            "click here",
-            "free trial",
-            "limited time",
-            "subscribe",
-            "follow me",
-            "check my profile",
-            "DM me",
-            "link in bio",
-        ]
-
-        content_lower = content.lower()
-        return any(indicator in content_lower for indicator in spam_indicators)
+        return _SPAM_RE.search(content) is not None
@@ -0,0 +1,109 @@
+"""
+Process-wide Chrome pool for Selenium-based collectors.
+Launches the browser once and hands it out to searches one at a time,
+instead of paying Chrome's cold start on every call.
+"""
+import atexit
+import threading
+from contextlib import contextmanager
+from typing import Callable, Iterator, Optional
+from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.common.exceptions import WebDriverException
+from src.utils.logger_config import get_collector_logger
+
+
+Launcher = Callable[[], WebDriver]
+
+
+class BrowserPool:
+    """Holds a single long-lived WebDriver shared across searches."""
+
+    _instance: Optional["BrowserPool"] = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self):
+        """Initialize an empty pool; the browser is launched on first use."""
+        self.logger = get_collector_logger("browser_pool")
+        self._driver: Optional[WebDriver] = None
+        # Searches run in executor threads, and a WebDriver isn't thread-safe
+        self._lock = threading.Lock()
+
+    @classmethod
+    def instance(cls) -> "BrowserPool":
+        """
+        Get or create the process-wide pool.
+
+        Returns:
+            BrowserPool instance
+        """
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = cls()
+                atexit.register(cls._instance.close)
+            return cls._instance
+
+    def _is_alive(self) -> bool:
+        """Check whether the pooled browser still responds."""
+        try:
+            self._driver.current_url
+            return True
+        except WebDriverException:
+            return False
+
+    def _ensure_driver(self, launcher: Launcher) -> WebDriver:
+        """Return the pooled browser, relaunching it if missing or crashed."""
+        if self._driver is not None and not self._is_alive():
+            self.logger.warning("Pooled browser is unresponsive, relaunching...")
+            self._quit()
+
+        if self._driver is None:
+            self._driver = launcher()
+
+        return self._driver
+
+    @contextmanager
+    def acquire(self, launcher: Launcher) -> Iterator[WebDriver]:
+        """
+        Borrow the pooled browser for one search.
+
+        Args:
+            launcher: Callable that launches a new browser when needed
+
+        Yields:
+            WebDriver instance (exclusive until the block exits)
+        """
+        with self._lock:
+            driver = self._ensure_driver(launcher)
+            try:
+                yield driver
+            except WebDriverException:
+                # Don't hand a broken session to the next search
+                self._quit()
+                raise
+
+    def warmup(self, launcher: Launcher):
+        """
+        Launch the browser ahead of the first search.
+
+        Args:
+            launcher: Callable that launches a new browser
+        """
+        with self._lock:
+            self._ensure_driver(launcher)
+
+    def _quit(self):
+        """Quit the pooled browser, ignoring errors from a dead session."""
+        if self._driver is None:
+            return
+        try:
+            self._driver.quit()
+        except WebDriverException:
+            pass
+        self._driver = None
+
+    def close(self):
+        """Shut down the pooled browser."""
+        with self._lock:
+            if self._driver is not None:
+                self.logger.info("Closing browser...")
+            self._quit()
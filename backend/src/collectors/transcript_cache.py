@@ -0,0 +1,125 @@
+"""
+On-disk cache for YouTube transcripts.
+Repeat runs over the same videos read the transcript from disk instead of
+re-fetching it from YouTube (which is slow and risks IP blocking).
+Transcripts are stored zstd-compressed when zstandard is installed.
+"""
+import os
+from typing import Optional
+import diskcache
+
+try:
+    import zstandard
+except ImportError:  # optional; transcripts are stored uncompressed without it
+    zstandard = None
+
+# One-byte header on stored transcripts: how the rest of the value is encoded
+_RAW = b"\x00"
+_ZSTD = b"\x01"
+
+# Raised by _decode for stored values that are truncated or otherwise corrupt
+_DECODE_ERRORS: tuple = (UnicodeDecodeError,)
+
+if zstandard is not None:
+    _COMPRESSOR = zstandard.ZstdCompressor(level=3)
+    _DECOMPRESSOR = zstandard.ZstdDecompressor()
+    _DECODE_ERRORS += (zstandard.ZstdError,)
+
+
+def _encode(text: str) -> bytes:
+    """Serialize a transcript, compressing it when zstandard is available."""
+    data = text.encode("utf-8")
+    if zstandard is None:
+        return _RAW + data
+    return _ZSTD + _COMPRESSOR.compress(data)
+
+
+def _decode(value: bytes) -> Optional[str]:
+    """Deserialize a stored transcript; None if it can't be read here or is corrupt."""
+    header, data = value[:1], value[1:]
+    try:
+        if header == _RAW:
+            return data.decode("utf-8")
+        if header == _ZSTD and zstandard is not None:
+            return _DECOMPRESSOR.decompress(data).decode("utf-8")
+    except _DECODE_ERRORS:
+        # e.g. an entry truncated by a crash mid-write; refetched as a miss
+        return None
+    return None
+
+
+class TranscriptCache:
+    """Persistent transcript store keyed by (video_id, language)."""
+
+    # Transcripts rarely change once published
+    TTL = 7 * 24 * 3600
+
+    # Videos without a transcript are re-checked sooner (captions can be added later)
+    NEGATIVE_TTL = 24 * 3600
+
+    def __init__(self, directory: Optional[str] = None):
+        """
+        Open (or create) the cache directory.
+
+        Args:
+            directory: Cache directory; defaults to YT_CACHE_DIR or ~/.cache/trendpulse/yt
+        """
+        directory = directory or os.getenv("YT_CACHE_DIR", "~/.cache/trendpulse/yt")
+        self._cache = diskcache.Cache(os.path.expanduser(directory))
+
+    @staticmethod
+    def _key(video_id: str, language: str) -> str:
+        """Build the cache key for a video transcript."""
+        return f"yt:{video_id}:{language}"
+
+    def get(self, video_id: str, language: str) -> Optional[str | dict]:
+        """
+        Look up a cached transcript.
+
+        Args:
+            video_id: YouTube video ID
+            language: Transcript language code
+
+        Returns:
+            Transcript text, an unavailable marker (see is_unavailable), or None on a miss
+        """
+        value = self._cache.get(self._key(video_id, language))
+        if isinstance(value, bytes):
+            return _decode(value)
+        # Unavailable markers, and plain strings written before compression
+        return value
+
+    @staticmethod
+    def is_unavailable(value) -> bool:
+        """Tell whether a cached value records that the video has no transcript."""
+        return isinstance(value, dict) and value.get("__no_transcript__", False)
+
+    def set(self, video_id: str, language: str, text: str):
+        """
+        Store a fetched transcript.
+
+        Args:
+            video_id: YouTube video ID
+            language: Transcript language code
+            text: Cleaned transcript text
+        """
+        self._cache.set(self._key(video_id, language), _encode(text), expire=self.TTL)
+
+    def set_unavailable(self, video_id: str, language: str, reason: str):
+        """
+        Record that a video has no transcript in this language.
+
+        Args:
+            video_id: YouTube video ID
+            language: Transcript language code
+            reason: Name of the error YouTube reported
+        """
+        self._cache.set(
+            self._key(video_id, language),
+            {"__no_transcript__": True, "reason": reason},
+            expire=self.NEGATIVE_TTL,
+        )
+
+    def close(self):
+        """Close the underlying cache files."""
+        self._cache.close()
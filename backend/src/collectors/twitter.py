@@ -7,8 +7,11 @@ Improved with:
 - User profile persistence for login state
 - Smart scrolling with bottom detection
 - Enhanced anti-detection measures
+- One pooled browser reused across searches (see browser_pool)
 """
 import asyncio
+import random
+import re
 import time
 import os
 from typing import List
@@ -18,16 +21,101 @@ from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from selenium.common.exceptions import TimeoutException
 from webdriver_manager.chrome import ChromeDriverManager
 from urllib.parse import quote
-from src.collectors.base import BaseCollector, PostData
+import numpy as np
+from src.collectors.base import BaseCollector, PostBatch, PostData
+from src.collectors.browser_pool import BrowserPool
 from src.utils.logger_config import get_collector_logger
 
 
+# Chrome flags applied to every launch
+_CHROME_ARGS = (
+    "--headless",
+    # Anti-detection configuration
+    "--disable-blink-features=AutomationControlled",
+    # Stability options
+    "--no-sandbox",
+    "--disable-dev-shm-usage",
+    "--disable-infobars",
+    "--window-size=1920,1080",
+)
+_CHROME_EXPERIMENTAL_OPTIONS = {
+    "excludeSwitches": ["enable-automation"],
+    "useAutomationExtension": False,
+    # Never download images; tweets are read from text nodes only
+    "prefs": {"profile.managed_default_content_settings.images": 2},
+}
+
+# Heavy resources the scraper never reads, blocked at the network layer
+_BLOCKED_URL_PATTERNS = (
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg",
+    "*.mp4", "*.m3u8", "*.ts",
+    "*.woff", "*.woff2", "*.ttf",
+    "*.css",
+)
+
+# Injected before any page script runs to hide the webdriver flag
+_HIDE_WEBDRIVER_JS = """
+Object.defineProperty(navigator, 'webdriver', {
+    get: () => undefined
+})
+"""
+
+# Realistic desktop User-Agents; the first is the default
+_UA_POOL = (
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
+    "AppleWebKit/537.36 (KHTML, like Gecko) "
+    "Chrome/143.0.0.0 Safari/537.36",
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+    "AppleWebKit/537.36 (KHTML, like Gecko) "
+    "Chrome/143.0.0.0 Safari/537.36",
+    "Mozilla/5.0 (X11; Linux x86_64) "
+    "AppleWebKit/537.36 (KHTML, like Gecko) "
+    "Chrome/143.0.0.0 Safari/537.36",
+)
+
+# Seconds to let the timeline render after a scroll
+SCROLL_WAIT = 2.0
+
+# Metric text like "123", "10.5K", " 2m "
+_METRIC_RE = re.compile(r"\s*(\d+(?:\.\d+)?)\s*([kmKM]?)\s*")
+_MULT = {"": 1, "k": 1_000, "m": 1_000_000}
+_METRIC_NAMES = ("likes", "retweets", "replies")
+
+# Walks the first arguments[0] rendered tweets once and returns plain rows
+# (one round-trip per scroll)
+_EXTRACT_ALL_JS = """
+const q = (el, s) => (el.querySelector(s) || {}).innerText || '';
+const cap = arguments[0];
+return Array.from(document.querySelectorAll('[data-testid="tweet"]')).slice(0, cap).map(t => {
+    const textEl = t.querySelector('[data-testid="tweetText"]');
+    const timeEl = t.querySelector('time');
+    const link = timeEl ? timeEl.parentElement : null;
+    return {
+        text: textEl ? textEl.innerText : null,
+        author: q(t, '[data-testid="User-Name"]').split('\\n')[0],
+        timestamp: timeEl ? timeEl.getAttribute('datetime') : null,
+        url: link && link.href ? link.href : '',
+        likes: q(t, '[data-testid="like"]'),
+        retweets: q(t, '[data-testid="retweet"]'),
+        replies: q(t, '[data-testid="reply"]')
+    };
+});
+"""
+
+
 class TwitterCollector(BaseCollector):
     """Collects tweets using Selenium (no API required)."""
 
+    # Default anti-detection User-Agent (shared by all instances)
+    user_agent = _UA_POOL[0]
+
+    # Concurrent searches allowed by default: BrowserPool serves one search
+    # at a time from its single browser, so more would only park threads
+    default_concurrency = 1
+
     def __init__(self, config: dict = None):
         """
         Initialize Twitter collector.
@@ -41,25 +129,48 @@ class TwitterCollector(BaseCollector):
         super().__init__(config)
         self.logger = get_collector_logger("twitter")
 
-        # Anti-detection settings
-        self.user_agent = (
-            "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
-            "AppleWebKit/537.36 (KHTML, like Gecko) "
-            "Chrome/143.0.0.0 Safari/537.36"
-        )
+        # Anti-detection settings: pick a per-instance UA only when rotating
+        if config.get("rotate_ua"):
+            self.user_agent = random.choice(_UA_POOL)
 
         # User data directory for persisting login state
         self.user_data_dir = os.path.join(os.getcwd(), "chrome_profile")
 
+        # Bound concurrent searches so callers can't pile up browser/HTTP work
+        self._sem = asyncio.BoundedSemaphore(
+            config.get("MAX_CONCURRENCY", self.default_concurrency)
+        )
+
     async def search(
         self, keyword: str, language: str = "en", limit: int = 50
-    ) -> List[PostData]:
+    ) -> List[PostData] | PostBatch:
         """
         Search X/Twitter using Selenium.
 
         Warning: This method is fragile and may break due to Twitter's
         anti-bot measures. Consider using official API if available.
 
+        Args:
+            keyword: Search query
+            language: Language code
+            limit: Maximum number of tweets
+
+        Returns:
+            List of PostData objects, or a PostBatch if config["soa"] is set
+        """
+        async with self._sem:
+            posts = await self._search(keyword, language, limit)
+
+        if self.config.get("soa"):
+            return PostBatch.from_posts(posts, platform="twitter")
+        return posts
+
+    async def _search(
+        self, keyword: str, language: str, limit: int
+    ) -> List[PostData]:
+        """
+        Run one search (called with the concurrency semaphore held).
+
         Args:
             keyword: Search query
             language: Language code
@@ -87,42 +198,38 @@ class TwitterCollector(BaseCollector):
         Returns:
             List of PostData objects
         """
-        driver = None
         posts = []
 
         try:
-            self.logger.info("Initializing browser...")
-            driver = self._launch_chrome_browser()
-
-            self.logger.info(f"Searching for keyword: {keyword}")
-            search_url = f"https://x.com/search?q={quote(keyword)}&src=typed_query&lang={language}"
-            self.logger.debug(f"Search URL: {search_url}")
-            driver.get(search_url)
-
-            # Wait for page to load
-            self.logger.info("Waiting for page to load...")
-            try:
-                WebDriverWait(driver, 10).until(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, '[data-testid="tweet"]'))
-                )
-                self.logger.info("Search results loaded")
-            except TimeoutException:
-                self.logger.warning("Timeout waiting for search results, trying to continue...")
+            with BrowserPool.instance().acquire(self._launch_chrome_browser) as driver:
+                # The pooled browser may have been launched by another collector
+                # with a different UA; apply this collector's UA for the search
+                driver.execute_cdp_cmd("Network.setUserAgentOverride", {"userAgent": self.user_agent})
+
+                self.logger.info(f"Searching for keyword: {keyword}")
+                search_url = f"https://x.com/search?q={quote(keyword)}&src=typed_query&lang={language}"
+                self.logger.debug(f"Search URL: {search_url}")
+                driver.get(search_url)
+
+                # Wait for page to load
+                self.logger.info("Waiting for page to load...")
+                try:
+                    WebDriverWait(driver, 10).until(
+                        EC.presence_of_element_located((By.CSS_SELECTOR, '[data-testid="tweet"]'))
+                    )
+                    self.logger.info("Search results loaded")
+                except TimeoutException:
+                    self.logger.warning("Timeout waiting for search results, trying to continue...")
 
-            time.sleep(3)
+                time.sleep(3)
 
-            # Extract tweets
-            posts = self._extract_tweets(driver, limit)
+                # Extract tweets
+                posts = self._extract_tweets(driver, limit)
 
         except Exception as e:
             self.logger.error(f"Error during search: {e}")
             posts = []
 
-        finally:
-            if driver:
-                self.logger.info("Closing browser...")
-                driver.quit()
-
         return posts
 
     def _launch_chrome_browser(self):
@@ -138,42 +245,28 @@ class TwitterCollector(BaseCollector):
         self.logger.debug(f"Using user data directory: {self.user_data_dir}")
         chrome_options.add_argument(f"--user-data-dir={self.user_data_dir}")
 
-        # headless mode
-        chrome_options.add_argument("--headless")
-
-        # Anti-detection configuration
-        chrome_options.add_argument("--disable-blink-features=AutomationControlled")
-        chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
-        chrome_options.add_experimental_option('useAutomationExtension', False)
+        # Headless, anti-detection, stability and window size flags
+        for arg in _CHROME_ARGS:
+            chrome_options.add_argument(arg)
+        for name, value in _CHROME_EXPERIMENTAL_OPTIONS.items():
+            chrome_options.add_experimental_option(name, value)
 
         # Set real User-Agent
         chrome_options.add_argument(f"--user-agent={self.user_agent}")
 
-        # Stability options
-        chrome_options.add_argument("--no-sandbox")
-        chrome_options.add_argument("--disable-dev-shm-usage")
-        chrome_options.add_argument("--disable-infobars")
-
-        # Window size
-        chrome_options.add_argument("--window-size=1920,1080")
-
-        # Run in headless mode (unless SHOW_BROWSER env var is set for debugging)
-        # show_browser = os.getenv("SHOW_BROWSER", "false").lower() == "true"
-        # if not show_browser:
-        #     chrome_options.add_argument("--headless")
+        # Return from get() at DOMContentLoaded; tweets are awaited explicitly
+        chrome_options.page_load_strategy = "eager"
 
         self.logger.info("Launching browser...")
         service = Service(ChromeDriverManager().install())
         driver = webdriver.Chrome(service=service, options=chrome_options)
 
         # Execute CDP commands to hide webdriver property
-        driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {
-            "source": """
-                Object.defineProperty(navigator, 'webdriver', {
-                    get: () => undefined
-                })
-            """
-        })
+        driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": _HIDE_WEBDRIVER_JS})
+
+        # Skip images, video, fonts and stylesheets
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": list(_BLOCKED_URL_PATTERNS)})
 
         return driver
 
@@ -189,79 +282,77 @@ class TwitterCollector(BaseCollector):
             List of PostData objects
         """
         posts = []
+        seen = set()
         last_height = 0
 
         self.logger.info(f"Starting to scrape {limit} tweets...")
 
         while len(posts) < limit:
-            # Find all tweet elements
-            tweet_elements = driver.find_elements(By.CSS_SELECTOR, '[data-testid="tweet"]')
+            # Read rendered tweets in one script call, walking at most twice the
+            # remaining quota past what was already seen (spam/dupes need slack)
+            cap = len(seen) + 2 * (limit - len(posts))
+            rows = driver.execute_script(_EXTRACT_ALL_JS, cap) or []
+
+            # If this batch can't fill the limit, start the next scroll now so
+            # the page renders while the rows are processed below
+            scrolled_at = None
+            if len(posts) + len(rows) < limit:
+                scrolled_at = self._scroll(driver)
+
+            # Pick new tweets (the timeline is virtualized, so dedupe by URL)
+            accepted = []
+            for row in rows:
+                if len(posts) + len(accepted) >= limit:
+                    break
 
-            # Process new tweets
-            for tweet_element in tweet_elements[len(posts):limit]:
                 try:
-                    # Extract tweet text
-                    try:
-                        text_element = tweet_element.find_element(By.CSS_SELECTOR, '[data-testid="tweetText"]')
-                        text = text_element.text
-                    except NoSuchElementException:
+                    text = row.get("text")
+                    if text is None:
                         continue
 
-                    # Extract author information
-                    try:
-                        author_element = tweet_element.find_element(By.CSS_SELECTOR, '[data-testid="User-Name"]')
-                        author = author_element.text.split('\n')[0]  # Get only the username
-                    except NoSuchElementException:
-                        author = "未知用户"
-
-                    # Extract timestamp
-                    timestamp = None
-                    try:
-                        time_element = tweet_element.find_element(By.TAG_NAME, 'time')
-                        timestamp = time_element.get_attribute('datetime')
-                    except NoSuchElementException:
-                        pass
-
-                    # Extract tweet URL
-                    tweet_url = ""
-                    try:
-                        link_element = tweet_element.find_element(By.TAG_NAME, 'time')
-                        tweet_url = link_element.find_element(By.XPATH, "..").get_attribute('href')
-                    except NoSuchElementException:
-                        pass
-
-                    # Extract engagement metrics
-                    metrics = self._extract_metrics(tweet_element)
-
-                    # Filter spam
-                    if self.is_spam(text):
+                    key = row.get("url") or text
+                    if key in seen:
                         continue
+                    seen.add(key)
 
-                    post = PostData(
-                        platform="twitter",
-                        post_id=str(hash(text)),  # Simple ID generation
-                        author=author,
-                        content=self.clean_content(text),
-                        url=tweet_url,
-                        shares=metrics.get("retweets", 0),
-                        likes=metrics.get("likes", 0),
-                        comments_count=metrics.get("replies", 0),
-                        created_at=timestamp
-                    )
-                    posts.append(post)
+                    # Filter spam before any metric parsing or cleaning
+                    if self.is_spam(text):
+                        continue
 
-                    self.logger.info(f"Scraped {len(posts)}/{limit} tweets")
+                    accepted.append(row)
 
                 except Exception as e:
                     self.logger.error(f"Error extracting tweet: {e}")
                     continue
 
+            # Parse the whole batch's metric labels at once: columns are likes, retweets, replies
+            metrics = self._parse_metrics_bulk(
+                [row.get(name, "") for row in accepted for name in _METRIC_NAMES]
+            ).reshape(-1, len(_METRIC_NAMES))
+
+            for row, (likes, retweets, replies) in zip(accepted, metrics.tolist()):
+                post = PostData(
+                    platform="twitter",
+                    post_id=str(hash(row["text"])),  # Simple ID generation
+                    author=row.get("author") or "未知用户",
+                    content=self.clean_content(row["text"]),
+                    url=row.get("url", ""),
+                    shares=retweets,
+                    likes=likes,
+                    comments_count=replies,
+                    created_at=row.get("timestamp")
+                )
+                posts.append(post)
+
+                self.logger.info(f"Scraped {len(posts)}/{limit} tweets")
+
             if len(posts) >= limit:
                 break
 
-            # Scroll to load more tweets
-            driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            time.sleep(2)
+            # Scroll to load more tweets, waiting only for what processing didn't cover
+            if scrolled_at is None:
+                scrolled_at = self._scroll(driver)
+            time.sleep(max(0.0, SCROLL_WAIT - (time.monotonic() - scrolled_at)))
 
             # Check if reached bottom
             new_height = driver.execute_script("return document.body.scrollHeight")
@@ -273,47 +364,36 @@ class TwitterCollector(BaseCollector):
         self.logger.info(f"Scraping completed! Collected {len(posts)} tweets")
         return posts
 
-    def _extract_metrics(self, tweet) -> dict:
+    def _scroll(self, driver) -> float:
         """
-        Extract engagement metrics from tweet.
+        Scroll to the bottom of the page to load more tweets.
 
         Args:
-            tweet: Tweet WebElement
+            driver: Selenium WebDriver instance
 
         Returns:
-            Dictionary with metrics
+            time.monotonic() timestamp of the scroll
         """
-        metrics = {}
+        driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+        return time.monotonic()
 
-        try:
-            # Extract likes
-            try:
-                like_element = tweet.find_element(By.CSS_SELECTOR, '[data-testid="like"]')
-                like_text = like_element.text
-                metrics["likes"] = self._parse_metric(like_text)
-            except NoSuchElementException:
-                metrics["likes"] = 0
-
-            # Extract retweets
-            try:
-                retweet_element = tweet.find_element(By.CSS_SELECTOR, '[data-testid="retweet"]')
-                retweet_text = retweet_element.text
-                metrics["retweets"] = self._parse_metric(retweet_text)
-            except NoSuchElementException:
-                metrics["retweets"] = 0
-
-            # Extract replies
-            try:
-                reply_element = tweet.find_element(By.CSS_SELECTOR, '[data-testid="reply"]')
-                reply_text = reply_element.text
-                metrics["replies"] = self._parse_metric(reply_text)
-            except NoSuchElementException:
-                metrics["replies"] = 0
+    def _parse_metrics_bulk(self, texts: List[str]) -> np.ndarray:
+        """
+        Parse many metric labels into an int64 array.
 
-        except Exception as e:
-            self.logger.error(f"Error extracting metrics: {e}")
+        Plain Python over the precompiled regex on purpose: the work is
+        string matching, which JIT compilers like Numba don't speed up.
+        The array is the boundary for vectorized numeric work downstream.
 
-        return metrics
+        Args:
+            texts: Metric texts
+
+        Returns:
+            int64 array of parsed values (0 for empty/invalid text)
+        """
+        return np.fromiter(
+            (self._parse_metric(text) for text in texts), dtype=np.int64, count=len(texts)
+        )
 
     def _parse_metric(self, text: str) -> int:
         """
@@ -325,17 +405,7 @@ class TwitterCollector(BaseCollector):
         Returns:
             Integer value
         """
-        if not text:
+        m = _METRIC_RE.fullmatch(text) if text else None
+        if not m:
             return 0
-
-        text = text.strip().upper()
-
-        if "K" in text:
-            return int(float(text.replace("K", "")) * 1000)
-        elif "M" in text:
-            return int(float(text.replace("M", "")) * 1000000)
-        else:
-            try:
-                return int(text)
-            except ValueError:
-                return 0
+        return int(float(m.group(1)) * _MULT[m.group(2).lower()])
@@ -0,0 +1,290 @@
+"""
+X/Twitter data collector over plain HTTPS via a Nitter mirror.
+Avoids launching a browser per search; falls back to Selenium when the
+mirror is unreachable or its HTML can't be parsed. Pages are parsed with
+selectolax when installed, otherwise BeautifulSoup.
+"""
+import asyncio
+import time
+from typing import Callable, List, Optional
+from urllib.parse import quote
+import aiohttp
+from bs4 import BeautifulSoup
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:  # optional C-backed parser; bs4 is the fallback
+    LexborHTMLParser = None
+
+from src.collectors.base import PostData
+from src.collectors.twitter import TwitterCollector
+
+
+class TwitterParseError(Exception):
+    """Raised when a Nitter page doesn't have the expected timeline layout."""
+
+
+_STAT_ICONS = (
+    ("icon-comment", "replies"),
+    ("icon-retweet", "retweets"),
+    ("icon-heart", "likes"),
+)
+
+
+def _extract_rows_selectolax(
+    html: str, skip: Callable[[str], bool] = lambda text: False
+) -> tuple[Optional[List[dict]], Optional[str]]:
+    """Pull raw tweet fields from a Nitter page with selectolax."""
+    tree = LexborHTMLParser(html)
+
+    if tree.css_first(".timeline-none") is not None:
+        return [], None
+
+    items = tree.css(".timeline-item")
+    if not items and tree.css_first(".timeline") is None:
+        return None, None
+
+    rows = []
+    for item in items:
+        content_node = item.css_first(".tweet-content")
+        if content_node is None:
+            continue
+
+        # Spam is dropped before touching any other node of the tweet
+        text = content_node.text(separator=" ", strip=True)
+        if skip(text):
+            continue
+
+        author_node = item.css_first(".fullname")
+        link_node = item.css_first("a.tweet-link")
+        date_node = item.css_first(".tweet-date a")
+
+        stats = {}
+        for stat in item.css(".tweet-stat"):
+            for icon_class, name in _STAT_ICONS:
+                if stat.css_first(f".{icon_class}") is not None:
+                    stats[name] = stat.text(strip=True)
+                    break
+
+        rows.append({
+            "text": text,
+            "author": author_node.text(strip=True) if author_node else None,
+            "href": link_node.attributes.get("href") if link_node else None,
+            "date": date_node.attributes.get("title") if date_node else None,
+            "stats": stats,
+        })
+
+    more = tree.css_first(".show-more:not(.timeline-item) a")
+    return rows, more.attributes.get("href") if more else None
+
+
+def _extract_rows_bs4(
+    html: str, skip: Callable[[str], bool] = lambda text: False
+) -> tuple[Optional[List[dict]], Optional[str]]:
+    """Pull raw tweet fields from a Nitter page with BeautifulSoup."""
+    soup = BeautifulSoup(html, "html.parser")
+
+    if soup.select_one(".timeline-none"):
+        return [], None
+
+    items = soup.select(".timeline-item")
+    if not items and not soup.select_one(".timeline"):
+        return None, None
+
+    rows = []
+    for item in items:
+        content_node = item.select_one(".tweet-content")
+        if content_node is None:
+            continue
+
+        # Spam is dropped before touching any other node of the tweet
+        text = content_node.get_text(" ", strip=True)
+        if skip(text):
+            continue
+
+        author_node = item.select_one(".fullname")
+        link_node = item.select_one("a.tweet-link")
+        date_node = item.select_one(".tweet-date a")
+
+        stats = {}
+        for stat in item.select(".tweet-stat"):
+            for icon_class, name in _STAT_ICONS:
+                if stat.select_one(f".{icon_class}") is not None:
+                    stats[name] = stat.get_text(strip=True)
+                    break
+
+        rows.append({
+            "text": text,
+            "author": author_node.get_text(strip=True) if author_node else None,
+            "href": link_node.get("href") if link_node else None,
+            "date": date_node.get("title") if date_node else None,
+            "stats": stats,
+        })
+
+    more = soup.select_one(".show-more:not(.timeline-item) a")
+    return rows, more.get("href") if more else None
+
+
+_extract_rows = _extract_rows_selectolax if LexborHTMLParser is not None else _extract_rows_bs4
+
+
+class AiohttpTwitterCollector(TwitterCollector):
+    """Collects tweets from a Nitter mirror with aiohttp (no browser required)."""
+
+    # HTTP searches don't share a browser and can overlap
+    default_concurrency = 8
+
+    def __init__(self, config: dict = None):
+        """
+        Initialize HTTP Twitter collector.
+
+        Args:
+            config: Dictionary with optional NITTER_BASE_URL
+        """
+        super().__init__(config)
+        self.base_url = self.config.get("NITTER_BASE_URL", "https://nitter.net").rstrip("/")
+        self.timeout = aiohttp.ClientTimeout(total=30, connect=10)
+        self.rate_limit_max_wait = 60.0
+
+        # Created lazily so the collector can be built outside an event loop
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Return the shared keep-alive session, creating it on first use."""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=64, keepalive_timeout=30),
+                timeout=self.timeout,
+                headers={"User-Agent": self.user_agent},
+            )
+        return self._session
+
+    async def aclose(self):
+        """Close the shared HTTP session."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    async def _search(
+        self, keyword: str, language: str, limit: int
+    ) -> List[PostData]:
+        """
+        Search X/Twitter through Nitter, falling back to Selenium on failure.
+
+        Args:
+            keyword: Search query
+            language: Language code
+            limit: Maximum number of tweets
+
+        Returns:
+            List of PostData objects
+        """
+        try:
+            return await self._search_http(keyword, language, limit)
+        except (aiohttp.ClientError, TimeoutError, TwitterParseError) as e:
+            self.logger.warning(f"HTTP search failed, falling back to browser: {e}")
+            return await super()._search(keyword, language, limit)
+
+    async def _search_http(
+        self, keyword: str, language: str, limit: int
+    ) -> List[PostData]:
+        """
+        Fetch search result pages until limit is reached or results run out.
+
+        Args:
+            keyword: Search query
+            language: Language code
+            limit: Maximum number of tweets
+
+        Returns:
+            List of PostData objects
+        """
+        session = self._get_session()
+        query = quote(f"{keyword} lang:{language}")
+        url = f"{self.base_url}/search?f=tweets&q={query}"
+        posts: List[PostData] = []
+
+        self.logger.info(f"Searching Nitter for keyword: {keyword}")
+
+        while url and len(posts) < limit:
+            self.logger.debug(f"Search URL: {url}")
+            async with session.get(url) as response:
+                if response.status != 200:
+                    raise TwitterParseError(f"Nitter returned HTTP {response.status}")
+                html = await response.text()
+                await self._respect_rate_limit(response.headers)
+
+            page_posts, cursor = self._parse_search_page(html)
+            posts.extend(page_posts[:limit - len(posts)])
+            url = f"{self.base_url}/search{cursor}" if cursor else None
+
+        self.logger.info(f"Scraping completed! Collected {len(posts)} tweets")
+        return posts
+
+    async def _respect_rate_limit(self, headers):
+        """
+        Pause when the mirror reports an exhausted rate-limit window.
+
+        Args:
+            headers: Response headers
+        """
+        remaining = headers.get("X-Rate-Limit-Remaining")
+        if remaining is None or not remaining.isdigit() or int(remaining) > 0:
+            return
+
+        reset = headers.get("X-Rate-Limit-Reset", "")
+        delay = int(reset) - time.time() if reset.isdigit() else self.rate_limit_max_wait
+        delay = min(max(delay, 0.0), self.rate_limit_max_wait)
+        self.logger.warning(f"Rate limit exhausted, waiting {delay:.0f}s")
+        await asyncio.sleep(delay)
+
+    def _parse_search_page(self, html: str) -> tuple[List[PostData], Optional[str]]:
+        """
+        Parse one Nitter search page.
+
+        Args:
+            html: Page HTML
+
+        Returns:
+            (posts, next page query string or None)
+        """
+        rows, cursor = _extract_rows(html, skip=self.is_spam)
+        if rows is None:
+            raise TwitterParseError("No timeline found in Nitter response")
+
+        posts = []
+        for row in rows:
+            text = row["text"]
+            path = (row["href"] or "").split("#")[0]
+            stats = row["stats"]
+            posts.append(
+                PostData(
+                    platform="twitter",
+                    post_id=path.rsplit("/", 1)[-1] or str(hash(text)),
+                    author=row["author"] or "未知用户",
+                    content=self.clean_content(text),
+                    url=f"https://x.com{path}" if path else "",
+                    shares=self._parse_metric(stats.get("retweets", "").replace(",", "")),
+                    likes=self._parse_metric(stats.get("likes", "").replace(",", "")),
+                    comments_count=self._parse_metric(stats.get("replies", "").replace(",", "")),
+                    created_at=row["date"],
+                )
+            )
+
+        return posts, cursor
+
+
+def create_twitter_collector(config: dict = None) -> TwitterCollector:
+    """
+    Build the Twitter collector selected by config.
+
+    Args:
+        config: Dictionary; use_http=True selects the Nitter HTTP collector
+
+    Returns:
+        TwitterCollector instance
+    """
+    config = config or {}
+    if config.get("use_http"):
+        return AiohttpTwitterCollector(config)
+    return TwitterCollector(config)
@@ -6,18 +6,94 @@ import asyncio
 import os
 import functools
 import random
-from typing import List, Optional
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
 import aiohttp
+import requests
+from requests.adapters import HTTPAdapter
+from tenacity import retry, retry_if_exception, stop_after_attempt, wait_exponential_jitter
 from youtube_transcript_api import YouTubeTranscriptApi
 from youtube_transcript_api.proxies import GenericProxyConfig, WebshareProxyConfig
 from youtube_transcript_api._errors import (
     TranscriptsDisabled,
     NoTranscriptFound,
     VideoUnavailable,
+    RequestBlocked,
 )
 from src.collectors.base import BaseCollector, PostData
+from src.collectors.transcript_cache import TranscriptCache
 from src.utils.logger_config import get_collector_logger
 
+# Network failures that usually clear up on their own
+_TRANSIENT_ERRORS = (
+    requests.exceptions.ConnectionError,
+    requests.exceptions.Timeout,
+    RequestBlocked,
+)
+
+
+# Lower-cased message fragments of YouTube throttling / IP-blocking errors
+_BLOCKED_MARKERS = ("ipblocked", "ip blocked", "requestblocked", "429", "too many requests")
+
+
+def _is_blocked(exc: BaseException) -> bool:
+    """Tell whether an error message says YouTube is throttling or blocking us."""
+    message = str(exc).lower()
+    return any(marker in message for marker in _BLOCKED_MARKERS)
+
+
+def _is_transient(exc: BaseException) -> bool:
+    """
+    Tell whether a transcript fetch error is worth retrying.
+
+    Args:
+        exc: Exception raised by the fetch
+
+    Returns:
+        True for network errors and YouTube throttling (429 / IP blocks)
+    """
+    if isinstance(exc, (TranscriptsDisabled, NoTranscriptFound, VideoUnavailable)):
+        return False
+    return isinstance(exc, _TRANSIENT_ERRORS) or _is_blocked(exc)
+
+
+@functools.lru_cache(maxsize=4)
+def _build_proxy_config(
+    webshare_username: Optional[str],
+    webshare_password: Optional[str],
+    http_proxy: Optional[str],
+) -> Optional[GenericProxyConfig | WebshareProxyConfig]:
+    """
+    Build the transcript proxy config for a set of proxy settings.
+
+    Cached, so collectors created with the same environment share one config.
+
+    Args:
+        webshare_username: WEBSHARE_PROXY_USERNAME
+        webshare_password: WEBSHARE_PROXY_PASSWORD
+        http_proxy: HTTP_PROXY or HTTPS_PROXY
+
+    Returns:
+        WebshareProxyConfig, GenericProxyConfig, or None when no proxy is set
+    """
+    # Priority 1: Webshare residential proxy
+    if webshare_username and webshare_password:
+        return WebshareProxyConfig(
+            proxy_username=webshare_username,
+            proxy_password=webshare_password,
+        )
+
+    # Priority 2: generic HTTP/HTTPS proxy, used for both schemes
+    if http_proxy:
+        return GenericProxyConfig(
+            http_url=http_proxy,
+            https_url=http_proxy,
+        )
+
+    return None
+
 
 class YouTubeCollector(BaseCollector):
     """Collects YouTube video metadata and transcripts."""
@@ -45,10 +121,88 @@ class YouTubeCollector(BaseCollector):
             sock_read=30  # 30 seconds to read data
         )
 
+        # Data API session, created lazily so the collector can be built outside an event loop
+        self._http: Optional[aiohttp.ClientSession] = None
+
         # Get proxy from environment variable
         self.proxy = os.getenv("HTTP_PROXY") or os.getenv("HTTPS_PROXY")
         self.proxy_config = self._create_proxy_config()
 
+        # One transcript client per executor thread, so connections are kept
+        # alive between videos; YouTubeTranscriptApi isn't thread-safe
+        if not self.proxy_config:
+            self.logger.warning("No proxy configured - may encounter IP blocking")
+        self._clients = threading.local()
+        self._client_sessions: List[requests.Session] = []
+
+        # Transcripts already fetched on earlier runs (YT_CACHE_DIR)
+        self.transcript_cache = TranscriptCache()
+
+        # Recent transcripts kept in memory in front of the disk cache (LRU)
+        self._recent: "OrderedDict[Tuple[str, str], str]" = OrderedDict()
+        self._recent_size = 256
+
+        # Fetches in progress, so concurrent requests for one video share one fetch
+        self._inflight: Dict[Tuple[str, str], asyncio.Task] = {}
+
+        # Own pool for blocking transcript fetches rather than sharing the
+        # loop's default executor; search() fetches one video at a time, so
+        # threads only run in parallel for overlapping searches
+        self._executor = ThreadPoolExecutor(
+            max_workers=int(os.getenv("YT_TRANSCRIPT_WORKERS", "4")),
+            thread_name_prefix="yt-transcript",
+        )
+
+    @staticmethod
+    def _create_http_session() -> requests.Session:
+        """
+        Create the keep-alive HTTP session of one thread's transcript client.
+
+        Proxy configs that retry on blocking mount their own adapter over
+        this one (see YouTubeTranscriptApi).
+
+        Returns:
+            requests.Session with a keep-alive connection pool
+        """
+        session = requests.Session()
+        # A thread makes one request at a time, so a small pool is enough
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=4, max_retries=0)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+
+    def _transcript_client(self) -> YouTubeTranscriptApi:
+        """Return the calling thread's transcript client, creating it on first use."""
+        client = getattr(self._clients, "api", None)
+        if client is None:
+            session = self._create_http_session()
+            client = YouTubeTranscriptApi(proxy_config=self.proxy_config, http_client=session)
+            self._clients.api = client
+            self._client_sessions.append(session)
+        return client
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Return the shared keep-alive Data API session, creating it on first use."""
+        if self._http is None or self._http.closed:
+            self._http = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=50, ttl_dns_cache=300, keepalive_timeout=60
+                ),
+                timeout=self.timeout,
+            )
+        return self._http
+
+    async def aclose(self):
+        """Close the Data API session, transcript thread pool, clients and cache."""
+        if self._http is not None and not self._http.closed:
+            await self._http.close()
+        self._http = None
+        self._executor.shutdown(wait=False)
+        for session in self._client_sessions:
+            session.close()
+        self._client_sessions.clear()
+        self.transcript_cache.close()
+
     def _create_proxy_config(self) -> Optional[GenericProxyConfig | WebshareProxyConfig]:
         """
         Create proxy configuration for YouTubeTranscriptApi.
@@ -62,29 +216,16 @@ class YouTubeCollector(BaseCollector):
         Returns:
             GenericProxyConfig or WebshareProxyConfig if proxy is set, None otherwise
         """
-        # Priority 1: Check for Webshare proxy configuration
         webshare_username = os.getenv("WEBSHARE_PROXY_USERNAME")
         webshare_password = os.getenv("WEBSHARE_PROXY_PASSWORD")
+        http_proxy = os.getenv("HTTP_PROXY") or os.getenv("HTTPS_PROXY")
 
-        if webshare_username and webshare_password:
+        proxy_config = _build_proxy_config(webshare_username, webshare_password, http_proxy)
+        if isinstance(proxy_config, WebshareProxyConfig):
             self.logger.info("Using Webshare residential proxy")
-            return WebshareProxyConfig(
-                proxy_username=webshare_username,
-                proxy_password=webshare_password,
-            )
-
-        # Priority 2: Check for generic HTTP/HTTPS proxy
-        http_proxy = os.getenv("HTTP_PROXY") or os.getenv("HTTPS_PROXY")
-        if http_proxy:
+        elif proxy_config is not None:
             self.logger.info(f"Using generic proxy: {http_proxy}")
-            # Use the same proxy for both HTTP and HTTPS
-            return GenericProxyConfig(
-                http_url=http_proxy,
-                https_url=http_proxy,
-            )
-
-        # No proxy configured
-        return None
+        return proxy_config
 
     async def search(
         self, keyword: str, language: str = "en", limit: int = 50
@@ -192,17 +333,17 @@ class YouTubeCollector(BaseCollector):
         }
 
         try:
-            async with aiohttp.ClientSession(timeout=self.timeout) as session:
-                async with session.get(
-                    url,
-                    params=params,
-                    proxy=self.proxy
-                ) as response:
-                    if response.status != 200:
-                        error_text = await response.text()
-                        raise Exception(f"YouTube API error: {error_text}")
-
-                    data = await response.json()
+            session = self._get_session()
+            async with session.get(
+                url,
+                params=params,
+                proxy=self.proxy
+            ) as response:
+                if response.status != 200:
+                    error_text = await response.text()
+                    raise Exception(f"YouTube API error: {error_text}")
+
+                data = await response.json()
 
             # Extract video IDs and fetch detailed statistics
             video_ids = [item["id"]["videoId"] for item in data["items"]]
@@ -235,16 +376,16 @@ class YouTubeCollector(BaseCollector):
         }
 
         try:
-            async with aiohttp.ClientSession(timeout=self.timeout) as session:
-                async with session.get(
-                    url,
-                    params=params,
-                    proxy=self.proxy
-                ) as response:
-                    if response.status != 200:
-                        return []
+            session = self._get_session()
+            async with session.get(
+                url,
+                params=params,
+                proxy=self.proxy
+            ) as response:
+                if response.status != 200:
+                    return []
 
-                    data = await response.json()
+                data = await response.json()
 
             videos = []
             for item in data.get("items", []):
@@ -269,9 +410,67 @@ class YouTubeCollector(BaseCollector):
             self.logger.error(f"Error fetching video stats: {e}")
             return []
 
+    @retry(
+        stop=stop_after_attempt(3),
+        wait=wait_exponential_jitter(initial=1, max=30, jitter=0.5),
+        retry=retry_if_exception(_is_transient),
+        reraise=True,
+    )
+    def _fetch_with_retry(self, video_id: str, language: str):
+        """
+        Fetch a transcript, backing off and retrying on transient errors.
+
+        Blocking; runs in the executor.
+
+        Args:
+            video_id: YouTube video ID
+            language: Preferred language code
+
+        Returns:
+            FetchedTranscript
+        """
+        return self._transcript_client().fetch(video_id, languages=[language])
+
     async def _fetch_transcript(self, video: dict, language: str) -> str | None:
         """
-        Fetch transcript for a video.
+        Fetch transcript for a video, coalescing duplicate requests.
+
+        Args:
+            video: Video metadata dictionary
+            language: Preferred language code
+
+        Returns:
+            Transcript text or None if not available
+        """
+        key = (video["id"], language)
+
+        text = self._recent.get(key)
+        if text is not None:
+            self._recent.move_to_end(key)
+            return text
+
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch_transcript_uncached(video, language))
+            self._inflight[key] = task
+            task.add_done_callback(functools.partial(self._finish_fetch, key))
+
+        # Shielded: one cancelled caller mustn't cancel the fetch for the others
+        return await asyncio.shield(task)
+
+    def _finish_fetch(self, key: Tuple[str, str], task: asyncio.Task):
+        """Drop a completed fetch from the in-flight table and remember its transcript."""
+        self._inflight.pop(key, None)
+        if task.cancelled() or task.exception() is not None or task.result() is None:
+            return
+        self._recent[key] = task.result()
+        self._recent.move_to_end(key)
+        if len(self._recent) > self._recent_size:
+            self._recent.popitem(last=False)
+
+    async def _fetch_transcript_uncached(self, video: dict, language: str) -> str | None:
+        """
+        Fetch transcript for a video from the disk cache or YouTube.
 
         Args:
             video: Video metadata dictionary
@@ -281,26 +480,19 @@ class YouTubeCollector(BaseCollector):
             Transcript text or None if not available
         """
         video_id = video["id"]
-        loop = asyncio.get_event_loop()
 
-        try:
-            # Create API instance with proxy config if available
-            if self.proxy_config:
-                # Print proxy info (already printed in __init__, so this is just for debug)
-                api = YouTubeTranscriptApi(proxy_config=self.proxy_config)
-            else:
-                self.logger.warning("No proxy configured - may encounter IP blocking")
-                api = YouTubeTranscriptApi()
-
-            # Use functools.partial to bind the video_id parameter
-            # Pass languages parameter for better compatibility
-            fetch_transcript_func = functools.partial(
-                api.fetch, video_id, languages=[language]
-            )
+        cached = self.transcript_cache.get(video_id, language)
+        if TranscriptCache.is_unavailable(cached):
+            return None
+        if cached is not None:
+            return cached
 
+        loop = asyncio.get_running_loop()
+
+        try:
             # Run in thread pool to avoid blocking
             transcript = await loop.run_in_executor(
-                None, fetch_transcript_func
+                self._executor, self._fetch_with_retry, video_id, language
             )
 
             # Extract text from transcript snippets
@@ -308,20 +500,20 @@ class YouTubeCollector(BaseCollector):
             text = " ".join([snippet.text for snippet in transcript.snippets])
             text = self.clean_content(text)
 
+            self.transcript_cache.set(video_id, language, text)
             return text
 
-        except (TranscriptsDisabled, NoTranscriptFound):
-            # No transcript available
-            return None
-        except VideoUnavailable:
-            # Video deleted or private
+        except (TranscriptsDisabled, NoTranscriptFound, VideoUnavailable) as e:
+            # No transcript available, or video deleted or private;
+            # remember it so re-runs don't ask YouTube again
+            self.transcript_cache.set_unavailable(video_id, language, type(e).__name__)
             return None
         except Exception as e:
+            # %-style arguments: formatted only if a handler emits the record
+            self.logger.error("Error fetching transcript for %s: %s", video_id, e)
             # Check for IP blocking errors
-            error_str = str(e).lower()
-            self.logger.error(f"Error fetching transcript: {str(e)}")
-            if "ip blocked" in error_str or "requestblocked" in error_str or "ipblocked" in error_str:
-                self.logger.warning("YouTube IP blocking detected!")
+            if _is_blocked(e):
+                self.logger.warning("YouTube IP blocking detected for %s", video_id)
                 self.logger.info("Solution: Configure proxy in .env file:")
                 self.logger.info("  # Option 1: Webshare residential proxy (recommended)")
                 self.logger.info("  WEBSHARE_PROXY_USERNAME=your_username")
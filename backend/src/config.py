@@ -23,6 +23,8 @@ class Config:
 
     # X/Twitter (Optional)
     TWITTER_BEARER_TOKEN: Optional[str] = os.getenv("TWITTER_BEARER_TOKEN")
+    TWITTER_USE_HTTP: bool = os.getenv("TWITTER_USE_HTTP", "false").lower() == "true"
+    NITTER_BASE_URL: str = os.getenv("NITTER_BASE_URL", "https://nitter.net")
 
     # LLM API Configuration
     LLM_PROVIDER: str = os.getenv("LLM_PROVIDER", "openai")  # Options: openai, tongyi
@@ -32,6 +34,7 @@ class Config:
     OPENAI_API_KEY: str = os.getenv("OPENAI_API_KEY", "")
     OPENAI_MODEL: str = os.getenv("OPENAI_MODEL", "gpt-4o-mini")
     OPENAI_BASE_URL: str = os.getenv("OPENAI_BASE_URL", "https://api.openai.com/v1")
+    OPENAI_EMBEDDING_MODEL: str = os.getenv("OPENAI_EMBEDDING_MODEL", "text-embedding-3-small")
 
     # Tongyi Qianwen Configuration
     TONGYI_API_KEY: str = os.getenv("TONGYI_API_KEY", "")
@@ -39,6 +42,14 @@ class Config:
     TONGYI_BASE_URL: str = os.getenv(
         "TONGYI_BASE_URL", "https://dashscope.aliyuncs.com/compatible-mode/v1"
     )
+    TONGYI_EMBEDDING_MODEL: str = os.getenv("TONGYI_EMBEDDING_MODEL", "text-embedding-v3")
+
+    # Semantic cache for summaries (off by default; set to "1" to enable)
+    SUMMARIZER_SEM_CACHE: bool = os.getenv("SUMMARIZER_SEM_CACHE", "0") == "1"
+    SEM_CACHE_THRESHOLD: float = float(os.getenv("SEM_CACHE_THRESHOLD", "0.92"))
+
+    # Entries kept in TokenCounter's token-count cache (0 disables it)
+    PREPROCESS_CACHE_SIZE: int = int(os.getenv("PREPROCESS_CACHE_SIZE", "4096"))
 
     # Legacy support (for backward compatibility)
     LLM_API_BASE_URL: str = os.getenv(
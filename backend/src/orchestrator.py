@@ -8,7 +8,7 @@ import asyncio
 
 from src.collectors.reddit import RedditCollector
 from src.collectors.youtube import YouTubeCollector
-from src.collectors.twitter import TwitterCollector
+from src.collectors.twitter_http import AiohttpTwitterCollector, create_twitter_collector
 from src.ai_analysis.pipeline import AnalysisPipeline
 from src.database.operations import DatabaseManager
 from src.config import Config
@@ -53,7 +53,18 @@ class TrendPulseOrchestrator:
             }
         )
 
-        self.twitter_collector = TwitterCollector()
+        self.twitter_collector = create_twitter_collector(
+            {
+                "use_http": Config.TWITTER_USE_HTTP,
+                "NITTER_BASE_URL": Config.NITTER_BASE_URL,
+            }
+        )
+
+    async def aclose(self):
+        """Release the collectors' shared HTTP sessions and thread pools."""
+        await self.youtube_collector.aclose()
+        if isinstance(self.twitter_collector, AiohttpTwitterCollector):
+            await self.twitter_collector.aclose()
 
     async def analyze_keyword(
         self,
@@ -0,0 +1,24 @@
+"""
+Event loop setup for TrendPulse entry points.
+Uses uvloop when it's installed; falls back to the default asyncio loop.
+"""
+import asyncio
+
+
+def install_uvloop() -> bool:
+    """
+    Make uvloop the event loop policy if available.
+
+    Call from entry points (before asyncio.run), not at import time, so
+    importing a collector never changes the caller's event loop.
+
+    Returns:
+        True if uvloop was installed
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return False
+
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return True
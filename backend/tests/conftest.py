@@ -0,0 +1,39 @@
+"""
+Shared pytest configuration for the backend tests.
+"""
+import asyncio
+import os
+import sys
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_asyncio_loop_factories(config, item):
+    """
+    Run async tests on uvloop when it's installed.
+
+    The loop itself stays session-scoped (see pytest.ini); this only picks
+    the loop implementation. pytest-asyncio requires a non-empty mapping,
+    so without uvloop (e.g. on Windows) the default asyncio loop is named.
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return {"asyncio": asyncio.new_event_loop}
+    return {"uvloop": uvloop.new_event_loop}
+
+
+@pytest.fixture(scope="session", autouse=True)
+def warm_tokenizer():
+    """
+    Load the tiktoken encodings once before any test runs.
+
+    The first load can read (or download) the BPE table, which would
+    otherwise be charged to whichever test counts tokens first.
+    """
+    from src.ai_analysis.utils.token_counter import _get_encoder
+
+    for model in ("gpt-4", "gpt-4o-mini", "qwen-plus"):
+        _get_encoder(model)
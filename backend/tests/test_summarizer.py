@@ -9,10 +9,15 @@
 
 运行方式:
 pytest tests/test_summarizer_v2.py -v -s
+
+集成用例默认通过 test_full_suite_parallel 一次性并发执行；
+需要逐个用例输出时:
+pytest tests/test_summarizer.py -m slow_serial -v -s
 """
 import asyncio
 import os
 import sys
+from dataclasses import dataclass
 import pytest
 from dotenv import load_dotenv
 
@@ -20,6 +25,13 @@ load_dotenv()
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
 
+@dataclass(slots=True)
+class Post:
+    """轻量帖子对象（无 __dict__，大批量 fixture 更省内存）"""
+    content: str
+    platform: str = "reddit"
+
+
 # ============ Test Fixtures ============
 
 @pytest.fixture
@@ -52,20 +64,19 @@ def diverse_posts():
 @pytest.fixture
 def large_posts():
     """提供大批量测试帖子"""
-    posts = []
-    for i in range(50):
-        posts.append({
-            "content": f"This is post number {i+1} discussing various aspects of the product. " +
-                     f"Users have different opinions about feature {i%5}. " +
-                     f"Some think it's good, others think it needs improvement.",
-            "platform": "reddit"
-        })
-    return posts
+    return [
+        Post(
+            content=f"This is post number {i+1} discussing various aspects of the product. " +
+                    f"Users have different opinions about feature {i%5}. " +
+                    f"Some think it's good, others think it needs improvement.",
+            platform="reddit"
+        )
+        for i in range(50)
+    ]
 
 
 # ============ Unit Tests ============
 
-@pytest.mark.asyncio
 async def test_summarizer_initialization():
     """测试摘要器初始化"""
     from src.ai_analysis.summarizer import Summarizer
@@ -77,7 +88,6 @@ async def test_summarizer_initialization():
     print("✓ Summarizer 初始化成功")
 
 
-@pytest.mark.asyncio
 async def test_sentiment_description():
     """测试情感描述映射"""
     from src.ai_analysis.summarizer import Summarizer
@@ -100,7 +110,6 @@ async def test_sentiment_description():
     print("✓ 情感描述映射正确")
 
 
-@pytest.mark.asyncio
 async def test_post_filtering():
     """测试帖子过滤"""
     from src.ai_analysis.summarizer import Summarizer
@@ -129,10 +138,27 @@ async def test_post_filtering():
     print("✓ 帖子过滤正确")
 
 
+async def test_post_filtering_accepts_post_objects(large_posts):
+    """测试帖子过滤支持 Post 对象"""
+    from src.ai_analysis.summarizer import Summarizer
+
+    summarizer = Summarizer()
+
+    filtered = summarizer._filter_posts(large_posts + [Post(content="Short")])
+
+    # 短帖子被过滤，其余转换为字典
+    assert 0 < len(filtered) <= len(large_posts)
+    for post in filtered:
+        assert post["platform"] == "reddit"
+        assert len(post["content"]) >= 50
+
+    print("✓ Post 对象过滤正确")
+
+
 # ============ Integration Tests ============
 
+@pytest.mark.slow_serial
 @pytest.mark.integration
-@pytest.mark.asyncio
 async def test_summarization_basic(sample_posts):
     """测试基础摘要生成"""
     from src.ai_analysis.summarizer import Summarizer
@@ -153,8 +179,8 @@ async def test_summarization_basic(sample_posts):
     print("✓ 基础摘要生成正常")
 
 
+@pytest.mark.slow_serial
 @pytest.mark.integration
-@pytest.mark.asyncio
 async def test_summarization_different_sentiments(sample_posts):
     """测试不同情感分数的摘要"""
     from src.ai_analysis.summarizer import Summarizer
@@ -176,12 +202,13 @@ async def test_summarization_different_sentiments(sample_posts):
 
 
 @pytest.mark.integration
-@pytest.mark.asyncio
 async def test_summarization_empty_posts():
     """测试空帖子列表"""
     from src.ai_analysis.summarizer import Summarizer
 
     summarizer = Summarizer()
+    calls_before = summarizer.client.get_token_summary()["api_calls"]
+
     summary = await summarizer.summarize_discussion([], 50.0)
 
     print(f"\n空帖子摘要: {summary}")
@@ -190,11 +217,13 @@ async def test_summarization_empty_posts():
     assert isinstance(summary, str)
     assert len(summary) > 0
 
+    # 空输入不应该产生 API 调用
+    assert summarizer.client.get_token_summary()["api_calls"] == calls_before
+
     print("✓ 空帖子处理正确")
 
 
 @pytest.mark.integration
-@pytest.mark.asyncio
 async def test_summarization_all_short_posts():
     """测试全是短帖子的场景"""
     from src.ai_analysis.summarizer import Summarizer
@@ -207,6 +236,8 @@ async def test_summarization_all_short_posts():
         {"content": "Okay"}
     ]
 
+    calls_before = summarizer.client.get_token_summary()["api_calls"]
+
     summary = await summarizer.summarize_discussion(short_posts, 50.0)
 
     print(f"\n短帖子摘要: {summary}")
@@ -214,11 +245,14 @@ async def test_summarization_all_short_posts():
     # 应该返回无法总结的消息
     assert isinstance(summary, str)
 
+    # 全部被过滤时不应该产生 API 调用
+    assert summarizer.client.get_token_summary()["api_calls"] == calls_before
+
     print("✓ 短帖子处理正确")
 
 
+@pytest.mark.slow_serial
 @pytest.mark.integration
-@pytest.mark.asyncio
 async def test_summarization_with_map_reduce():
     """测试 Map-Reduce 模式摘要"""
     from src.ai_analysis.summarizer import Summarizer
@@ -249,8 +283,8 @@ async def test_summarization_with_map_reduce():
     print("✓ Map-Reduce 摘要生成正常")
 
 
+@pytest.mark.slow_serial
 @pytest.mark.integration
-@pytest.mark.asyncio
 async def test_extract_key_points(sample_posts):
     """测试关键点提取"""
     from src.ai_analysis.summarizer import Summarizer
@@ -274,8 +308,8 @@ async def test_extract_key_points(sample_posts):
     print("✓ 关键点提取正常")
 
 
+@pytest.mark.slow_serial
 @pytest.mark.integration
-@pytest.mark.asyncio
 async def test_summarization_large_dataset(large_posts):
     """测试大数据集摘要"""
     from src.ai_analysis.summarizer import Summarizer
@@ -296,8 +330,8 @@ async def test_summarization_large_dataset(large_posts):
     print("✓ 大数据集摘要生成正常")
 
 
+@pytest.mark.slow_serial
 @pytest.mark.integration
-@pytest.mark.asyncio
 async def test_summarization_diverse_opinions(diverse_posts):
     """测试多样化观点的摘要"""
     from src.ai_analysis.summarizer import Summarizer
@@ -320,8 +354,8 @@ async def test_summarization_diverse_opinions(diverse_posts):
     print("✓ 多样化观点摘要生成正常")
 
 
+@pytest.mark.slow_serial
 @pytest.mark.integration
-@pytest.mark.asyncio
 async def test_summarization_token_tracking():
     """测试 Token 追踪"""
     from src.ai_analysis.summarizer import Summarizer
@@ -349,8 +383,8 @@ async def test_summarization_token_tracking():
     print("✓ Token 追踪功能正常")
 
 
+@pytest.mark.slow_serial
 @pytest.mark.integration
-@pytest.mark.asyncio
 async def test_summarization_quality():
     """测试摘要质量"""
     from src.ai_analysis.summarizer import Summarizer
@@ -382,9 +416,9 @@ async def test_summarization_quality():
 
 # ============ Performance Tests ============
 
+@pytest.mark.slow_serial
 @pytest.mark.performance
 @pytest.mark.integration
-@pytest.mark.asyncio
 async def test_summarization_performance():
     """测试摘要生成性能"""
     import time
@@ -413,6 +447,97 @@ async def test_summarization_performance():
     print("✓ 性能测试完成")
 
 
+# ============ Parallel Integration Suite ============
+
+@pytest.mark.integration
+async def test_full_suite_parallel(sample_posts, diverse_posts, large_posts):
+    """并发执行全部集成用例的 LLM 调用，再逐项断言（耗时约等于最慢的一次调用）"""
+    import time
+    from src.ai_analysis.summarizer import Summarizer
+
+    summarizer = Summarizer()
+    calls_before = summarizer.client.get_token_summary()["api_calls"]
+
+    long_posts = [
+        {"content": f"This is post {i} with enough content to be considered. " * 20}
+        for i in range(30)
+    ]
+    themed_posts = [
+        {"content": "The battery life is excellent, lasts all day"},
+        {"content": "Great battery performance, very satisfied"},
+        {"content": "Battery could be better, drains quickly"},
+        {"content": "The build quality feels premium and sturdy"},
+        {"content": "Cheap materials, poor construction quality"},
+    ]
+    small_posts = [{"content": f"Test post {i}"} for i in range(5)]
+    medium_posts = [{"content": f"Test post {i} with more content. " * 10} for i in range(20)]
+
+    async def timed(coro):
+        start = time.time()
+        result = await coro
+        return result, time.time() - start
+
+    cases = {
+        "basic": summarizer.summarize_discussion(sample_posts, 75.0),
+        "sentiment_20": summarizer.summarize_discussion(sample_posts, 20.0),
+        "sentiment_50": summarizer.summarize_discussion(sample_posts, 50.0),
+        "sentiment_80": summarizer.summarize_discussion(sample_posts, 80.0),
+        "large": summarizer.summarize_discussion(large_posts, 55.0),
+        "diverse": summarizer.summarize_discussion(diverse_posts, 50.0),
+        "quality": summarizer.summarize_discussion(themed_posts, 60.0),
+        "empty": summarizer.summarize_discussion([], 50.0),
+        "all_short": summarizer.summarize_discussion(
+            [{"content": "Good"}, {"content": "Bad"}, {"content": "Okay"}], 50.0
+        ),
+        "map_reduce": summarizer.summarize_discussion(long_posts, 60.0, use_map_reduce=True),
+        "token_tracking": summarizer.summarize_discussion(sample_posts, 60.0),
+        "key_points": summarizer.extract_key_points(sample_posts, max_points=5),
+        "perf_small": timed(summarizer.summarize_discussion(small_posts, 50.0)),
+        "perf_medium": timed(summarizer.summarize_discussion(medium_posts, 50.0)),
+    }
+
+    start = time.time()
+    results = dict(zip(cases, await asyncio.gather(*cases.values())))
+    print(f"\n并发执行 {len(cases)} 个用例耗时: {time.time() - start:.2f}s")
+
+    # 基础摘要
+    assert isinstance(results["basic"], str), "应该返回字符串"
+    assert 50 < len(results["basic"]) < 5000, "摘要长度应该合理"
+
+    # 不同情感分数
+    for key in ("sentiment_20", "sentiment_50", "sentiment_80"):
+        assert isinstance(results[key], str)
+        assert len(results[key]) > 0
+
+    # 大数据集 / 多样化观点 / Map-Reduce
+    assert len(results["large"]) > 100
+    assert len(results["diverse"]) > 50
+    assert len(results["map_reduce"]) > 50
+
+    # 摘要质量
+    assert 100 < len(results["quality"]) < 2000, "摘要长度应该合理"
+    assert not results["quality"].startswith(("-", "*")), "不应该以列表形式呈现"
+
+    # 空帖子 / 短帖子返回默认消息
+    assert isinstance(results["empty"], str) and len(results["empty"]) > 0
+    assert isinstance(results["all_short"], str)
+
+    # 关键点
+    key_points = results["key_points"]
+    assert isinstance(key_points, list)
+    assert len(key_points) <= 5
+    assert all(isinstance(p, str) and len(p) > 0 for p in key_points)
+
+    # Token 追踪
+    stats = summarizer.client.get_token_summary()
+    assert stats["api_calls"] > calls_before
+    assert stats["total_tokens"] > 0
+
+    print(f"小数据集摘要耗时 (5条): {results['perf_small'][1]:.2f}s")
+    print(f"中等数据集摘要耗时 (20条): {results['perf_medium'][1]:.2f}s")
+    print("✓ 并发集成套件通过")
+
+
 # ============ Main Function ============
 
 async def run_all_tests():
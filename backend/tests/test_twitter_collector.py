@@ -1,43 +1,48 @@
 """
-Tests for Twitter/X data collector using Playwright.
+Tests for Twitter/X data collector, with the Selenium driver and browser pool mocked.
 """
 import asyncio
-from unittest.mock import Mock, MagicMock, AsyncMock, patch
+from contextlib import nullcontext
+from unittest.mock import Mock, MagicMock, AsyncMock, PropertyMock, patch
 import pytest
 
 from src.collectors.twitter import TwitterCollector
-from src.collectors.base import PostData
+from src.collectors.base import PostBatch, PostData
 
 
-class TestTwitterCollector:
-    """Test suite for TwitterCollector."""
+@pytest.fixture(scope="module")
+def driver_mock_factory():
+    """
+    Build mock WebDrivers for the Selenium scraping path.
 
-    @pytest.fixture
-    def collector(self):
-        """Create a TwitterCollector instance for testing."""
-        config = {"TWITTER_BEARER_TOKEN": "test_token"}
-        return TwitterCollector(config)
+    Module-scoped: the script dispatch is set up once and each call only
+    creates a plain Mock (no AsyncMock trees).
+    """
+    from src.collectors.twitter import _EXTRACT_ALL_JS
 
-    @pytest.fixture
-    def mock_page(self):
-        """Create a mock Playwright page object."""
-        page = AsyncMock()
-        page.goto = AsyncMock()
-        page.query_selector_all = AsyncMock()
-        page.evaluate = AsyncMock()
-        return page
-
-    @pytest.fixture
-    def mock_browser(self):
-        """Create a mock Playwright browser object."""
-        browser = AsyncMock()
-        browser.close = AsyncMock()
+    def make(rows=None, heights=None, get_side_effect=None):
+        """
+        rows is either one list (every extraction) or a list of lists
+        (one per scroll); heights are successive scrollHeight values.
+        """
+        rows = rows or []
+        batches = rows if rows and isinstance(rows[0], list) else [rows]
+        batch_iter = iter(batches)
+        height_iter = iter(heights or [0])
+
+        def execute_script(script, *args):
+            if script == _EXTRACT_ALL_JS:
+                return next(batch_iter, batches[-1])[:args[0] if args else None]
+            if script.startswith("return document.body.scrollHeight"):
+                return next(height_iter, 0)
+            return None
 
-        context = AsyncMock()
-        context.new_page = AsyncMock()
+        driver = Mock()
+        driver.execute_script = Mock(side_effect=execute_script)
+        driver.get = Mock(side_effect=get_side_effect)
+        return driver
 
-        browser.new_context = AsyncMock(return_value=context)
-        return browser
+    return make
 
 
 class TestMetricParsing:
@@ -99,113 +104,21 @@ class TestMetricParsing:
         result = collector._parse_metric("")
         assert result == 0
 
+    def test_parse_metrics_bulk(self, collector):
+        """Test bulk parsing returns an int64 array matching _parse_metric."""
+        texts = ["123", "10.5K", "2.5M", "", "invalid"]
 
-class TestExtractMetrics:
-    """Test suite for _extract_metrics method."""
-
-    @pytest.fixture
-    def collector(self):
-        """Create a TwitterCollector instance for testing."""
-        config = {}
-        return TwitterCollector(config)
-
-    @pytest.mark.asyncio
-    async def test_extract_likes(self, collector):
-        """Test extracting likes count."""
-        mock_tweet = AsyncMock()
-
-        # Mock like element
-        mock_like_element = AsyncMock()
-        mock_like_element.inner_text = AsyncMock(return_value="42")
-        mock_tweet.query_selector = AsyncMock(return_value=mock_like_element)
-
-        result = await collector._extract_metrics(mock_tweet)
-
-        assert result["likes"] == 42
-
-    @pytest.mark.asyncio
-    async def test_extract_retweets(self, collector):
-        """Test extracting retweet count."""
-        mock_tweet = AsyncMock()
-
-        # Mock retweet element
-        mock_retweet_element = AsyncMock()
-        mock_retweet_element.inner_text = AsyncMock(return_value="15")
-        mock_tweet.query_selector = AsyncMock(return_value=mock_retweet_element)
-
-        result = await collector._extract_metrics(mock_tweet)
-
-        assert result["retweets"] == 15
-
-    @pytest.mark.asyncio
-    async def test_extract_replies(self, collector):
-        """Test extracting reply count."""
-        mock_tweet = AsyncMock()
-
-        # Mock reply element
-        mock_reply_element = AsyncMock()
-        mock_reply_element.inner_text = AsyncMock(return_value="8")
-        mock_tweet.query_selector = AsyncMock(return_value=mock_reply_element)
-
-        result = await collector._extract_metrics(mock_tweet)
-
-        assert result["replies"] == 8
-
-    @pytest.mark.asyncio
-    async def test_extract_all_metrics(self, collector):
-        """Test extracting all metrics at once."""
-        from unittest.mock import Mock
-
-        mock_tweet = Mock()
-
-        # Create metric elements
-        mock_like_element = Mock()
-        mock_like_element.inner_text = AsyncMock(return_value="100K")
-
-        mock_retweet_element = Mock()
-        mock_retweet_element.inner_text = AsyncMock(return_value="5.2K")
+        result = collector._parse_metrics_bulk(texts)
 
-        mock_reply_element = Mock()
-        mock_reply_element.inner_text = AsyncMock(return_value="234")
+        assert result.dtype.name == "int64"
+        assert result.tolist() == [collector._parse_metric(t) for t in texts]
+        assert collector._parse_metrics_bulk([]).shape == (0,)
 
-        async def mock_query_selector(selector):
-            if "like" in selector:
-                return mock_like_element
-            elif "retweet" in selector:
-                return mock_retweet_element
-            elif "reply" in selector:
-                return mock_reply_element
-            return None
-
-        mock_tweet.query_selector = mock_query_selector
-
-        result = await collector._extract_metrics(mock_tweet)
-
-        assert result["likes"] == 100000
-        assert result["retweets"] == 5200
-        assert result["replies"] == 234
-
-    @pytest.mark.asyncio
-    async def test_extract_metrics_missing_elements(self, collector):
-        """Test when metric elements are missing."""
-        mock_tweet = AsyncMock()
-        mock_tweet.query_selector = AsyncMock(return_value=None)
-
-        result = await collector._extract_metrics(mock_tweet)
-
-        # Should return empty dict or dict with default values
-        assert isinstance(result, dict)
-
-    @pytest.mark.asyncio
-    async def test_extract_metrics_exception_handling(self, collector):
-        """Test exception handling during metric extraction."""
-        mock_tweet = AsyncMock()
-        mock_tweet.query_selector = AsyncMock(side_effect=Exception("Selector error"))
-
-        result = await collector._extract_metrics(mock_tweet)
-
-        # Should handle exception gracefully
-        assert isinstance(result, dict)
+    def test_parse_metric_malformed_suffix(self, collector):
+        """Test that malformed metric text returns 0 instead of raising."""
+        assert collector._parse_metric("1.2.3K") == 0
+        assert collector._parse_metric("12 likes") == 0
+        assert collector._parse_metric("K") == 0
 
 
 class TestExtractTweets:
@@ -217,173 +130,159 @@ class TestExtractTweets:
         config = {}
         return TwitterCollector(config)
 
-    @pytest.mark.asyncio
-    async def test_extract_single_tweet(self, collector):
-        """Test extracting a single tweet."""
-        mock_page = Mock()
-        mock_page.evaluate = AsyncMock()
-
-        # Create mock tweet
-        mock_tweet = self._create_mock_tweet(
-            text="This is a test tweet",
-            author="Test User",
-            url="https://twitter.com/test/status/123"
-        )
+    @pytest.fixture(autouse=True)
+    def no_sleep(self):
+        """Skip the real scroll delay."""
+        with patch("src.collectors.twitter.time.sleep"):
+            yield
 
-        mock_page.query_selector_all = AsyncMock(return_value=[mock_tweet])
-        mock_page.query_selector = AsyncMock(return_value=None)
+    def test_extract_single_tweet(self, collector, driver_mock_factory):
+        """Test extracting a single tweet."""
+        mock_driver = driver_mock_factory([
+            self._create_row(
+                text="This is a test tweet",
+                author="Test User",
+                url="https://twitter.com/test/status/123"
+            )
+        ])
 
-        posts = await collector._extract_tweets(mock_page, limit=10)
+        posts = collector._extract_tweets(mock_driver, limit=10)
 
         assert len(posts) == 1
         assert posts[0].content == "This is a test tweet"
         assert posts[0].author == "Test User"
         assert posts[0].url == "https://twitter.com/test/status/123"
         assert posts[0].platform == "twitter"
+        assert posts[0].likes == 1200
 
-    @pytest.mark.asyncio
-    async def test_extract_multiple_tweets(self, collector):
+    def test_extract_multiple_tweets(self, collector, driver_mock_factory):
         """Test extracting multiple tweets."""
-        mock_page = Mock()
-        mock_page.evaluate = AsyncMock()
-
-        # Create mock tweets
-        mock_tweets = [
-            self._create_mock_tweet(
+        mock_driver = driver_mock_factory([
+            self._create_row(
                 text=f"Tweet number {i}",
                 author=f"User {i}",
                 url=f"https://twitter.com/test/status/{i}"
             )
             for i in range(1, 6)
-        ]
+        ])
 
-        mock_page.query_selector_all = AsyncMock(return_value=mock_tweets)
-        mock_page.query_selector = AsyncMock(return_value=None)
-
-        posts = await collector._extract_tweets(mock_page, limit=10)
+        posts = collector._extract_tweets(mock_driver, limit=10)
 
         assert len(posts) == 5
         for i, post in enumerate(posts):
             assert post.content == f"Tweet number {i + 1}"
             assert post.author == f"User {i + 1}"
 
-    @pytest.mark.asyncio
-    async def test_extract_tweets_respects_limit(self, collector):
+    def test_extract_tweets_respects_limit(self, collector, driver_mock_factory):
         """Test that limit parameter is respected."""
-        mock_page = Mock()
-        mock_page.evaluate = AsyncMock()
-
-        # Create more tweets than limit
-        mock_tweets = [
-            self._create_mock_tweet(text=f"Tweet {i}", author="User", url=f"url{i}")
+        mock_driver = driver_mock_factory([
+            self._create_row(text=f"Tweet {i}", author="User", url=f"url{i}")
             for i in range(10)
-        ]
+        ])
+
+        posts = collector._extract_tweets(mock_driver, limit=3)
+
+        assert len(posts) == 3
+
+    def test_extract_tweets_caps_rows_read(self, collector, driver_mock_factory):
+        """Test that the extraction script only walks as far as the limit needs."""
+        from src.collectors.twitter import _EXTRACT_ALL_JS
 
-        mock_page.query_selector_all = AsyncMock(return_value=mock_tweets)
-        mock_page.query_selector = AsyncMock(return_value=None)
+        mock_driver = driver_mock_factory([
+            self._create_row(text=f"Tweet {i}", author="User", url=f"url{i}")
+            for i in range(50)
+        ])
 
-        posts = await collector._extract_tweets(mock_page, limit=3)
+        posts = collector._extract_tweets(mock_driver, limit=3)
 
         assert len(posts) == 3
+        mock_driver.execute_script.assert_any_call(_EXTRACT_ALL_JS, 6)
 
-    @pytest.mark.asyncio
-    async def test_extract_tweets_filters_spam(self, collector):
+    def test_extract_tweets_filters_spam(self, collector, driver_mock_factory):
         """Test that spam tweets are filtered out."""
-        mock_page = Mock()
-        mock_page.evaluate = AsyncMock()
-
-        # Create mix of spam and valid tweets
-        mock_tweets = [
-            self._create_mock_tweet(text="Valid tweet about something", author="User1", url="url1"),
-            self._create_mock_tweet(text="buy now click here limited time", author="Spammer", url="url2"),
-            self._create_mock_tweet(text="Another valid tweet", author="User2", url="url3"),
-        ]
-
-        mock_page.query_selector_all = AsyncMock(return_value=mock_tweets)
-        mock_page.query_selector = AsyncMock(return_value=None)
+        mock_driver = driver_mock_factory([
+            self._create_row(text="Valid tweet about something", author="User1", url="url1"),
+            self._create_row(text="buy now click here limited time", author="Spammer", url="url2"),
+            self._create_row(text="Another valid tweet", author="User2", url="url3"),
+        ])
 
-        posts = await collector._extract_tweets(mock_page, limit=10)
+        posts = collector._extract_tweets(mock_driver, limit=10)
 
         # Should only return non-spam tweets
         assert len(posts) == 2
         assert all("buy now" not in post.content for post in posts)
 
-    @pytest.mark.asyncio
-    async def test_extract_tweets_handles_missing_text(self, collector):
-        """Test handling when tweet text element is missing."""
-        mock_page = Mock()
-        mock_page.evaluate = AsyncMock()
+    def test_extract_tweets_dedupes_across_scrolls(self, collector, driver_mock_factory):
+        """Test that tweets still rendered after a scroll aren't collected twice."""
+        first = [self._create_row(text=f"Tweet {i}", author="User", url=f"url{i}") for i in range(3)]
+        second = first[1:] + [self._create_row(text="Tweet 3", author="User", url="url3")]
+        mock_driver = driver_mock_factory([first, second], heights=[1000, 2000, 2000])
 
-        # Create tweet with missing text element
-        mock_tweet = AsyncMock()
-        mock_tweet.query_selector = AsyncMock(return_value=None)
+        posts = collector._extract_tweets(mock_driver, limit=10)
 
-        mock_page.query_selector_all = AsyncMock(return_value=[mock_tweet])
+        assert [p.url for p in posts] == ["url0", "url1", "url2", "url3"]
+
+    def test_extract_tweets_handles_missing_text(self, collector, driver_mock_factory):
+        """Test handling when tweet text element is missing."""
+        row = self._create_row(text=None, author="User", url="url1")
+        mock_driver = driver_mock_factory([row])
 
-        posts = await collector._extract_tweets(mock_page, limit=10)
+        posts = collector._extract_tweets(mock_driver, limit=10)
 
         # Should skip tweets without text
         assert len(posts) == 0
 
-    @pytest.mark.asyncio
-    async def test_extract_tweets_handles_exceptions(self, collector):
+    def test_extract_tweets_handles_exceptions(self, collector, driver_mock_factory):
         """Test exception handling during tweet extraction."""
-        mock_page = Mock()
-        mock_page.evaluate = AsyncMock()
-
-        # Create tweet that raises exception
-        mock_tweet = AsyncMock()
-        mock_tweet.query_selector = AsyncMock(side_effect=Exception("Extraction error"))
-
-        mock_page.query_selector_all = AsyncMock(return_value=[mock_tweet])
+        bad_row = Mock()
+        bad_row.get = Mock(side_effect=Exception("Extraction error"))
+        mock_driver = driver_mock_factory([bad_row])
 
-        posts = await collector._extract_tweets(mock_page, limit=10)
+        posts = collector._extract_tweets(mock_driver, limit=10)
 
         # Should handle exception gracefully
         assert isinstance(posts, list)
 
-    @pytest.mark.asyncio
-    async def test_extract_tweets_scrolls_page(self, collector):
+    def test_extract_tweets_scrolls_page(self, collector, driver_mock_factory):
         """Test that page is scrolled to load more tweets."""
-        mock_page = Mock()
-        mock_page.query_selector_all = AsyncMock(return_value=[])
-        mock_page.evaluate = AsyncMock()
-
-        await collector._extract_tweets(mock_page, limit=10)
+        mock_driver = driver_mock_factory([])
 
-        # Verify scroll was called multiple times
-        assert mock_page.evaluate.call_count == 3
+        collector._extract_tweets(mock_driver, limit=10)
 
-    def _create_mock_tweet(self, text: str, author: str, url: str):
-        """Helper to create a mock tweet element."""
-        from unittest.mock import Mock
+        # One extraction, one scroll, one height check before hitting bottom
+        assert mock_driver.execute_script.call_count == 3
 
-        mock_tweet = Mock()
+    def test_extract_tweets_overlaps_scroll_with_processing(self, collector, driver_mock_factory):
+        """Test that the next scroll is issued before the batch is processed."""
+        from src.collectors.twitter import _EXTRACT_ALL_JS
 
-        # Mock text element
-        mock_text_element = Mock()
-        mock_text_element.inner_text = AsyncMock(return_value=text)
-
-        # Mock author element
-        mock_author_element = Mock()
-        mock_author_element.inner_text = AsyncMock(return_value=author)
+        mock_driver = driver_mock_factory(
+            [self._create_row(text="Tweet 0", author="User", url="url0")]
+        )
+        order = []
+        original = mock_driver.execute_script.side_effect
 
-        # Mock link element
-        mock_link_element = Mock()
-        mock_link_element.evaluate = AsyncMock(return_value=url)
+        def record(script, *args):
+            order.append("extract" if script == _EXTRACT_ALL_JS else script.split()[0])
+            return original(script, *args)
 
-        async def mock_query_selector(selector):
-            if "tweetText" in selector:
-                return mock_text_element
-            elif "User-Name" in selector:
-                return mock_author_element
-            elif "time" in selector:
-                return mock_link_element
-            return None
+        mock_driver.execute_script.side_effect = record
+        with patch.object(collector, "clean_content", side_effect=lambda t: order.append("process") or t):
+            collector._extract_tweets(mock_driver, limit=10)
 
-        mock_tweet.query_selector = mock_query_selector
+        assert order[:3] == ["extract", "window.scrollTo(0,", "process"]
 
-        return mock_tweet
+    def _create_row(self, text, author: str, url: str, likes: str = "1.2K"):
+        """Helper to create a row as returned by the extraction script."""
+        return {
+            "text": text,
+            "author": author,
+            "timestamp": "2025-01-01T00:00:00.000Z",
+            "url": url,
+            "likes": likes,
+            "retweets": "3",
+            "replies": "4",
+        }
 
 
 class TestSearchMethod:
@@ -395,104 +294,223 @@ class TestSearchMethod:
         config = {}
         return TwitterCollector(config)
 
-    @pytest.mark.asyncio
-    async def test_search_basic(self, collector):
+    @pytest.fixture
+    def mock_driver(self, driver_mock_factory):
+        """Create a mock WebDriver with an empty result page."""
+        return driver_mock_factory()
+
+    @pytest.fixture
+    def mock_pool(self, mock_driver):
+        """Patch BrowserPool.instance with a pool handing out mock_driver."""
+        pool = Mock()
+        pool.acquire = Mock(side_effect=lambda launcher: nullcontext(mock_driver))
+        with patch("src.collectors.twitter.BrowserPool.instance", return_value=pool), \
+                patch("src.collectors.twitter.time.sleep"):
+            yield pool
+
+    async def test_user_agent_applied_per_search(self, mock_pool, mock_driver):
+        """Test that each search sets its collector's UA on the shared pooled browser."""
+        first = TwitterCollector({})
+        second = TwitterCollector({})
+        second.user_agent = "Mozilla/5.0 (Test) Second"
+
+        await first.search("test", language="en", limit=1)
+        await second.search("test", language="en", limit=1)
+
+        overrides = [
+            call.args[1]["userAgent"]
+            for call in mock_driver.execute_cdp_cmd.call_args_list
+            if call.args[0] == "Network.setUserAgentOverride"
+        ]
+        assert overrides == [first.user_agent, "Mozilla/5.0 (Test) Second"]
+
+    async def test_search_basic(self, collector, mock_pool, mock_driver):
         """Test basic search functionality."""
-        with patch("src.collectors.twitter.async_playwright") as mock_playwright:
-            # Setup mock browser
-            mock_browser = AsyncMock()
-            mock_context = AsyncMock()
-            mock_page = Mock()
-
-            mock_context.new_page = AsyncMock(return_value=mock_page)
-            mock_browser.new_context = AsyncMock(return_value=mock_context)
-            mock_browser.close = AsyncMock()
-
-            # Setup mock playwright
-            mock_p = AsyncMock()
-            mock_p.chromium.launch = AsyncMock(return_value=mock_browser)
-            mock_playwright.return_value.__aenter__.return_value = mock_p
-
-            # Setup mock page
-            mock_page.goto = AsyncMock()
-            mock_page.query_selector_all = AsyncMock(return_value=[])
-            mock_page.evaluate = AsyncMock()
-
-            # Execute search
-            results = await collector.search("test keyword", language="en", limit=10)
-
-            # Verify browser was launched with anti-detection settings
-            mock_p.chromium.launch.assert_called_once()
-            call_kwargs = mock_p.chromium.launch.call_args[1]
-            assert call_kwargs["headless"] is True
-            assert "--disable-blink-features=AutomationControlled" in call_kwargs["args"]
-
-            # Verify context was created with custom user agent
-            mock_browser.new_context.assert_called_once()
-            context_kwargs = mock_browser.new_context.call_args[1]
-            assert "user_agent" in context_kwargs
-            assert "viewport" in context_kwargs
-
-            # Verify page navigation
-            mock_page.goto.assert_called_once()
-
-            # Verify results structure
-            assert isinstance(results, list)
+        results = await collector.search("test keyword", language="en", limit=10)
 
-    @pytest.mark.asyncio
-    async def test_search_handles_navigation_error(self, collector):
+        # Browser comes from the pool, launched with the collector's settings
+        mock_pool.acquire.assert_called_once_with(collector._launch_chrome_browser)
+
+        # Verify page navigation
+        mock_driver.get.assert_called_once()
+
+        # Pooled browser must stay open for the next search
+        mock_driver.quit.assert_not_called()
+
+        # Verify results structure
+        assert isinstance(results, list)
+
+    async def test_search_reuses_pooled_browser(self, collector, mock_pool, mock_driver):
+        """Test that consecutive searches share one browser."""
+        await collector.search("first", language="en", limit=5)
+        await collector.search("second", language="en", limit=5)
+
+        assert mock_pool.acquire.call_count == 2
+        assert mock_driver.get.call_count == 2
+
+    async def test_search_handles_navigation_error(self, collector, mock_pool, mock_driver):
         """Test handling of navigation errors."""
-        with patch("src.collectors.twitter.async_playwright") as mock_playwright:
-            # Setup mock browser
-            mock_browser = AsyncMock()
-            mock_context = AsyncMock()
-            mock_page = Mock()
+        mock_driver.get.side_effect = Exception("Network error")
 
-            mock_context.new_page = AsyncMock(return_value=mock_page)
-            mock_browser.new_context = AsyncMock(return_value=mock_context)
-            mock_browser.close = AsyncMock()
+        # Execute search
+        results = await collector.search("test", language="en", limit=10)
 
-            # Setup mock playwright
-            mock_p = AsyncMock()
-            mock_p.chromium.launch = AsyncMock(return_value=mock_browser)
-            mock_playwright.return_value.__aenter__.return_value = mock_p
+        # Should return empty list on error
+        assert results == []
 
-            # Mock navigation error
-            mock_page.goto = AsyncMock(side_effect=Exception("Network error"))
+    async def test_concurrent_searches_are_bounded(self):
+        """Test that 32 concurrent searches never exceed MAX_CONCURRENCY."""
+        import threading
+        import time
 
-            # Execute search
-            results = await collector.search("test", language="en", limit=10)
+        collector = TwitterCollector({"MAX_CONCURRENCY": 4})
+        active, peak, lock = 0, 0, threading.Lock()
 
-            # Should return empty list on error
-            assert results == []
+        def fake_search_sync(keyword, language, limit):
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            assert collector._sem._value >= 0
+            time.sleep(0.01)
+            with lock:
+                active -= 1
+            return []
 
-    @pytest.mark.asyncio
-    async def test_search_builds_correct_url(self, collector):
+        with patch.object(collector, "_search_sync", side_effect=fake_search_sync):
+            results = await asyncio.gather(*(collector.search(f"kw{i}") for i in range(32)))
+
+        assert len(results) == 32
+        assert peak <= 4
+        assert collector._sem._value == 4
+
+    async def test_search_builds_correct_url(self, collector, mock_pool, mock_driver):
         """Test that search URL is built correctly."""
-        with patch("src.collectors.twitter.async_playwright") as mock_playwright:
-            mock_browser = AsyncMock()
-            mock_context = AsyncMock()
-            mock_page = Mock()
+        await collector.search("AI technology", language="en", limit=10)
+
+        # Verify URL encoding
+        called_url = mock_driver.get.call_args[0][0]
+        assert "AI%20technology" in called_url
+        assert "x.com/search" in called_url
+        assert "lang=en" in called_url
+
+
+class TestPostBatch:
+    """Test suite for the column-oriented PostBatch."""
+
+    @pytest.fixture
+    def posts(self):
+        """Create a few PostData objects."""
+        return [
+            PostData(platform="twitter", post_id=str(i), author=f"User {i}", content=f"Tweet {i}",
+                     url=f"url{i}", likes=i * 10, shares=i, comments_count=i * 2,
+                     created_at="2025-01-01T00:00:00.000Z")
+            for i in range(5)
+        ]
+
+    def test_round_trip(self, posts):
+        """Test that to_list restores the original posts."""
+        batch = PostBatch.from_posts(posts, platform="twitter")
+
+        assert len(batch) == 5
+        assert batch.to_list() == posts
+
+    def test_post_data_is_slotted_and_frozen(self, posts):
+        """Test that PostData has no __dict__ and rejects mutation."""
+        import dataclasses
+
+        post = posts[0]
+        assert not hasattr(post, "__dict__")
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            post.likes = 1
+        assert dataclasses.replace(post, likes=1).likes == 1
+        assert hash(post) == hash(dataclasses.replace(post))
+
+    def test_metric_stats(self, posts):
+        """Test sum/mean/max summary of a metric column."""
+        batch = PostBatch.from_posts(posts, platform="twitter")
 
-            mock_context.new_page = AsyncMock(return_value=mock_page)
-            mock_browser.new_context = AsyncMock(return_value=mock_context)
-            mock_browser.close = AsyncMock()
+        assert batch.metric_stats("likes") == (100, 20.0, 40)
+        assert PostBatch.from_posts([], platform="twitter").metric_stats("likes") == (0, 0.0, 0)
 
-            mock_p = AsyncMock()
-            mock_p.chromium.launch = AsyncMock(return_value=mock_browser)
-            mock_playwright.return_value.__aenter__.return_value = mock_p
+    def test_vectorized_totals(self, posts):
+        """Test metric columns are int32 arrays usable for reductions."""
+        batch = PostBatch.from_posts(posts, platform="twitter")
 
-            mock_page.goto = AsyncMock()
-            mock_page.query_selector_all = AsyncMock(return_value=[])
-            mock_page.evaluate = AsyncMock()
+        assert batch.likes.dtype.name == "int32"
+        assert int(batch.likes.sum()) == sum(p.likes for p in posts)
+        assert int(batch.comments_count.sum()) == sum(p.comments_count for p in posts)
 
-            # Execute search
-            await collector.search("AI technology", language="en", limit=10)
+    async def test_search_returns_batch_when_soa(self, posts):
+        """Test that config["soa"] makes search return a PostBatch."""
+        collector = TwitterCollector({"soa": True})
 
-            # Verify URL encoding
-            called_url = mock_page.goto.call_args[0][0]
-            assert "AI" in called_url or "ai" in called_url.lower()
-            assert "twitter.com/search" in called_url
+        with patch.object(collector, "_search_sync", return_value=posts):
+            result = await collector.search("test", limit=5)
+
+        assert isinstance(result, PostBatch)
+        assert result.to_list() == posts
+
+
+class TestBrowserPool:
+    """Test suite for BrowserPool."""
+
+    @pytest.fixture
+    def pool(self):
+        """Create a fresh (non-singleton) BrowserPool."""
+        from src.collectors.browser_pool import BrowserPool
+        return BrowserPool()
+
+    def test_instance_is_singleton(self):
+        """Test that instance() returns the same pool."""
+        from src.collectors.browser_pool import BrowserPool
+        assert BrowserPool.instance() is BrowserPool.instance()
+
+    def test_launches_once_across_acquires(self, pool):
+        """Test that the browser is launched once and reused."""
+        launcher = Mock(return_value=Mock())
+
+        with pool.acquire(launcher) as first:
+            pass
+        with pool.acquire(launcher) as second:
+            pass
+
+        assert first is second
+        launcher.assert_called_once()
+
+    def test_warmup_launches_browser(self, pool):
+        """Test that warmup launches before the first acquire."""
+        launcher = Mock(return_value=Mock())
+
+        pool.warmup(launcher)
+        with pool.acquire(launcher):
+            pass
+
+        launcher.assert_called_once()
+
+    def test_relaunches_crashed_browser(self, pool):
+        """Test that an unresponsive browser is replaced."""
+        from selenium.common.exceptions import WebDriverException
+
+        dead, fresh = Mock(), Mock()
+        type(dead).current_url = PropertyMock(side_effect=WebDriverException("gone"))
+        launcher = Mock(side_effect=[dead, fresh])
+
+        with pool.acquire(launcher):
+            pass
+        with pool.acquire(launcher) as driver:
+            assert driver is fresh
+
+        dead.quit.assert_called_once()
+
+    def test_close_quits_browser(self, pool):
+        """Test that close shuts the pooled browser down."""
+        driver = Mock()
+        pool.warmup(Mock(return_value=driver))
+
+        pool.close()
+
+        driver.quit.assert_called_once()
 
 
 class TestSpamDetection:
@@ -532,6 +550,11 @@ class TestSpamDetection:
         """Test that spam detection is case insensitive."""
         assert collector.is_spam("BUY NOW LIMITED TIME")
 
+    def test_spam_detection_mixed_case_indicator(self, collector):
+        """Test that mixed-case indicators like 'DM me' match any casing."""
+        assert collector.is_spam("dm me for details")
+        assert collector.is_spam("Dm Me now")
+
 
 class TestContentCleaning:
     """Test suite for clean_content method (inherited from BaseCollector)."""
@@ -647,32 +670,188 @@ class TestAntiDetection:
         ua = collector.user_agent
         assert "Macintosh" in ua
 
-    @pytest.mark.asyncio
-    async def test_browser_launch_args(self, collector):
-        """Test that browser launch includes anti-detection arguments."""
-        with patch("src.collectors.twitter.async_playwright") as mock_playwright:
-            mock_browser = AsyncMock()
-            mock_context = AsyncMock()
-            mock_page = Mock()
+    def test_user_agent_is_shared_by_default(self, collector):
+        """Test that the default UA is a class attribute, not per-instance state."""
+        assert "user_agent" not in vars(collector)
+        assert collector.user_agent == TwitterCollector.user_agent
+
+    def test_default_concurrency(self):
+        """Test that Selenium searches run one at a time while HTTP ones overlap."""
+        from src.collectors.twitter_http import AiohttpTwitterCollector
 
-            mock_context.new_page = AsyncMock(return_value=mock_page)
-            mock_browser.new_context = AsyncMock(return_value=mock_context)
-            mock_browser.close = AsyncMock()
+        assert TwitterCollector({})._sem._value == 1
+        assert AiohttpTwitterCollector({})._sem._value == 8
 
-            mock_p = AsyncMock()
-            mock_p.chromium.launch = AsyncMock(return_value=mock_browser)
-            mock_playwright.return_value.__aenter__.return_value = mock_p
+    def test_user_agent_rotation(self):
+        """Test that rotate_ua picks a per-instance UA from the pool."""
+        from src.collectors.twitter import _UA_POOL
 
-            mock_page.goto = AsyncMock()
-            mock_page.query_selector_all = AsyncMock(return_value=[])
-            mock_page.evaluate = AsyncMock()
+        collector = TwitterCollector({"rotate_ua": True})
 
-            # Run search (will trigger browser launch)
-            await collector.search("test", language="en", limit=5)
+        assert "user_agent" in vars(collector)
+        assert collector.user_agent in _UA_POOL
+
+    def test_browser_launch_args(self, collector):
+        """Test that browser launch includes anti-detection arguments."""
+        with patch("src.collectors.twitter.webdriver.Chrome") as mock_chrome, \
+                patch("src.collectors.twitter.ChromeDriverManager"), \
+                patch("src.collectors.twitter.Service"):
+            collector._launch_chrome_browser()
 
             # Check launch arguments
-            launch_call = mock_p.chromium.launch.call_args
-            args = launch_call[1]["args"]
+            options = mock_chrome.call_args[1]["options"]
+            args = options.arguments
 
             assert "--disable-blink-features=AutomationControlled" in args
             assert "--no-sandbox" in args
+
+
+    def test_browser_skips_heavy_resources(self, collector):
+        """Test that images, fonts and stylesheets are blocked and loads return early."""
+        with patch("src.collectors.twitter.webdriver.Chrome") as mock_chrome, \
+                patch("src.collectors.twitter.ChromeDriverManager"), \
+                patch("src.collectors.twitter.Service"):
+            driver = collector._launch_chrome_browser()
+
+            options = mock_chrome.call_args[1]["options"]
+            assert options.page_load_strategy == "eager"
+            prefs = options.experimental_options["prefs"]
+            assert prefs["profile.managed_default_content_settings.images"] == 2
+
+            cdp_calls = dict(call.args for call in driver.execute_cdp_cmd.call_args_list)
+            patterns = cdp_calls["Network.setBlockedURLs"]["urls"]
+            assert "*.png" in patterns
+            assert "*.woff2" in patterns
+            assert "*.css" in patterns
+
+
+NITTER_PAGE = """
+<div class="timeline">
+  <div class="timeline-item">
+    <a class="tweet-link" href="/alice/status/111#m"></a>
+    <a class="fullname" href="/alice">Alice</a>
+    <span class="tweet-date"><a title="Jan 1, 2025 · 10:00 AM UTC">1h</a></span>
+    <div class="tweet-content media-body">Loving the new <a href="https://example.com">release</a></div>
+    <div class="tweet-stats">
+      <span class="tweet-stat"><div class="icon-container"><span class="icon-comment"></span> 12</div></span>
+      <span class="tweet-stat"><div class="icon-container"><span class="icon-retweet"></span> 1,234</div></span>
+      <span class="tweet-stat"><div class="icon-container"><span class="icon-heart"></span> 5.2K</div></span>
+    </div>
+  </div>
+  <div class="timeline-item">
+    <a class="tweet-link" href="/spammer/status/222#m"></a>
+    <a class="fullname" href="/spammer">Spammer</a>
+    <div class="tweet-content media-body">buy now click here</div>
+  </div>
+  <div class="show-more"><a href="?f=tweets&amp;q=test&amp;cursor=abc">Load more</a></div>
+</div>
+"""
+
+
+class TestAiohttpTwitterCollector:
+    """Test suite for the Nitter-based HTTP collector."""
+
+    @pytest.fixture
+    def collector(self):
+        """Create an AiohttpTwitterCollector instance for testing."""
+        from src.collectors.twitter_http import AiohttpTwitterCollector
+        return AiohttpTwitterCollector({"use_http": True})
+
+    @staticmethod
+    def _mock_get(pages, status=200):
+        """Build a replacement for ClientSession.get serving pages in order."""
+        responses = iter(pages)
+
+        def fake_get(self, url, **kwargs):
+            response = AsyncMock()
+            response.status = status
+            response.headers = {}
+            response.text = AsyncMock(return_value=next(responses, ""))
+            ctx = AsyncMock()
+            ctx.__aenter__.return_value = response
+            return ctx
+
+        return fake_get
+
+    def test_factory_selects_http_variant(self):
+        """Test that use_http selects the HTTP collector."""
+        from src.collectors.twitter_http import AiohttpTwitterCollector, create_twitter_collector
+
+        assert isinstance(create_twitter_collector({"use_http": True}), AiohttpTwitterCollector)
+        assert not isinstance(create_twitter_collector({}), AiohttpTwitterCollector)
+
+    def test_parse_search_page(self, collector):
+        """Test parsing tweets, metrics and cursor from a Nitter page."""
+        posts, cursor = collector._parse_search_page(NITTER_PAGE)
+
+        assert len(posts) == 1  # spam filtered
+        post = posts[0]
+        assert post.author == "Alice"
+        assert post.post_id == "111"
+        assert post.url == "https://x.com/alice/status/111"
+        assert post.content == "Loving the new release"
+        assert post.comments_count == 12
+        assert post.shares == 1234
+        assert post.likes == 5200
+        assert cursor == "?f=tweets&q=test&cursor=abc"
+
+    async def test_rate_limit_waits_until_reset(self, collector):
+        """Test that an exhausted rate-limit window pauses until reset."""
+        import time
+
+        headers = {"X-Rate-Limit-Remaining": "0", "X-Rate-Limit-Reset": str(int(time.time()) + 5)}
+        with patch("src.collectors.twitter_http.asyncio.sleep", new=AsyncMock()) as mock_sleep:
+            await collector._respect_rate_limit(headers)
+            await collector._respect_rate_limit({"X-Rate-Limit-Remaining": "10"})
+
+        mock_sleep.assert_awaited_once()
+        assert 0 < mock_sleep.await_args[0][0] <= 5
+
+    def test_spam_skips_remaining_fields(self, collector):
+        """Test that spam rows are dropped before metrics and cleaning run."""
+        from src.collectors import twitter_http
+
+        with patch.object(collector, "_parse_metric", wraps=collector._parse_metric) as parse, \
+                patch.object(collector, "clean_content", wraps=collector.clean_content) as clean:
+            posts, _ = collector._parse_search_page(NITTER_PAGE)
+
+        assert len(posts) == 1
+        assert clean.call_count == 1
+        assert parse.call_count == 3
+
+        rows, _ = twitter_http._extract_rows_bs4(NITTER_PAGE, skip=collector.is_spam)
+        assert [r["author"] for r in rows] == ["Alice"]
+
+    @pytest.mark.parametrize("html", [NITTER_PAGE, '<div class="timeline-none">No items found</div>', "<html></html>"])
+    def test_selectolax_and_bs4_parsers_agree(self, html):
+        """Test that the optional selectolax parser matches the bs4 fallback."""
+        from src.collectors import twitter_http
+
+        pytest.importorskip("selectolax")
+        assert twitter_http._extract_rows_selectolax(html) == twitter_http._extract_rows_bs4(html)
+
+    def test_parse_empty_results(self, collector):
+        """Test that an explicit empty timeline is not a parse failure."""
+        posts, cursor = collector._parse_search_page('<div class="timeline-none">No items found</div>')
+        assert posts == []
+        assert cursor is None
+
+    async def test_search_follows_cursor_until_limit(self, collector):
+        """Test that search pages through results with one shared session."""
+        with patch("aiohttp.ClientSession.get", self._mock_get([NITTER_PAGE, NITTER_PAGE])):
+            results = await collector.search("test", language="en", limit=2)
+        await collector.aclose()
+
+        assert len(results) == 2
+        assert all(isinstance(p, PostData) for p in results)
+
+    async def test_search_falls_back_on_parse_failure(self, collector):
+        """Test that an unrecognised page falls back to the browser scraper."""
+        fallback = AsyncMock(return_value=[])
+        with patch("aiohttp.ClientSession.get", self._mock_get(["<html>blocked</html>"])), \
+                patch.object(TwitterCollector, "_search", fallback):
+            results = await collector.search("test", language="en", limit=5)
+        await collector.aclose()
+
+        fallback.assert_awaited_once_with("test", "en", 5)
+        assert results == []
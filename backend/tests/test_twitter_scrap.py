@@ -17,6 +17,18 @@ from datetime import datetime
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
 from src.collectors.twitter import TwitterCollector
+from src.utils.event_loop import install_uvloop
+
+try:
+    import orjson
+
+    def _dumps_line(obj: dict) -> bytes:
+        """序列化为一行 JSONL（orjson 可用时更快）"""
+        return orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE)
+except ImportError:
+    def _dumps_line(obj: dict) -> bytes:
+        """序列化为一行 JSONL"""
+        return (json.dumps(obj, ensure_ascii=False) + "\n").encode("utf-8")
 
 
 async def test_twitter_collector():
@@ -26,8 +38,8 @@ async def test_twitter_collector():
     print("Twitter Collector 实际爬取测试")
     print("=" * 60)
 
-    # 配置
-    config = {}
+    # 配置（soa: 以列式 PostBatch 返回，统计可直接向量化）
+    config = {"soa": True}
     collector = TwitterCollector(config)
 
     # 测试参数
@@ -43,38 +55,33 @@ async def test_twitter_collector():
 
     try:
         # 执行爬取
-        posts = await collector.search(
+        batch = await collector.search(
             keyword=keyword,
             language=language,
             limit=limit
         )
 
-        print(f"\n✅ 爬取完成！共获取 {len(posts)} 条推文")
+        print(f"\n✅ 爬取完成！共获取 {len(batch)} 条推文")
         print("=" * 60)
 
-        if posts:
-            # 保存结果到 JSON 文件
+        if len(batch):
+            # 直接按列逐条写入 JSONL 文件（不重建 PostData 对象）
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            output_file = f"tweets_{keyword}_{timestamp}.json"
-
-            # 转换 PostData 对象为字典
-            posts_dict = [
-                {
-                    "platform": post.platform,
-                    "post_id": post.post_id,
-                    "author": post.author,
-                    "content": post.content,
-                    "url": post.url,
-                    "likes": post.likes,
-                    "shares": post.shares,
-                    "comments_count": post.comments_count,
-                    "created_at": post.created_at
-                }
-                for post in posts
-            ]
-
-            with open(output_file, 'w', encoding='utf-8') as f:
-                json.dump(posts_dict, f, ensure_ascii=False, indent=2)
+            output_file = f"tweets_{keyword}_{timestamp}.jsonl"
+
+            with open(output_file, 'wb') as f:
+                for i in range(len(batch)):
+                    f.write(_dumps_line({
+                        "platform": batch.platform,
+                        "post_id": batch.post_id[i],
+                        "author": batch.author[i],
+                        "content": batch.content[i],
+                        "url": batch.url[i],
+                        "likes": int(batch.likes[i]),
+                        "shares": int(batch.shares[i]),
+                        "comments_count": int(batch.comments_count[i]),
+                        "created_at": batch.created_at[i]
+                    }))
 
             print(f"\n💾 结果已保存到: {output_file}")
 
@@ -82,29 +89,32 @@ async def test_twitter_collector():
             print(f"\n📰 前 5 条推文预览:")
             print("=" * 60)
 
-            for i, post in enumerate(posts[:5], 1):
-                print(f"\n--- 推文 {i} ---")
-                print(f"作者: {post.author}")
-                print(f"内容: {post.content[:150]}{'...' if len(post.content) > 150 else ''}")
-                print(f"链接: {post.url}")
-                print(f"互动: 👍 {post.likes} | 🔄 {post.shares} | 💬 {post.comments_count}")
-                if post.created_at:
-                    print(f"时间: {post.created_at}")
+            for i in range(min(5, len(batch))):
+                content = batch.content[i]
+                print(f"\n--- 推文 {i + 1} ---")
+                print(f"作者: {batch.author[i]}")
+                print(f"内容: {content[:150]}{'...' if len(content) > 150 else ''}")
+                print(f"链接: {batch.url[i]}")
+                print(f"互动: 👍 {batch.likes[i]} | 🔄 {batch.shares[i]} | 💬 {batch.comments_count[i]}")
+                if batch.created_at[i]:
+                    print(f"时间: {batch.created_at[i]}")
 
             # 统计信息
             print(f"\n📊 统计信息:")
             print("=" * 60)
-            total_likes = sum(post.likes for post in posts)
-            total_shares = sum(post.shares for post in posts)
-            total_comments = sum(post.comments_count for post in posts)
+            # 列式数组上直接求和 / 平均 / 最大值
+            total_likes, avg_likes, max_likes = batch.metric_stats("likes")
+            total_shares, avg_shares, _ = batch.metric_stats("shares")
+            total_comments, avg_comments, _ = batch.metric_stats("comments_count")
 
-            print(f"总推文数: {len(posts)}")
+            print(f"总推文数: {len(batch)}")
             print(f"总点赞数: {total_likes}")
             print(f"总转发数: {total_shares}")
             print(f"总评论数: {total_comments}")
-            print(f"平均点赞: {total_likes // len(posts) if posts else 0}")
-            print(f"平均转发: {total_shares // len(posts) if posts else 0}")
-            print(f"平均评论: {total_comments // len(posts) if posts else 0}")
+            print(f"平均点赞: {avg_likes:.0f}")
+            print(f"平均转发: {avg_shares:.0f}")
+            print(f"平均评论: {avg_comments:.0f}")
+            print(f"最高点赞: {max_likes}")
 
         else:
             print("\n⚠️  未获取到任何推文")
@@ -130,4 +140,5 @@ def test_sync_wrapper():
 
 
 if __name__ == "__main__":
+    install_uvloop()
     test_sync_wrapper()
@@ -10,23 +10,55 @@ AI 分析工具函数测试文件
 
 运行方式:
 pytest tests/test_utils.py -v -s
+python tests/test_utils.py  # 安装 pytest-xdist 时自动并行
 """
 import asyncio
+import operator
 import os
 import sys
+import time
+from unittest.mock import Mock, call, patch
 import pytest
 from dotenv import load_dotenv
 
 load_dotenv()
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
+from src.ai_analysis.utils import (
+    TokenCounter,
+    TextPreprocessor,
+    MapReduceProcessor,
+    KeySentenceExtractor,
+    SemanticCache,
+    get_analysis_logger,
+    map_reduce,
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_token_cache():
+    """每个测试结束后清空 Token 计数缓存，避免测试间互相影响"""
+    yield
+    TokenCounter.clear_cache()
+
+
+@pytest.fixture(scope="module")
+def logger():
+    """整个模块共享同一个分析日志器"""
+    return get_analysis_logger()
+
+
+@pytest.fixture(autouse=True)
+def reset_logger(logger):
+    """每个测试前重置日志器的 Token 统计和操作计时"""
+    logger.reset_token_tracking()
+    logger.operation_durations.clear()
+
 
 # ============ Token Counter Tests ============
 
 def test_token_counter_basic():
     """测试基础 Token 计数"""
-    from src.ai_analysis.utils import TokenCounter
-
     # 测试简单文本
     text = "This is a test."
     tokens = TokenCounter.count_tokens(text)
@@ -43,10 +75,44 @@ def test_token_counter_basic():
     print(f"✓ 中文 Token 计数: {tokens_cn} tokens")
 
 
+def test_token_counter_cache():
+    """测试 Token 计数缓存：相同文本只编码一次"""
+    encoder = Mock()
+    encoder.encode = Mock(side_effect=lambda text, **kwargs: text.split())
+
+    with patch("src.ai_analysis.utils.token_counter._get_encoder", return_value=encoder):
+        assert TokenCounter.count_tokens("one two three") == 3
+        assert TokenCounter.count_tokens("one two three") == 3
+        assert encoder.encode.call_count == 1
+
+        # 清空缓存后重新编码
+        TokenCounter.clear_cache()
+        TokenCounter.count_tokens("one two three")
+        assert encoder.encode.call_count == 2
+    print("✓ Token 计数缓存命中")
+
+
+def test_token_counter_batch_parallel():
+    """测试大批量计数走 encode_batch，且与逐条计数一致"""
+    encoder = Mock()
+    encoder.encode = Mock(side_effect=lambda text, **kwargs: text.split())
+    encoder.encode_batch = Mock(side_effect=lambda texts, **kwargs: [t.split() for t in texts])
+    texts = ["one", "one two", "", "one two three", "four five"]
+
+    with patch("src.ai_analysis.utils.token_counter._get_encoder", return_value=encoder):
+        total = TokenCounter.count_tokens_batch(texts)
+        assert total == 8
+        encoder.encode_batch.assert_called_once()
+        assert encoder.encode.call_count == 0
+
+        # 结果已缓存，逐条计数不会再次编码
+        assert sum(TokenCounter.count_tokens(t) for t in texts) == total
+        assert encoder.encode.call_count == 0
+    print(f"✓ 并行批量计数: {len(texts)} 条文本 -> {total} tokens")
+
+
 def test_token_counter_batch():
     """测试批量 Token 计数"""
-    from src.ai_analysis.utils import TokenCounter
-
     texts = [
         "First text",
         "Second text",
@@ -58,31 +124,73 @@ def test_token_counter_batch():
     print(f"✓ 批量计数: {len(texts)} 条文本 -> {total} tokens")
 
 
-def test_token_counter_truncate():
-    """测试文本截断"""
-    from src.ai_analysis.utils import TokenCounter
+def test_token_counter_special_token_text():
+    """测试包含特殊 token 字符串的文本按普通文本处理，不抛出异常"""
+    text = "user post mentioning <|endoftext|> in the middle " * 20
+
+    assert TokenCounter.count_tokens(text) > 0
+    assert sum(TokenCounter.count_tokens_each([text] * 5)) == 5 * TokenCounter.count_tokens(text)
+    assert TokenCounter.truncate_to_tokens(text, max_tokens=10)
+    assert TokenCounter.split_text_by_tokens(text, max_tokens_per_chunk=50)
+    print("✓ 特殊 token 字符串按普通文本计数")
+
+
+def test_get_encoder_retries_after_load_failure():
+    """测试编码表加载失败（如离线）不会被缓存，下次调用重新加载"""
+    from src.ai_analysis.utils import token_counter
+
+    real = token_counter._get_encoder("gpt-4")
+    token_counter._load_encoder.cache_clear()
+    try:
+        with patch("tiktoken.encoding_for_model", side_effect=[OSError("offline"), real]):
+            assert token_counter._get_encoder("gpt-4") is None
+            assert token_counter._get_encoder("gpt-4") is real
+
+        # 未知模型的 None 会被缓存
+        assert token_counter._get_encoder("qwen-plus") is None
+    finally:
+        token_counter._load_encoder.cache_clear()
+    print("✓ 编码表加载失败后重试")
 
-    long_text = "word " * 1000
 
-    # 截断到 100 tokens
-    truncated = TokenCounter.truncate_to_tokens(long_text, max_tokens=100)
+@pytest.fixture(scope="module")
+def long_text():
+    """1000 词的长文本，整个模块共享"""
+    return "word " * 1000
+
+
+@pytest.mark.parametrize("max_tokens", [100, 200, 500])
+def test_token_counter_truncate(long_text, max_tokens):
+    """测试文本截断"""
+    truncated = TokenCounter.truncate_to_tokens(long_text, max_tokens=max_tokens)
 
     # 验证截断后的 token 数
     truncated_tokens = TokenCounter.count_tokens(truncated)
-    assert truncated_tokens <= 100
+    assert truncated_tokens <= max_tokens
     print(f"✓ 截断: 1000+ 词 -> {truncated_tokens} tokens")
 
 
-def test_token_counter_split():
-    """测试文本分割"""
-    from src.ai_analysis.utils import TokenCounter
+def test_token_counter_truncate_short_text_skips_encoding():
+    """测试短文本（字节数不超过上限）直接返回，不做编码"""
+    encoder = Mock()
+    encoder.encode = Mock(return_value=[1, 2, 3])
 
-    long_text = "word " * 1000
+    with patch("src.ai_analysis.utils.token_counter._get_encoder", return_value=encoder):
+        assert TokenCounter.truncate_to_tokens("short text", max_tokens=100) == "short text"
+        encoder.encode.assert_not_called()
 
-    # 分割成每块 200 tokens
+        # 中文每字 3 字节：4 个字 12 字节 > 10，需要编码
+        assert TokenCounter.truncate_to_tokens("这是测试", max_tokens=10) == "这是测试"
+        encoder.encode.assert_called_once_with("这是测试", disallowed_special=())
+    print("✓ 短文本截断跳过编码")
+
+
+@pytest.mark.parametrize("max_tokens_per_chunk", [200, 500])
+def test_token_counter_split(long_text, max_tokens_per_chunk):
+    """测试文本分割"""
     chunks = TokenCounter.split_text_by_tokens(
         long_text,
-        max_tokens_per_chunk=200,
+        max_tokens_per_chunk=max_tokens_per_chunk,
         overlap=20
     )
 
@@ -90,15 +198,20 @@ def test_token_counter_split():
     print(f"✓ 分割: 长文本 -> {len(chunks)} 个块")
 
     # 验证每个块的 token 数
-    for i, chunk in enumerate(chunks[:3]):  # 只检查前3个
-        tokens = TokenCounter.count_tokens(chunk)
-        print(f"  块 {i+1}: {tokens} tokens")
+    for chunk in chunks:
+        assert TokenCounter.count_tokens(chunk) <= max_tokens_per_chunk
+
+
+def test_token_counter_split_overlap_not_less_than_chunk():
+    """测试重叠不小于块大小时分割仍能前进（不会死循环）"""
+    chunks = TokenCounter.split_text_by_tokens("abcdefgh", max_tokens_per_chunk=1, overlap=1)
+
+    assert len(chunks) == len("abcdefgh")
+    print(f"✓ 重叠 >= 块大小: {len(chunks)} 个块")
 
 
 def test_token_counter_cost():
     """测试成本估算"""
-    from src.ai_analysis.utils import TokenCounter
-
     # 测试 OpenAI 模型
     cost = TokenCounter.calculate_cost(
         input_tokens=1000,
@@ -124,8 +237,6 @@ def test_token_counter_cost():
 
 def test_text_preprocessor_clean():
     """测试文本清理"""
-    from src.ai_analysis.utils import TextPreprocessor
-
     # 测试移除多余空格
     text = "This    is    a   test"
     cleaned = TextPreprocessor.remove_redundancy(text)
@@ -141,8 +252,6 @@ def test_text_preprocessor_clean():
 
 def test_text_preprocessor_extract():
     """测试关键句提取"""
-    from src.ai_analysis.utils import TextPreprocessor
-
     text = (
         "First sentence here. "
         "Second sentence here. "
@@ -161,12 +270,8 @@ def test_text_preprocessor_extract():
     print(f"✓ 提取关键句: {len(text)} -> {len(extracted)} 字符")
 
 
-def test_text_preprocessor_clean_for_analysis():
+def test_text_preprocessor_clean_for_analysis(long_text):
     """测试分析前清理"""
-    from src.ai_analysis.utils import TextPreprocessor
-
-    long_text = "word " * 1000
-
     cleaned = TextPreprocessor.clean_for_analysis(long_text, max_length=100)
 
     assert len(cleaned) <= 103  # 100 + "..."
@@ -175,8 +280,6 @@ def test_text_preprocessor_clean_for_analysis():
 
 def test_text_preprocessor_extract_by_keywords():
     """测试按关键词提取"""
-    from src.ai_analysis.utils import TextPreprocessor
-
     text = (
         "The price is very high. "
         "Quality is good but price is concerning. "
@@ -200,22 +303,14 @@ def test_text_preprocessor_extract_by_keywords():
 
 # ============ Logger Tests ============
 
-def test_logger_initialization():
+def test_logger_initialization(logger):
     """测试日志器初始化"""
-    from src.ai_analysis.utils import get_analysis_logger
-
-    logger = get_analysis_logger()
-    assert logger is not None
+    assert logger is get_analysis_logger()
     print("✓ 日志器初始化成功")
 
 
-def test_logger_token_tracking():
+def test_logger_token_tracking(logger):
     """测试 Token 追踪"""
-    from src.ai_analysis.utils import get_analysis_logger
-
-    logger = get_analysis_logger()
-    logger.reset_token_tracking()
-
     # 记录一些 API 调用
     logger.log_api_call(
         operation="test_operation",
@@ -242,32 +337,70 @@ def test_logger_token_tracking():
           f"{logger.total_input_tokens + logger.total_output_tokens} 总 tokens")
 
 
-def test_logger_operation_timing():
-    """测试操作计时"""
-    import time
-    from src.ai_analysis.utils import get_analysis_logger
-
-    logger = get_analysis_logger()
+def test_logger_operation_timing(logger, monkeypatch):
+    """测试操作计时（模拟时钟，无需真实等待）"""
+    now = [1_000_000_000]
+    monkeypatch.setattr(time, "perf_counter_ns", lambda: now[0])
 
-    # 开始操作
+    # 开始操作，时钟前进 150ms 后结束
     logger.start_operation("test_operation")
-    time.sleep(0.1)
+    now[0] += 150_000_000
     logger.end_operation("test_operation")
 
     # 验证计时
     assert "test_operation" in logger.operation_durations
     duration = logger.operation_durations["test_operation"]
-    assert duration >= 0.1
+    assert duration == pytest.approx(0.15)
 
     print(f"✓ 操作计时: {duration:.2f}s")
 
 
-def test_logger_batch_progress():
-    """测试批次进度日志"""
-    from src.ai_analysis.utils import get_analysis_logger
+def test_logger_nested_operations(logger):
+    """测试嵌套操作分别计时，互不覆盖"""
+    logger.start_operation("outer")
+    logger.start_operation("inner")
+    logger.end_operation("inner")
+    logger.end_operation("outer")
+
+    assert set(logger.operation_durations) == {"outer", "inner"}
+    assert logger.operation_durations["outer"] >= logger.operation_durations["inner"]
+    print("✓ 嵌套操作计时")
+
+
+def test_logger_same_name_operations(logger, monkeypatch):
+    """测试同名操作嵌套/并发时各自计时，外层不会丢失"""
+    now = [0]
+    monkeypatch.setattr(time, "perf_counter_ns", lambda: now[0])
+
+    # 嵌套：内层结束后，外层仍能正确结束
+    logger.start_operation("map")
+    now[0] += 100_000_000
+    logger.start_operation("map")
+    now[0] += 100_000_000
+    logger.end_operation("map")
+    assert logger.operation_durations["map"] == pytest.approx(0.1)
+    logger.end_operation("map")
+    assert logger.operation_durations["map"] == pytest.approx(0.2)
+
+    # 并发：按 start_operation 返回的 token 结束，先开始的先结束也不会错位
+    first = logger.start_operation("summarize")
+    now[0] += 100_000_000
+    second = logger.start_operation("summarize")
+    now[0] += 300_000_000
+    logger.end_operation("summarize", first)
+    assert logger.operation_durations["summarize"] == pytest.approx(0.4)
+    logger.end_operation("summarize", second)
+    assert logger.operation_durations["summarize"] == pytest.approx(0.3)
+
+    # 重置时清空未结束的操作
+    logger.start_operation("pending")
+    logger.reset_token_tracking()
+    assert logger._operation_starts == {}
+    print("✓ 同名操作计时")
 
-    logger = get_analysis_logger()
 
+def test_logger_batch_progress(logger):
+    """测试批次进度日志"""
     # 不实际打印，只验证不报错
     logger.log_batch_progress("test_op", 1, 5, batch_size=10)
     logger.log_batch_progress("test_op", 3, 5)
@@ -277,11 +410,8 @@ def test_logger_batch_progress():
 
 # ============ Map-Reduce Tests ============
 
-@pytest.mark.asyncio
 async def test_map_reduce_initialization():
     """测试 Map-Reduce 处理器初始化"""
-    from src.ai_analysis.utils import MapReduceProcessor
-
     processor = MapReduceProcessor(
         max_tokens_per_chunk=2000,
         overlap=200,
@@ -292,15 +422,10 @@ async def test_map_reduce_initialization():
     print("✓ Map-Reduce 处理器初始化成功")
 
 
-@pytest.mark.asyncio
-async def test_map_reduce_split_text():
+async def test_map_reduce_split_text(long_text):
     """测试文本分割"""
-    from src.ai_analysis.utils import MapReduceProcessor
-
     processor = MapReduceProcessor(max_tokens_per_chunk=500)
 
-    long_text = "word " * 1000
-
     chunks = processor.split_text(long_text)
 
     assert len(chunks) > 1
@@ -311,11 +436,8 @@ async def test_map_reduce_split_text():
         print(f"  块 {i+1}: {len(chunk)} 字符")
 
 
-@pytest.mark.asyncio
 async def test_map_reduce_split_posts():
     """测试帖子分割"""
-    from src.ai_analysis.utils import MapReduceProcessor
-
     processor = MapReduceProcessor(max_tokens_per_chunk=1000)
 
     posts = [
@@ -334,11 +456,35 @@ async def test_map_reduce_split_posts():
         print(f"  批次 {i+1}: {len(batch)} 帖子")
 
 
-@pytest.mark.asyncio
+def test_map_reduce_split_posts_budget():
+    """测试帖子分割：顺序模式保持帖子顺序，打包模式批次更少，且都不超预算"""
+    processor = MapReduceProcessor(max_tokens_per_chunk=10, overlap=0)
+    sizes = [6, 6, 4, 4, 3, 3, 12]
+    posts = [{"content": f"post {i}"} for i in range(len(sizes))]
+
+    with patch.object(TokenCounter, "count_tokens_each", return_value=sizes):
+        ordered = processor.split_posts(posts)
+        packed = processor.split_posts(posts, pack=True)
+
+    index = {id(p): i for i, p in enumerate(posts)}
+
+    # 顺序模式：展平后与输入顺序一致
+    assert [p for batch in ordered for p in batch] == posts
+
+    # 打包模式：每个帖子恰好出现一次，批次数不多于顺序模式
+    assert sorted(index[id(p)] for batch in packed for p in batch) == list(range(len(posts)))
+    assert len(packed) <= len(ordered)
+    assert len(packed) == 4
+
+    for batches in (ordered, packed):
+        for batch in batches:
+            total = sum(sizes[index[id(p)]] for p in batch)
+            assert total <= 10 or len(batch) == 1
+    print(f"✓ 帖子分割: 顺序 {len(ordered)} 批次，打包 {len(packed)} 批次")
+
+
 async def test_map_reduce_process():
     """测试 Map-Reduce 处理流程"""
-    from src.ai_analysis.utils import MapReduceProcessor
-
     processor = MapReduceProcessor(
         max_tokens_per_chunk=200,
         batch_size=2
@@ -349,7 +495,7 @@ async def test_map_reduce_process():
 
     # Map 函数：计数词数
     async def map_func(chunk: str) -> int:
-        return len(chunk.split())
+        return chunk.count(' ') + bool(chunk)
 
     # Reduce 函数：求和
     async def reduce_func(results: list) -> int:
@@ -366,11 +512,31 @@ async def test_map_reduce_process():
     print(f"✓ Map-Reduce 处理: 总词数 = {result}")
 
 
-@pytest.mark.asyncio
+async def test_map_reduce_process_streaming():
+    """测试流式 Map-Reduce 与 process 结果一致"""
+    processor = MapReduceProcessor(
+        max_tokens_per_chunk=200,
+        batch_size=2
+    )
+    text = "word " * 500
+
+    async def map_func(chunk: str) -> int:
+        return chunk.count(' ') + bool(chunk)
+
+    async def reduce_func(results: list) -> int:
+        return sum(results)
+
+    expected = await processor.process(text, map_func, reduce_func, "test_operation")
+    result = await processor.process_streaming(
+        text, map_func, operator.add, 0, "test_streaming"
+    )
+
+    assert result == expected
+    print(f"✓ 流式 Map-Reduce: 总词数 = {result}")
+
+
 async def test_map_reduce_process_posts():
     """测试帖子 Map-Reduce 处理"""
-    from src.ai_analysis.utils import MapReduceProcessor
-
     processor = MapReduceProcessor(
         max_tokens_per_chunk=1000,
         batch_size=3
@@ -400,12 +566,69 @@ async def test_map_reduce_process_posts():
     print(f"✓ 帖子 Map-Reduce: 处理了 {result} 个帖子")
 
 
+async def test_map_reduce_map_phase_bounded_and_ordered():
+    """测试 Map 阶段并发受 batch_size 限制，且结果保持输入顺序"""
+    processor = MapReduceProcessor(batch_size=3)
+    in_flight = 0
+    peak = 0
+
+    async def map_func(chunk):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        # 后面的块先完成，验证结果顺序不受完成顺序影响
+        await asyncio.sleep(0.001 * (10 - chunk))
+        in_flight -= 1
+        return chunk * 2
+
+    results = await processor.map_phase(list(range(10)), map_func)
+
+    assert results == [i * 2 for i in range(10)]
+    assert peak == 3
+    print(f"✓ Map 阶段: 最大并发 {peak}，结果有序")
+
+
+async def test_map_reduce_map_phase_progress_partial_batch():
+    """测试 Map 阶段进度日志按最后一批的实际块数记录"""
+    processor = MapReduceProcessor(batch_size=5)
+
+    async def map_func(chunk):
+        return chunk
+
+    with patch.object(processor.logger, "log_batch_progress") as progress:
+        await processor.map_phase(list(range(7)), map_func, "progress_op")
+
+    assert progress.call_args_list == [
+        call("progress_op", 1, 2, 5),
+        call("progress_op", 2, 2, 2),
+    ]
+    print("✓ Map 阶段进度: 最后一批记录 2 个块")
+
+
+async def test_map_reduce_map_phase_retries():
+    """测试 Map 阶段失败重试，重试耗尽的块被丢弃"""
+    processor = MapReduceProcessor(batch_size=2, max_retries=1)
+    attempts = {}
+
+    async def map_func(chunk):
+        attempts[chunk] = attempts.get(chunk, 0) + 1
+        if chunk == "flaky" and attempts[chunk] == 1:
+            raise RuntimeError("transient")
+        if chunk == "broken":
+            raise RuntimeError("permanent")
+        return chunk
+
+    results = await processor.map_phase(["ok", "flaky", "broken"], map_func)
+
+    assert results == ["ok", "flaky"]
+    assert attempts == {"ok": 1, "flaky": 2, "broken": 2}
+    print(f"✓ Map 阶段重试: {attempts}")
+
+
 # ============ Key Sentence Extractor Tests ============
 
 def test_key_sentence_extractor_position():
     """测试基于位置的关键句提取"""
-    from src.ai_analysis.utils import KeySentenceExtractor
-
     text = (
         "Sentence one here. "
         "Sentence two here. "
@@ -428,8 +651,6 @@ def test_key_sentence_extractor_position():
 
 def test_key_sentence_extractor_keywords():
     """测试基于关键词的关键句提取"""
-    from src.ai_analysis.utils import KeySentenceExtractor
-
     text = (
         "The price is very affordable. "
         "Quality exceeds expectations. "
@@ -451,17 +672,82 @@ def test_key_sentence_extractor_keywords():
     print(f"✓ 基于关键词提取: 找到包含关键词的句子")
 
 
+def test_key_sentence_extractor_keywords_fallback(monkeypatch):
+    """测试未安装 pyahocorasick 时，关键词提取结果与自动机一致"""
+    text = (
+        "Price and quality both matter. "
+        "The price is high. "
+        "Service was slow. "
+        "Nothing else to add."
+    )
+    keywords = ["price", "Quality", "service"]
+
+    expected = KeySentenceExtractor.extract_by_keywords(text, keywords, sentences_per_keyword=1)
+    monkeypatch.setattr(map_reduce, "ahocorasick", None)
+    fallback = KeySentenceExtractor.extract_by_keywords(text, keywords, sentences_per_keyword=1)
+
+    assert fallback == expected
+    assert expected.startswith("Price and quality both matter")
+    print(f"✓ 关键词提取回退路径一致")
+
+
+# ============ Semantic Cache Tests ============
+
+async def _fake_embed(text):
+    """按字母频次生成确定性向量，避免真实 API 调用"""
+    lowered = text.lower()
+    return [float(lowered.count(c)) for c in "abcdefghijklmnopqrstuvwxyz"]
+
+
+async def test_semantic_cache_hit_and_miss():
+    """测试语义缓存命中、未命中与分桶"""
+    cache = SemanticCache(threshold=0.99)
+    calls = []
+
+    async def compute():
+        calls.append(1)
+        return f"summary {len(calls)}"
+
+    first = await cache.get_or_compute("the product is great", "positive", compute, _fake_embed)
+    same = await cache.get_or_compute("The product is great!", "positive", compute, _fake_embed)
+    other_bucket = await cache.get_or_compute("the product is great", "negative", compute, _fake_embed)
+    different = await cache.get_or_compute("zzz xxx qqq", "positive", compute, _fake_embed)
+
+    assert first == same == "summary 1"
+    assert other_bucket == "summary 2"
+    assert different == "summary 3"
+    assert cache.hits == 1
+    assert cache.misses == 3
+    print(f"✓ 语义缓存: {cache.hits} 命中, {cache.misses} 未命中")
+
+
+async def test_semantic_cache_skips_uncacheable_and_embed_errors():
+    """测试失败结果不缓存，嵌入失败时直接计算"""
+    cache = SemanticCache()
+    calls = []
+
+    async def compute():
+        calls.append(1)
+        return "failed"
+
+    async def broken_embed(text):
+        raise RuntimeError("embedding service down")
+
+    for _ in range(2):
+        await cache.get_or_compute("text", "neutral", compute, _fake_embed,
+                                   cacheable=lambda s: s != "failed")
+    assert len(calls) == 2
+
+    result = await cache.get_or_compute("text", "neutral", compute, broken_embed)
+    assert result == "failed"
+    assert len(calls) == 3
+    print("✓ 语义缓存: 失败结果与嵌入异常均绕过缓存")
+
+
 # ============ Integration Tests ============
 
-@pytest.mark.asyncio
 async def test_utils_integration():
     """集成测试：组合使用多个工具"""
-    from src.ai_analysis.utils import (
-        TokenCounter,
-        TextPreprocessor,
-        MapReduceProcessor
-    )
-
     # 1. 清理长文本
     long_text = "word " * 1000 + "\n" + "sentence. " * 100
     cleaned = TextPreprocessor.clean_for_analysis(long_text, max_length=2000)
@@ -498,50 +784,14 @@ async def test_utils_integration():
 # ============ Main Function ============
 
 def run_all_tests():
-    """运行所有测试"""
-    print("\n" + "="*60)
-    print("AI 分析工具函数完整测试套件")
-    print("="*60 + "\n")
-
-    # 运行同步测试
-    test_groups = [
-        ("Token Counter 基础", [
-            test_token_counter_basic,
-            test_token_counter_batch,
-            test_token_counter_truncate,
-            test_token_counter_split,
-            test_token_counter_cost,
-        ]),
-        ("Text Preprocessor", [
-            test_text_preprocessor_clean,
-            test_text_preprocessor_extract,
-            test_text_preprocessor_clean_for_analysis,
-            test_text_preprocessor_extract_by_keywords,
-        ]),
-        ("Logger", [
-            test_logger_initialization,
-            test_logger_token_tracking,
-            test_logger_operation_timing,
-            test_logger_batch_progress,
-        ]),
-        ("Key Sentence Extractor", [
-            test_key_sentence_extractor_position,
-            test_key_sentence_extractor_keywords,
-        ]),
-    ]
-
-    for group_name, tests in test_groups:
-        print(f"\n{group_name}:")
-        for test_func in tests:
-            try:
-                test_func()
-            except AssertionError as e:
-                print(f"  ✗ {test_func.__name__}: {e}")
-            except Exception as e:
-                print(f"  ✗ {test_func.__name__}: {type(e).__name__}: {e}")
-
-    print("\n提示: 运行异步测试请使用:")
-    print("  pytest tests/test_utils.py -v -s")
+    """运行所有测试（交给 pytest，安装了 pytest-xdist 时多进程并行）"""
+    args = [__file__, "-v", "-s"]
+    try:
+        import xdist  # noqa: F401
+        args += ["-n", "auto"]
+    except ImportError:
+        pass
+    raise SystemExit(pytest.main(args))
 
 
 if __name__ == "__main__":
@@ -2,11 +2,17 @@
 Tests for YouTube collector transcript fetching functionality.
 """
 import asyncio
+import logging
 import os
-from unittest.mock import Mock, MagicMock, patch, AsyncMock
+import time
+from contextlib import contextmanager
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch, AsyncMock
 import pytest
+from tenacity import wait_none
 
-from src.collectors.youtube import YouTubeCollector
+from src.collectors.transcript_cache import TranscriptCache
+from src.collectors.youtube import YouTubeCollector, _build_proxy_config
 from youtube_transcript_api._errors import (
     TranscriptsDisabled,
     NoTranscriptFound,
@@ -14,14 +20,109 @@ from youtube_transcript_api._errors import (
 )
 
 
+def _make_transcript(*texts: str) -> SimpleNamespace:
+    """Build a stand-in FetchedTranscript with one snippet per text."""
+    return SimpleNamespace(snippets=[SimpleNamespace(text=text) for text in texts])
+
+
+@contextmanager
+def _patch_client(collector: YouTubeCollector):
+    """Give every executor thread of the collector the same mock transcript client."""
+    with patch.object(collector, "_transcript_client") as get_client:
+        yield get_client.return_value
+
+
+class TestTranscriptCache:
+    """Test suite for the on-disk transcript cache."""
+
+    @pytest.fixture
+    def cache(self, tmp_path):
+        """Create a TranscriptCache in a temporary directory."""
+        cache = TranscriptCache(str(tmp_path / "yt_cache"))
+        yield cache
+        cache.close()
+
+    def test_round_trip_compressed(self, cache):
+        """Test that transcripts are stored compressed and read back intact."""
+        text = "hello transcript " * 500
+        cache.set("video1", "en", text)
+
+        stored = cache._cache.get(cache._key("video1", "en"))
+        assert isinstance(stored, bytes)
+        assert len(stored) < len(text)
+        assert cache.get("video1", "en") == text
+
+    def test_reads_legacy_plain_text(self, cache):
+        """Test that entries written before compression are still readable."""
+        cache._cache.set(cache._key("video1", "en"), "legacy transcript")
+
+        assert cache.get("video1", "en") == "legacy transcript"
+
+    @pytest.mark.parametrize("stored", [
+        b"\x01" + b"not zstd data",
+        b"\x00" + b"\xff\xfe invalid utf-8",
+    ], ids=["bad-zstd-frame", "bad-utf-8"])
+    def test_corrupt_entry_is_a_miss(self, cache, stored):
+        """Test that an unreadable entry is treated as a miss instead of raising."""
+        cache._cache.set(cache._key("video1", "en"), stored)
+
+        assert cache.get("video1", "en") is None
+
+    def test_truncated_entry_is_a_miss(self, cache):
+        """Test that a compressed entry cut short is treated as a miss."""
+        cache.set("video1", "en", "hello transcript " * 500)
+        key = cache._key("video1", "en")
+        cache._cache.set(key, cache._cache.get(key)[:20])
+
+        assert cache.get("video1", "en") is None
+
+
 class TestFetchTranscript:
     """Test suite for _fetch_transcript method."""
 
+    @pytest.fixture(autouse=True)
+    def transcript_cache_dir(self, tmp_path, monkeypatch, collector):
+        """Point the transcript cache at a per-test directory."""
+        monkeypatch.setenv("YT_CACHE_DIR", str(tmp_path / "yt_cache"))
+        collector.transcript_cache.close()
+        collector.transcript_cache = TranscriptCache()
+        collector._recent.clear()
+
+    @pytest.fixture(autouse=True)
+    def clear_proxy_config_cache(self):
+        """Don't let one test's proxy settings leak into the next."""
+        _build_proxy_config.cache_clear()
+        yield
+        _build_proxy_config.cache_clear()
+
+    @pytest.fixture(autouse=True)
+    def no_retry_wait(self, monkeypatch):
+        """Retry transient errors without the backoff sleeps."""
+        monkeypatch.setattr(YouTubeCollector._fetch_with_retry.retry, "wait", wait_none())
+
+    @pytest.fixture(scope="class")
+    async def collector(self, tmp_path_factory):
+        """Create one YouTubeCollector shared by the tests in this class."""
+        # Tests only patch the collector's clients; proxy tests build their own
+        with pytest.MonkeyPatch.context() as mp:
+            mp.setenv("YT_CACHE_DIR", str(tmp_path_factory.mktemp("yt_cache")))
+            config = {"YOUTUBE_API_KEY": "test_api_key"}
+            collector = YouTubeCollector(config)
+        yield collector
+        await collector.aclose()
+
     @pytest.fixture
-    def collector(self):
-        """Create a YouTubeCollector instance for testing."""
-        config = {"YOUTUBE_API_KEY": "test_api_key"}
-        return YouTubeCollector(config)
+    async def make_collector(self):
+        """Build extra collectors inside a test and close them afterwards."""
+        collectors = []
+
+        def make() -> YouTubeCollector:
+            collectors.append(YouTubeCollector({"YOUTUBE_API_KEY": "test_api_key"}))
+            return collectors[-1]
+
+        yield make
+        for collector in collectors:
+            await collector.aclose()
 
     @pytest.fixture
     def mock_video(self):
@@ -36,36 +137,24 @@ class TestFetchTranscript:
     async def test_fetch_transcript_success(self, collector, mock_video):
         """Test successful transcript fetching."""
         # Mock the transcript API response
-        mock_transcript = MagicMock()
-        mock_snippet = Mock(text="This is a test transcript")
-        mock_transcript.snippets = [mock_snippet]
+        mock_transcript = _make_transcript("This is a test transcript")
 
-        with patch("src.collectors.youtube.YouTubeTranscriptApi") as mock_api:
-            mock_api_instance = MagicMock()
+        with _patch_client(collector) as mock_api_instance:
             mock_api_instance.fetch.return_value = mock_transcript
-            mock_api.return_value = mock_api_instance
 
             result = await collector._fetch_transcript(mock_video, "en")
 
             assert result is not None
             assert result == "This is a test transcript"
-            mock_api_instance.fetch.assert_called_once_with("test_video_id")
+            mock_api_instance.fetch.assert_called_once_with("test_video_id", languages=["en"])
 
     @pytest.mark.asyncio
     async def test_fetch_transcript_multiple_snippets(self, collector, mock_video):
         """Test transcript with multiple snippets is properly joined."""
-        mock_transcript = MagicMock()
-        mock_snippets = [
-            Mock(text="Hello world"),
-            Mock(text="This is a test"),
-            Mock(text="Goodbye"),
-        ]
-        mock_transcript.snippets = mock_snippets
+        mock_transcript = _make_transcript("Hello world", "This is a test", "Goodbye")
 
-        with patch("src.collectors.youtube.YouTubeTranscriptApi") as mock_api:
-            mock_api_instance = MagicMock()
+        with _patch_client(collector) as mock_api_instance:
             mock_api_instance.fetch.return_value = mock_transcript
-            mock_api.return_value = mock_api_instance
 
             result = await collector._fetch_transcript(mock_video, "en")
 
@@ -76,10 +165,8 @@ class TestFetchTranscript:
         self, collector, mock_video
     ):
         """Test when transcript is disabled."""
-        with patch("src.collectors.youtube.YouTubeTranscriptApi") as mock_api:
-            mock_api_instance = MagicMock()
+        with _patch_client(collector) as mock_api_instance:
             mock_api_instance.fetch.side_effect = TranscriptsDisabled("test_video_id")
-            mock_api.return_value = mock_api_instance
 
             result = await collector._fetch_transcript(mock_video, "en")
 
@@ -88,14 +175,12 @@ class TestFetchTranscript:
     @pytest.mark.asyncio
     async def test_fetch_transcript_no_transcript_found(self, collector, mock_video):
         """Test when no transcript is found."""
-        with patch("src.collectors.youtube.YouTubeTranscriptApi") as mock_api:
-            mock_api_instance = MagicMock()
+        with _patch_client(collector) as mock_api_instance:
             mock_api_instance.fetch.side_effect = NoTranscriptFound(
                 video_id="test_video_id",
                 requested_language_codes=["en"],
                 transcript_data={}
             )
-            mock_api.return_value = mock_api_instance
 
             result = await collector._fetch_transcript(mock_video, "en")
 
@@ -104,44 +189,63 @@ class TestFetchTranscript:
     @pytest.mark.asyncio
     async def test_fetch_transcript_video_unavailable(self, collector, mock_video):
         """Test when video is unavailable."""
-        with patch("src.collectors.youtube.YouTubeTranscriptApi") as mock_api:
-            mock_api_instance = MagicMock()
+        with _patch_client(collector) as mock_api_instance:
             mock_api_instance.fetch.side_effect = VideoUnavailable("test_video_id")
-            mock_api.return_value = mock_api_instance
 
             result = await collector._fetch_transcript(mock_video, "en")
 
             assert result is None
 
     @pytest.mark.asyncio
-    async def test_fetch_transcript_ip_blocked(self, collector, mock_video):
+    async def test_fetch_transcript_ip_blocked(self, collector, mock_video, caplog):
         """Test when IP is blocked by YouTube."""
-        with patch("src.collectors.youtube.YouTubeTranscriptApi") as mock_api:
-            mock_api_instance = MagicMock()
+        with _patch_client(collector) as mock_api_instance:
             mock_api_instance.fetch.side_effect = Exception("IP blocked")
-            mock_api.return_value = mock_api_instance
 
-            with patch("builtins.print") as mock_print:
+            with caplog.at_level(logging.WARNING):
                 result = await collector._fetch_transcript(mock_video, "en")
 
                 assert result is None
-                # Check that warning message was printed
-                mock_print.assert_called()
+                # Check that the blocking warning was logged
+                assert "ip blocking detected" in caplog.text.lower()
+
+    @pytest.mark.asyncio
+    async def test_fetch_transcript_retries_rate_limit(self, collector, mock_video):
+        """Test that HTTP 429 errors are retried until the fetch succeeds."""
+        mock_transcript = _make_transcript("Transcript after retry")
+
+        with _patch_client(collector) as mock_api_instance:
+            mock_api_instance.fetch.side_effect = [
+                Exception("429 Too Many Requests"),
+                Exception("429 Too Many Requests"),
+                mock_transcript,
+            ]
+
+            result = await collector._fetch_transcript(mock_video, "en")
+
+            assert result == "Transcript after retry"
+            assert mock_api_instance.fetch.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_fetch_transcript_unavailable_not_retried(self, collector, mock_video):
+        """Test that permanent errors are not retried."""
+        with _patch_client(collector) as mock_api_instance:
+            mock_api_instance.fetch.side_effect = VideoUnavailable("test_video_id")
+
+            result = await collector._fetch_transcript(mock_video, "en")
+
+            assert result is None
+            assert mock_api_instance.fetch.call_count == 1
 
     @pytest.mark.asyncio
-    async def test_fetch_transcript_with_proxy(self, collector, mock_video):
+    async def test_fetch_transcript_with_proxy(self, make_collector, mock_video):
         """Test transcript fetching with proxy configuration."""
         # Set proxy environment variable
         import os
 
         with patch.dict(os.environ, {"HTTP_PROXY": "http://proxy.example.com:8080"}):
             # Recreate collector to pick up proxy setting
-            config = {"YOUTUBE_API_KEY": "test_api_key"}
-            collector_with_proxy = YouTubeCollector(config)
-
-            mock_transcript = MagicMock()
-            mock_snippet = Mock(text="Transcript with proxy")
-            mock_transcript.snippets = [mock_snippet]
+            mock_transcript = _make_transcript("Transcript with proxy")
 
             with patch(
                 "src.collectors.youtube.YouTubeTranscriptApi"
@@ -150,6 +254,9 @@ class TestFetchTranscript:
                 mock_api_instance.fetch.return_value = mock_transcript
                 mock_api.return_value = mock_api_instance
 
+                # Each executor thread builds its client on first use
+                collector_with_proxy = make_collector()
+
                 result = await collector_with_proxy._fetch_transcript(
                     mock_video, "en"
                 )
@@ -161,11 +268,13 @@ class TestFetchTranscript:
                 assert "proxy_config" in call_kwargs
                 # Verify proxy_config has correct URLs
                 proxy_config = call_kwargs["proxy_config"]
-                assert proxy_config._http_url == "http://proxy.example.com:8080"
-                assert proxy_config._https_url == "http://proxy.example.com:8080"
+                assert proxy_config.to_requests_dict() == {
+                    "http": "http://proxy.example.com:8080",
+                    "https": "http://proxy.example.com:8080",
+                }
 
     @pytest.mark.asyncio
-    async def test_fetch_transcript_with_webshare_proxy(self, collector, mock_video):
+    async def test_fetch_transcript_with_webshare_proxy(self, make_collector, mock_video):
         """Test transcript fetching with Webshare proxy configuration."""
         from youtube_transcript_api.proxies import WebshareProxyConfig
 
@@ -175,12 +284,7 @@ class TestFetchTranscript:
             "WEBSHARE_PROXY_PASSWORD": "test_pass"
         }):
             # Recreate collector to pick up Webshare proxy setting
-            config = {"YOUTUBE_API_KEY": "test_api_key"}
-            collector_with_webshare = YouTubeCollector(config)
-
-            mock_transcript = MagicMock()
-            mock_snippet = Mock(text="Transcript with Webshare proxy")
-            mock_transcript.snippets = [mock_snippet]
+            mock_transcript = _make_transcript("Transcript with Webshare proxy")
 
             with patch(
                 "src.collectors.youtube.YouTubeTranscriptApi"
@@ -189,6 +293,9 @@ class TestFetchTranscript:
                 mock_api_instance.fetch.return_value = mock_transcript
                 mock_api.return_value = mock_api_instance
 
+                # Each executor thread builds its client on first use
+                collector_with_webshare = make_collector()
+
                 result = await collector_with_webshare._fetch_transcript(
                     mock_video, "en"
                 )
@@ -203,7 +310,7 @@ class TestFetchTranscript:
                 assert isinstance(proxy_config, WebshareProxyConfig)
 
     @pytest.mark.asyncio
-    async def test_proxy_priority_webshare_over_http(self, collector, mock_video):
+    async def test_proxy_priority_webshare_over_http(self, make_collector):
         """Test that Webshare proxy has priority over HTTP_PROXY."""
         from youtube_transcript_api.proxies import WebshareProxyConfig
 
@@ -213,28 +320,25 @@ class TestFetchTranscript:
             "WEBSHARE_PROXY_PASSWORD": "test_pass",
             "HTTP_PROXY": "http://127.0.0.1:7890"
         }):
-            config = {"YOUTUBE_API_KEY": "test_api_key"}
-            collector_with_both = YouTubeCollector(config)
+            collector_with_both = make_collector()
 
             # Verify proxy_config is Webshare (not HTTP)
             assert isinstance(collector_with_both.proxy_config, WebshareProxyConfig)
-            assert collector_with_both.proxy_config._proxy_username == "test_user"
-            assert collector_with_both.proxy_config._proxy_password == "test_pass"
+            proxy_url = collector_with_both.proxy_config.to_requests_dict()["https"]
+            assert "test_user" in proxy_url
+            assert "test_pass" in proxy_url
+            assert "127.0.0.1:7890" not in proxy_url
 
     @pytest.mark.asyncio
     async def test_fetch_transcript_content_cleaning(self, collector, mock_video):
         """Test that transcript content is properly cleaned."""
-        mock_transcript = MagicMock()
         # Include URLs and markdown that should be cleaned
-        mock_snippet = Mock(
-            text="Check this out https://example.com and [link](url) for more"
+        mock_transcript = _make_transcript(
+            "Check this out https://example.com and [link](url) for more"
         )
-        mock_transcript.snippets = [mock_snippet]
 
-        with patch("src.collectors.youtube.YouTubeTranscriptApi") as mock_api:
-            mock_api_instance = MagicMock()
+        with _patch_client(collector) as mock_api_instance:
             mock_api_instance.fetch.return_value = mock_transcript
-            mock_api.return_value = mock_api_instance
 
             result = await collector._fetch_transcript(mock_video, "en")
 
@@ -245,10 +349,8 @@ class TestFetchTranscript:
     @pytest.mark.asyncio
     async def test_fetch_transcript_generic_exception(self, collector, mock_video):
         """Test handling of unexpected exceptions."""
-        with patch("src.collectors.youtube.YouTubeTranscriptApi") as mock_api:
-            mock_api_instance = MagicMock()
+        with _patch_client(collector) as mock_api_instance:
             mock_api_instance.fetch.side_effect = Exception("Unexpected error")
-            mock_api.return_value = mock_api_instance
 
             result = await collector._fetch_transcript(mock_video, "en")
 
@@ -257,13 +359,10 @@ class TestFetchTranscript:
     @pytest.mark.asyncio
     async def test_fetch_transcript_empty_transcript(self, collector, mock_video):
         """Test handling of empty transcript."""
-        mock_transcript = MagicMock()
-        mock_transcript.snippets = []
+        mock_transcript = _make_transcript()
 
-        with patch("src.collectors.youtube.YouTubeTranscriptApi") as mock_api:
-            mock_api_instance = MagicMock()
+        with _patch_client(collector) as mock_api_instance:
             mock_api_instance.fetch.return_value = mock_transcript
-            mock_api.return_value = mock_api_instance
 
             result = await collector._fetch_transcript(mock_video, "en")
 
@@ -274,14 +373,10 @@ class TestFetchTranscript:
         self, collector, mock_video
     ):
         """Test that extra whitespace is normalized."""
-        mock_transcript = MagicMock()
-        mock_snippet = Mock(text="  Hello    world  \n\n  Test  ")
-        mock_transcript.snippets = [mock_snippet]
+        mock_transcript = _make_transcript("  Hello    world  \n\n  Test  ")
 
-        with patch("src.collectors.youtube.YouTubeTranscriptApi") as mock_api:
-            mock_api_instance = MagicMock()
+        with _patch_client(collector) as mock_api_instance:
             mock_api_instance.fetch.return_value = mock_transcript
-            mock_api.return_value = mock_api_instance
 
             result = await collector._fetch_transcript(mock_video, "en")
 
@@ -289,54 +384,81 @@ class TestFetchTranscript:
             assert result == "Hello world Test"
 
     @pytest.mark.asyncio
-    async def test_fetch_transcript_request_blocked_error(self, collector, mock_video):
+    async def test_fetch_transcript_request_blocked_error(self, collector, mock_video, caplog):
         """Test different IP blocking error messages."""
-        with patch("src.collectors.youtube.YouTubeTranscriptApi") as mock_api:
-            mock_api_instance = MagicMock()
+        with _patch_client(collector) as mock_api_instance:
             mock_api_instance.fetch.side_effect = Exception("requestblocked")
-            mock_api.return_value = mock_api_instance
 
-            with patch("builtins.print") as mock_print:
+            with caplog.at_level(logging.WARNING):
                 result = await collector._fetch_transcript(mock_video, "en")
 
                 assert result is None
-                mock_print.assert_called()
+                assert "ip blocking detected" in caplog.text.lower()
 
     @pytest.mark.asyncio
-    async def test_fetch_transcript_ip_blocked_lowercase(self, collector, mock_video):
+    async def test_fetch_transcript_ip_blocked_lowercase(self, collector, mock_video, caplog):
         """Test IP blocking error with lowercase 'ipblocked'."""
-        with patch("src.collectors.youtube.YouTubeTranscriptApi") as mock_api:
-            mock_api_instance = MagicMock()
+        with _patch_client(collector) as mock_api_instance:
             mock_api_instance.fetch.side_effect = Exception("ipblocked")
-            mock_api.return_value = mock_api_instance
 
-            with patch("builtins.print") as mock_print:
+            with caplog.at_level(logging.WARNING):
+                result = await collector._fetch_transcript(mock_video, "en")
+
+                assert result is None
+                assert "ip blocking detected" in caplog.text.lower()
+
+    @pytest.mark.asyncio
+    async def test_data_api_session_reused(self, make_collector):
+        """Test that Data API calls share one session until aclose()."""
+        # Own collector: aclose() also shuts down the transcript thread pool
+        collector = make_collector()
+        session = collector._get_session()
+        assert collector._get_session() is session
+
+        await collector.aclose()
+        assert session.closed
+        assert collector._http is None
+
+    @pytest.mark.asyncio
+    async def test_transcript_client_per_thread(self, make_collector):
+        """Test that each thread reuses its own transcript client."""
+        collector = make_collector()
+        client = collector._transcript_client()
+        assert collector._transcript_client() is client
+
+        other = await asyncio.to_thread(collector._transcript_client)
+        assert other is not client
+
+    @pytest.mark.asyncio
+    async def test_fetch_transcript_rate_limited(self, collector, mock_video, caplog):
+        """Test that HTTP 429 responses are reported as blocking."""
+        with _patch_client(collector) as mock_api_instance:
+            mock_api_instance.fetch.side_effect = Exception("HTTP 429 Too Many Requests")
+
+            with caplog.at_level(logging.WARNING):
                 result = await collector._fetch_transcript(mock_video, "en")
 
                 assert result is None
-                mock_print.assert_called()
+                assert "ip blocking detected" in caplog.text.lower()
 
     @pytest.mark.asyncio
     async def test_fetch_transcript_run_in_executor(self, collector, mock_video):
         """Test that blocking operation is run in executor."""
-        mock_transcript = MagicMock()
-        mock_snippet = Mock(text="Async transcript")
-        mock_transcript.snippets = [mock_snippet]
+        mock_transcript = _make_transcript("Async transcript")
 
-        with patch("src.collectors.youtube.YouTubeTranscriptApi") as mock_api, \
-             patch("asyncio.get_event_loop") as mock_get_loop:
+        with _patch_client(collector) as mock_api_instance, \
+             patch("asyncio.get_running_loop") as mock_get_loop:
 
             mock_loop = AsyncMock()
             mock_get_loop.return_value = mock_loop
 
-            mock_api_instance = MagicMock()
             mock_api_instance.fetch.return_value = mock_transcript
-            mock_api.return_value = mock_api_instance
 
             await collector._fetch_transcript(mock_video, "en")
 
-            # Verify that run_in_executor was called
+            # Verify that run_in_executor was called on the collector's pool
             assert mock_loop.run_in_executor.called
+            assert mock_loop.run_in_executor.call_args[0][0] is collector._executor
 
     @pytest.mark.asyncio
     async def test_fetch_transcript_different_video_ids(self, collector):
@@ -347,20 +469,73 @@ class TestFetchTranscript:
             {"id": "video3", "title": "Video 3", "channel_title": "Channel 3"},
         ]
 
-        mock_transcript = MagicMock()
-        mock_snippet = Mock(text="Sample transcript")
-        mock_transcript.snippets = [mock_snippet]
+        mock_transcript = _make_transcript("Sample transcript")
 
-        with patch("src.collectors.youtube.YouTubeTranscriptApi") as mock_api:
-            mock_api_instance = MagicMock()
+        with _patch_client(collector) as mock_api_instance:
             mock_api_instance.fetch.return_value = mock_transcript
-            mock_api.return_value = mock_api_instance
 
             for video in videos:
                 result = await collector._fetch_transcript(video, "en")
                 assert result == "Sample transcript"
                 # Verify each video ID was passed correctly
-                mock_api_instance.fetch.assert_called_with(video["id"])
+                mock_api_instance.fetch.assert_called_with(video["id"], languages=["en"])
+
+    @pytest.mark.asyncio
+    async def test_fetch_transcript_uses_cache(self, collector, make_collector, mock_video):
+        """Test that a fetched transcript is served from the cache afterwards."""
+        mock_transcript = _make_transcript("Cached transcript")
+
+        with _patch_client(collector) as mock_api_instance:
+            mock_api_instance.fetch.return_value = mock_transcript
+
+            first = await collector._fetch_transcript(mock_video, "en")
+            second = await collector._fetch_transcript(mock_video, "en")
+
+            assert first == second == "Cached transcript"
+            assert mock_api_instance.fetch.call_count == 1
+
+        # Another collector (e.g. the next run) reads the same cache directory
+        assert make_collector().transcript_cache.get("test_video_id", "en") == "Cached transcript"
+
+    @pytest.mark.asyncio
+    async def test_fetch_transcript_unavailable_cached(self, collector, mock_video):
+        """Test that a video without a transcript is not re-fetched."""
+        with _patch_client(collector) as mock_api_instance:
+            mock_api_instance.fetch.side_effect = TranscriptsDisabled("test_video_id")
+
+            assert await collector._fetch_transcript(mock_video, "en") is None
+            assert await collector._fetch_transcript(mock_video, "en") is None
+
+            assert mock_api_instance.fetch.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_fetch_transcript_concurrent_duplicates_coalesced(self, collector, mock_video):
+        """Test that concurrent requests for one video share a single fetch."""
+        def slow_fetch(video_id, languages):
+            time.sleep(0.1)
+            return _make_transcript("Shared transcript")
+
+        with _patch_client(collector) as mock_api_instance:
+            mock_api_instance.fetch.side_effect = slow_fetch
+
+            results = await asyncio.gather(
+                collector._fetch_transcript(mock_video, "en"),
+                collector._fetch_transcript(mock_video, "en"),
+            )
+
+            assert results == ["Shared transcript", "Shared transcript"]
+            assert mock_api_instance.fetch.call_count == 1
+            assert collector._inflight == {}
+
+    @pytest.mark.asyncio
+    async def test_fetch_transcript_failure_not_cached(self, collector, mock_video):
+        """Test that failed fetches are retried rather than cached."""
+        with _patch_client(collector) as mock_api_instance:
+            mock_api_instance.fetch.side_effect = Exception("Unexpected error")
+
+            assert await collector._fetch_transcript(mock_video, "en") is None
+            assert await collector._fetch_transcript(mock_video, "en") is None
+            assert mock_api_instance.fetch.call_count == 2
 
     @pytest.mark.asyncio
     @pytest.mark.integration
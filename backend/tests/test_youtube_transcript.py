@@ -1,20 +1,39 @@
+"""
+Integration test: fetch a real transcript through the Webshare proxy.
+
+Skipped unless WEBSHARE_PROXY_USERNAME and WEBSHARE_PROXY_PASSWORD are set.
+"""
+from os import getenv
+
+import pytest
 from youtube_transcript_api import YouTubeTranscriptApi
 from youtube_transcript_api.proxies import WebshareProxyConfig
-from os import getenv
+
+pytestmark = pytest.mark.integration
 
 video_id = "xIFkrVU5Krk"
 
-try:
-    ytt_api = YouTubeTranscriptApi(
+
+@pytest.fixture(scope="module")
+def ytt_api():
+    """Create one proxied transcript client for the module."""
+    username = getenv("WEBSHARE_PROXY_USERNAME")
+    password = getenv("WEBSHARE_PROXY_PASSWORD")
+    if not (username and password):
+        pytest.skip("Webshare proxy credentials not configured")
+
+    # all requests done by ytt_api will now be proxied through Webshare
+    return YouTubeTranscriptApi(
         proxy_config=WebshareProxyConfig(
-            proxy_username=getenv("WEBSHARE_PROXY_USERNAME"),
-            proxy_password=getenv("WEBSHARE_PROXY_PASSWORD"),
+            proxy_username=username,
+            proxy_password=password,
         )
     )
 
-    # all requests done by ytt_api will now be proxied through Webshare
+
+def test_fetch_real_transcript(ytt_api):
+    """Fetch a known video's transcript through the proxy."""
     transcript = ytt_api.fetch(video_id)
-    print(transcript)
-except Exception as e:
-    print(f"Error fetching transcript: {e}")
 
+    assert transcript.snippets
+    assert any(snippet.text for snippet in transcript.snippets)